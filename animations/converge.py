@@ -1,5 +1,7 @@
 import pygame
 
+from animations.keyframe_cache import KEYFRAMES
+
 # CONSTANTS
 ANIMATION_DURATION = 1500  # ms, duration of the convergence animation
 DISPLACEMENT_DISTANCE = 25  # Distance away from the spawn location that slices will spawn in
@@ -9,6 +11,8 @@ class ConvergenceAnimations:
     """
     A class to animate the convergence of sprite slices into the final image.
     The slices start in a displaced and shrunken state and converge to form the full image over 2 seconds.
+    At the start of a wave every entity converges at once, so the scaled slices of every tick are shared through
+    KEYFRAMES.
     """
 
     def __init__(self, game, sprite, explode_direction=("horizontal", 0)):
@@ -23,7 +27,7 @@ class ConvergenceAnimations:
         self.game = game
         self.sprite = sprite
         self.explode_direction = explode_direction  # [direction, mirror flag]
-        self.start_time = pygame.time.get_ticks()  # Start time of the animation
+        self.start_time = self.game.sim_clock.get_ticks()  # Start time of the animation
         self.duration = ANIMATION_DURATION
 
         # Start as transparent and end with full opacity
@@ -32,9 +36,6 @@ class ConvergenceAnimations:
 
         self.displacement = DISPLACEMENT_DISTANCE
 
-        self.vertical_slices = []
-        self.horizontal_slices = []
-
         # The position of the sprite
         self.pos_x = self.sprite.pos[0]
         self.pos_y = self.sprite.pos[1]
@@ -42,24 +43,12 @@ class ConvergenceAnimations:
         self.slice_count = SLICE_COUNT
         self.center_index = self.slice_count // 2  # calculate the center of the convergence based on the slice_count
 
-        # Split the image into slices
-        img_width, img_height = sprite.image.get_size()
-        slice_width = img_width // self.slice_count
-        slice_height = img_height // self.slice_count
-
-        for i in range(self.slice_count):
-            # vertical slices
-            width = img_width - (i * slice_width) if i == self.slice_count - 1 else slice_width
-            rect = pygame.Rect(i * slice_width, 0, width, img_height)
-            surf = sprite.image.subsurface(rect).copy()
-            self.vertical_slices.append({"surf": surf, "rect": rect.copy(), "dir": "h", "index": i})
-
-        for i in range(self.slice_count):
-            # horizontal slices
-            height = img_height - (i * slice_height) if i == self.slice_count - 1 else slice_height
-            rect = pygame.Rect(0, i * slice_height, img_width, height)
-            surf = sprite.image.subsurface(rect).copy()
-            self.horizontal_slices.append({"surf": surf, "rect": rect.copy(), "dir": "v", "index": i})
+        # Split the image into slices, shared with every other animation of the same image
+        self.image = sprite.image
+        self.vertical_slices, self.horizontal_slices = KEYFRAMES.get_slices(self.image, self.slice_count)
+
+        # The hero converges from every direction
+        self.is_hero = getattr(self.sprite, "e_type", None) == "hero"
 
         self.finished = False
 
@@ -69,18 +58,43 @@ class ConvergenceAnimations:
         Slices are drawn such that they move from a displaced, shrunken state to their proper position and full size.
         If the sprite's e_type is "hero", slices from both vertical and horizontal splits are animated.
         """
-        now = pygame.time.get_ticks()
+        now = self.game.sim_clock.get_ticks()
         elapsed = now - self.start_time
         # Normalized time (0 to 1) over the duration.
         t = min(elapsed / self.duration, 1.0)
+
+        self.finished = t >= 1.0
+
+        # Update the on-screen position of the sprite
+        # This is mostly used for the hero respawn because the hero can move while invulnerable
+        self.pos_x = self.sprite.pos[0]
+        self.pos_y = self.sprite.pos[1]
+
+        # the keyframes are built for whole sim_clock ticks, so animations that started on different ticks share them
+        tick = round(elapsed / self.game.sim_clock.tick_ms)
+        key = (self.image, "converge", self.explode_direction[0], self.explode_direction[1], self.is_hero, tick)
+        blits = KEYFRAMES.get(key)
+        if blits is None:
+            tick_t = min(tick * self.game.sim_clock.tick_ms / self.duration, 1.0)
+            blits = KEYFRAMES.add(key, self.build_keyframe(tick_t))
+
+        for surf, (offset_x, offset_y) in blits:
+            self.game.display.blit(surf, (self.pos_x + offset_x, self.pos_y + offset_y))
+
+    def build_keyframe(self, t):
+        """
+        Scale, fade and displace the slices for the given point of the animation.
+
+        :param float t: 0 to 1, how far the animation is
+        :return: list of (surface, (x offset, y offset)) blits relative to the sprite position
+        """
         # For convergence, we want the displacement to decrease over time:
         # At t = 0, rev_t is 1 (full displacement) and at t = 1, rev_t is 0.
         rev_t = 1 - t
-
-        self.finished = t >= 1.0
+        blits = []
 
         # If the sprite is a hero, animate slices from all directions
-        if getattr(self.sprite, "e_type", None) == "hero":
+        if self.is_hero:
             slice_lists = [self.vertical_slices, self.horizontal_slices]
         else:
             # else the direction is picked at random by the entity itself
@@ -93,51 +107,49 @@ class ConvergenceAnimations:
 
         for slice_list in slice_lists:
             for s in slice_list:
-                # Update the on-screen position of the sprite
-                # This is mostly used for the hero respawn because the hero can move while invulnerable
-                self.pos_x = self.sprite.pos[0]
-                self.pos_y = self.sprite.pos[1]
-
                 surf = s["surf"]
                 rect = s["rect"]
                 # Reverse the alpha transition: low alpha at start, full alpha at finish.
                 alpha = int(self.alpha_start * t + self.alpha_end * rev_t)
-                surf.set_alpha(alpha)
 
                 # Calculate a displacement scale based on distance from the center slice.
                 distance_from_center = abs(s["index"] - self.center_index)
                 displace_scale = 1 + distance_from_center
 
                 # Animate convergence based on the type of slice
-                if self.explode_direction[0] == "horizontal" or getattr(self.sprite, "e_type", None) == "hero":
+                if self.explode_direction[0] == "horizontal" or self.is_hero:
                     # For vertical slices (s["dir"] == "h"), converge horizontally.
                     if s["dir"] == "h":
                         new_width = max(1, int(rect.width * t))
                         new_surf = pygame.transform.scale(surf, (new_width, rect.height))
+                        new_surf.set_alpha(alpha)
                         shift = int(self.displacement * displace_scale * rev_t)
                         # Slices converge from left and right
-                        self.game.display.blit(new_surf, (rect.x + self.pos_x - shift, rect.y + self.pos_y))
-                        self.game.display.blit(new_surf, (rect.x + self.pos_x + shift, rect.y + self.pos_y))
-                if self.explode_direction[0] == "vertical" or getattr(self.sprite, "e_type", None) == "hero":
+                        blits.append((new_surf, (rect.x - shift, rect.y)))
+                        blits.append((new_surf, (rect.x + shift, rect.y)))
+                if self.explode_direction[0] == "vertical" or self.is_hero:
                     # For horizontal slices (s["dir"] == "v"), converge vertically.
                     if s["dir"] == "v":
                         new_height = max(1, int(rect.height * t))
                         new_surf = pygame.transform.scale(surf, (rect.width, new_height))
+                        new_surf.set_alpha(alpha)
                         shift = int(self.displacement * displace_scale * rev_t)
                         # Slices converge from above and below
-                        self.game.display.blit(new_surf, (rect.x + self.pos_x, rect.y + self.pos_y - shift))
-                        self.game.display.blit(new_surf, (rect.x + self.pos_x, rect.y + self.pos_y + shift))
-                if self.explode_direction[0] == "diagonal" or getattr(self.sprite, "e_type", None) == "hero":
+                        blits.append((new_surf, (rect.x, rect.y - shift)))
+                        blits.append((new_surf, (rect.x, rect.y + shift)))
+                if self.explode_direction[0] == "diagonal" or self.is_hero:
                     # For diagonal convergence, apply diagonal movement to horizontal slices
                     if s["dir"] == "v":
                         new_width = max(1, int(rect.width * t))
                         new_height = max(1, int(rect.height * t))
                         new_surf = pygame.transform.scale(surf, (new_width, new_height))
+                        new_surf.set_alpha(alpha)
                         shift = int(self.displacement * displace_scale * rev_t)
                         # Convergence diagonally: slices move toward their proper positions.
-                        self.game.display.blit(new_surf, (rect.x + self.pos_x - shift, rect.y + self.pos_y - shift))
-                        self.game.display.blit(new_surf, (rect.x + self.pos_x + shift, rect.y + self.pos_y + shift))
+                        blits.append((new_surf, (rect.x - shift, rect.y - shift)))
+                        blits.append((new_surf, (rect.x + shift, rect.y + shift)))
                         # If mirroring is True, also converge from the opposite diagonal.
                         if self.explode_direction[1]:
-                            self.game.display.blit(new_surf, (rect.x + self.pos_x + shift, rect.y + self.pos_y - shift))
-                            self.game.display.blit(new_surf, (rect.x + self.pos_x - shift, rect.y + self.pos_y + shift))
\ No newline at end of file
+                            blits.append((new_surf, (rect.x + shift, rect.y - shift)))
+                            blits.append((new_surf, (rect.x - shift, rect.y + shift)))
+        return blits
@@ -1,5 +1,7 @@
 import pygame
 
+from animations.keyframe_cache import KEYFRAMES
+
 # CONSTANTS
 ANIMATION_DURATION = 1000 # ms, total duration of the explode animation
 DISPLACEMENT_SPEED = 25  # the speed of the displaced slices during the animation
@@ -8,59 +10,55 @@ SLICE_COUNT = 5  # The number of slices to explode into, for each respective dir
 class ExplodeAnimations:
     """
     Animate sprite explosions by splitting an image into slices and animating their expansion
-    based on the specified direction and mirroring.
+    based on the specified direction and mirroring. The scaled slices of every tick are shared through KEYFRAMES.
     """
     def __init__(self, game, sprite, explode_logic=("horizontal", False)):
         self.game = game
         self.sprite = sprite
         self.explode_logic = explode_logic  # [direction, mirror flag]
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = self.game.sim_clock.get_ticks()
         self.duration = ANIMATION_DURATION
         self.finished = False
         self.displacement = DISPLACEMENT_SPEED
         self.alpha_start = 255  # The initial opacity value of the slices (fully opaque)
         self.alpha_end = 0  # The final opacity value of the slices (fully transparent)
 
-        self.vertical_slices = []  # List of dictionaries representing the vertical slices of the sprite
-        self.horizontal_slices = []  # List of dictionaries representing the horizontal slices of the sprite
-
         self.pos_x = self.sprite.pos[0]
         self.pos_y = self.sprite.pos[1]
 
         self.slice_count = SLICE_COUNT
         self.center_index = self.slice_count // 2  # The index of the center slice, used for calculating movement speeds
 
-        img_width, img_height = sprite.image.get_size()
-        slice_width = img_width // self.slice_count
-        slice_height = img_height // self.slice_count
-
-        for i in range(self.slice_count):
-            # vertical slices
-            if i == self.slice_count - 1:
-                # if i is the the last index piece, take the remaining width of the image
-                width = img_width - (i * slice_width)
-            else:
-                width = slice_width
-            rect = pygame.Rect(i * slice_width, 0, width, img_height)
-            surf = sprite.image.subsurface(rect).copy()
-            self.vertical_slices.append({"surf": surf, "rect": rect.copy(), "dir": "h", "index": i})
-
-        for i in range(self.slice_count):
-            # horizontal slices
-            if i == self.slice_count - 1:
-                height = img_height - (i * slice_height)
-            else:
-                height = slice_height
-            rect = pygame.Rect(0, i * slice_height, img_width, height)
-            surf = sprite.image.subsurface(rect).copy()
-            self.horizontal_slices.append({"surf": surf, "rect": rect.copy(), "dir": "v", "index": i})
+        # the image at the time of death, the vertical and horizontal slices of it are shared with other explosions
+        self.image = sprite.image
+        self.vertical_slices, self.horizontal_slices = KEYFRAMES.get_slices(self.image, self.slice_count)
 
     def animate_slices(self):
-        now = pygame.time.get_ticks()
+        now = self.game.sim_clock.get_ticks()
         elapsed = now - self.start_time
         t = min(elapsed / self.duration, 1.0)
         self.finished = t >= 1.0  # finished flag if time is > 1 second
 
+        # the keyframes are built for whole sim_clock ticks, so explosions that started on different ticks share them
+        tick = round(elapsed / self.game.sim_clock.tick_ms)
+        key = (self.image, "explode", self.explode_logic[0], self.explode_logic[1], tick)
+        blits = KEYFRAMES.get(key)
+        if blits is None:
+            tick_t = min(tick * self.game.sim_clock.tick_ms / self.duration, 1.0)
+            blits = KEYFRAMES.add(key, self.build_keyframe(tick_t))
+
+        for surf, (offset_x, offset_y) in blits:
+            self.game.display.blit(surf, (self.pos_x + offset_x, self.pos_y + offset_y))
+
+    def build_keyframe(self, t):
+        """
+        Scale, fade and displace the slices for the given point of the animation.
+
+        :param float t: 0 to 1, how far the animation is
+        :return: list of (surface, (x offset, y offset)) blits relative to the sprite position
+        """
+        blits = []
+
         # Determine which slices to animate based on the explode_direction
         if self.explode_logic[0] == "horizontal":
             slice_lists = [self.vertical_slices]
@@ -76,7 +74,6 @@ class ExplodeAnimations:
                 rect = s["rect"]
                 # Calculate the opacity value based on elapsed time
                 alpha = int(self.alpha_start * (1 - t) + self.alpha_end * t)
-                surf.set_alpha(alpha)
 
                 # Slices further away from the center should move faster than the center slice
                 distance_from_center = abs(s["index"] - self.center_index)
@@ -86,35 +83,38 @@ class ExplodeAnimations:
                     # Shrink width, move left/right
                     new_width = max(1, int(rect.width * (1 - t)))
                     new_surf = pygame.transform.scale(surf, (new_width, rect.height))
+                    new_surf.set_alpha(alpha)
                     shift = int(self.displacement * displace_scale * t)
 
-                    # rect.x is the new position of the image slice
-                    # self.pox_x is the original position of the entity, necessary to place the splices in the correct position
+                    # rect.x is the new position of the image slice, relative to the position of the entity
                     # shift is the displacement rate. Slices further away from center move at a faster rate
-                    self.game.display.blit(new_surf, (rect.x + self.pos_x - shift, rect.y + self.pos_y))
-                    self.game.display.blit(new_surf, (rect.x + self.pos_x + shift, rect.y + self.pos_y))
+                    blits.append((new_surf, (rect.x - shift, rect.y)))
+                    blits.append((new_surf, (rect.x + shift, rect.y)))
 
                 elif self.explode_logic[0] == "vertical" and s["dir"] == "v":
                     # Shrink height, move up/down
                     new_height = max(1, int(rect.height * (1 - t)))
                     new_surf = pygame.transform.scale(surf, (rect.width, new_height))
+                    new_surf.set_alpha(alpha)
                     shift = int(self.displacement * displace_scale * t)
 
-                    self.game.display.blit(new_surf, (rect.x + self.pos_x, rect.y + self.pos_y - shift))
-                    self.game.display.blit(new_surf, (rect.x + self.pos_x, rect.y + self.pos_y + shift))
+                    blits.append((new_surf, (rect.x, rect.y - shift)))
+                    blits.append((new_surf, (rect.x, rect.y + shift)))
 
                 elif self.explode_logic[0] == "diagonal" and s["dir"] == "v":
                     # Shrink both, move diagonally
                     new_height = max(1, int(rect.height * (1 - t)))
                     new_width = max(1, int(rect.width * (1 - t)))
                     new_surf = pygame.transform.scale(surf, (new_width, new_height))
+                    new_surf.set_alpha(alpha)
                     shift = int(self.displacement * displace_scale * t)
 
                     # Mirrored diagonal
                     if self.explode_logic[1]:
-                        self.game.display.blit(new_surf, (rect.x + self.pos_x + shift, rect.y + self.pos_y - shift))
-                        self.game.display.blit(new_surf, (rect.x + self.pos_x - shift, rect.y + self.pos_y + shift))
+                        blits.append((new_surf, (rect.x + shift, rect.y - shift)))
+                        blits.append((new_surf, (rect.x - shift, rect.y + shift)))
                     # Normal diagonal
                     else:
-                        self.game.display.blit(new_surf, (rect.x + self.pos_x - shift, rect.y + self.pos_y - shift))
-                        self.game.display.blit(new_surf, (rect.x + self.pos_x + shift, rect.y + self.pos_y + shift))
\ No newline at end of file
+                        blits.append((new_surf, (rect.x - shift, rect.y - shift)))
+                        blits.append((new_surf, (rect.x + shift, rect.y + shift)))
+        return blits
@@ -6,26 +6,34 @@ class FloatingAnimations:
     """
     def __init__(self, game):
         self.game = game
+        self.last_ticks = {}  # id(data_dict): the sim_clock tick of the previous float_anim() call for that dict
 
     def float_anim(self, data_dict):
         """
         Float the surface at the given position for the given amount of time.
         If the time_to_display == 0, remove it from the dictionary. Return the modified data_dict.
+        The countdown follows the game's sim_clock, so the animation runs at the same speed at any render rate.
 
         :param data_dict: [surface, position, time_to_display]
         :return: dict
         """
+        # number of ticks simulated since the last call, 0 if the game logic did not step in between
+        now = self.game.sim_clock.ticks
+        elapsed = now - self.last_ticks.get(id(data_dict), now - 1)
+        self.last_ticks[id(data_dict)] = now
+
         # use copy.copy() to safely alter the dictionary while iterating through it
         data_dict_copy = copy.copy(data_dict)
 
         for key in data_dict_copy:
             if data_dict_copy[key][2] > 0:
                 self.game.display.blit(data_dict_copy[key][0], (data_dict_copy[key][1]))
-                data_dict_copy[key][2] -= 1  # reduce the display countdown
+                steps = min(elapsed, data_dict_copy[key][2])
+                data_dict_copy[key][2] -= steps  # reduce the display countdown
                 # float ominously
-                data_dict_copy[key][1][0] -= .1
-                data_dict_copy[key][1][1] -= .1
+                data_dict_copy[key][1][0] -= .1 * steps
+                data_dict_copy[key][1][1] -= .1 * steps
             if data_dict[key][2] == 0:
                 # Remove from the dictionary once the timer has run out
                 del data_dict[key]
-        return data_dict
\ No newline at end of file
+        return data_dict
@@ -0,0 +1,76 @@
+import pygame
+
+# CONSTANTS
+MAX_KEYFRAMES = 4096  # keyframes kept across all of the animations, the oldest one is dropped first
+
+
+class KeyframeCache:
+    """
+    Process-wide cache of the slices and pre-scaled, pre-alpha'd frames of the explode, converge and shrink animations.
+
+    Every grunt that explodes with the same image and direction draws exactly the same slices on the same tick of its
+    animation, only at a different position. The first animation to reach a tick builds the keyframe, a list of
+    (surface, (x offset, y offset)) blits relative to the sprite position, and every other animation reuses it.
+    """
+
+    def __init__(self, max_keyframes=MAX_KEYFRAMES):
+        self.max_keyframes = max_keyframes
+        self.slices = {}  # (image, slice_count): (vertical slices, horizontal slices)
+        self.keyframes = {}  # (image, animation, ..., tick): list of (surface, offset) blits
+
+    def get_slices(self, image, slice_count):
+        """
+        Split an image into vertical and horizontal slices. The slices are shared, don't modify them.
+
+        :param image: pygame.Surface to split
+        :param int slice_count: Number of slices in each direction
+        :return: (vertical slices, horizontal slices), lists of {"surf", "rect", "dir", "index"} dictionaries
+        """
+        key = (image, slice_count)
+        slices = self.slices.get(key)
+        if slices is not None:
+            return slices
+
+        vertical_slices = []
+        horizontal_slices = []
+        img_width, img_height = image.get_size()
+        slice_width = img_width // slice_count
+        slice_height = img_height // slice_count
+
+        for i in range(slice_count):
+            # vertical slices, the last one takes the remaining width of the image
+            width = img_width - (i * slice_width) if i == slice_count - 1 else slice_width
+            rect = pygame.Rect(i * slice_width, 0, width, img_height)
+            vertical_slices.append({"surf": image.subsurface(rect).copy(), "rect": rect, "dir": "h", "index": i})
+
+        for i in range(slice_count):
+            # horizontal slices
+            height = img_height - (i * slice_height) if i == slice_count - 1 else slice_height
+            rect = pygame.Rect(0, i * slice_height, img_width, height)
+            horizontal_slices.append({"surf": image.subsurface(rect).copy(), "rect": rect, "dir": "v", "index": i})
+
+        slices = self.slices[key] = (vertical_slices, horizontal_slices)
+        return slices
+
+    def get(self, key):
+        """
+        :param key: (image, animation name, anything else the frame depends on, like the direction, tick)
+        :return: list of (surface, offset) blits, or None if the keyframe hasn't been built yet
+        """
+        return self.keyframes.get(key)
+
+    def add(self, key, blits):
+        """
+        Store a keyframe built by an animation.
+
+        :param key: see get()
+        :param blits: list of (surface, (x offset, y offset)) relative to the sprite position
+        :return: the blits
+        """
+        if len(self.keyframes) >= self.max_keyframes:
+            del self.keyframes[next(iter(self.keyframes))]
+        self.keyframes[key] = blits
+        return blits
+
+
+KEYFRAMES = KeyframeCache()
@@ -1,5 +1,7 @@
 import pygame
 
+from animations.keyframe_cache import KEYFRAMES
+
 # CONSTANTS
 SHRINK_DURATION = 1000 # ms, duration of the shrink animation
 
@@ -19,24 +21,32 @@ class ShrinkAnimations:
         self.pos_y = self.sprite.pos[1]
 
         self.orig_size = self.surf.get_size() # get the original size of the image
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = self.game.sim_clock.get_ticks()
         self.duration = SHRINK_DURATION
         self.finished = False
 
     def shrink(self):
         """
         Continually shrink the surface over a period of time.
+        The shrunken surface of every tick is shared with the other shrinking sprites through KEYFRAMES.
 
         :return: None
         """
-        now = pygame.time.get_ticks()
+        now = self.game.sim_clock.get_ticks()
         elapsed = now - self.start_time
         # Normalized time (0 to 1) over the duration.
         t = min(elapsed / self.duration, 1.0)
-        scaler = t * 100  # scale up the time from 0 to 100, for the percentage value
 
         self.finished = t >= 1.0
 
-        shrink_ratio = (100-scaler)/100  # turn the time into a decimal
-        surf = pygame.transform.scale(self.surf, (shrink_ratio*self.orig_size[0], shrink_ratio*self.orig_size[1]))
-        self.game.display.blit(surf, (self.pos_x, self.pos_y))
\ No newline at end of file
+        tick = round(elapsed / self.game.sim_clock.tick_ms)
+        key = (self.surf, "shrink", tick)
+        blits = KEYFRAMES.get(key)
+        if blits is None:
+            scaler = min(tick * self.game.sim_clock.tick_ms / self.duration, 1.0) * 100  # percentage of the time
+            shrink_ratio = (100-scaler)/100  # turn the time into a decimal
+            surf = pygame.transform.scale(self.surf, (shrink_ratio*self.orig_size[0], shrink_ratio*self.orig_size[1]))
+            blits = KEYFRAMES.add(key, [(surf, (0, 0))])
+
+        for surf, (offset_x, offset_y) in blits:
+            self.game.display.blit(surf, (self.pos_x + offset_x, self.pos_y + offset_y))
\ No newline at end of file
@@ -1,20 +1,19 @@
 import pygame
-import random
 import copy
 
 # CONSTANTS
-# !!! WARNING !!!!
-# Changing the transition animation will require changing the transition timers in the main game loop
 SQUARE_DURATION = 1000  # milliseconds, how long it takes for a square to get to the edge
 TOTAL_DURATION = 1000  # milliseconds, how long until the final square will be drawn which ends the animation
 SQUARE_SPACING = 0.04  # controls new squares being drawn
+SCREEN_COVERED_TIME = 500  # milliseconds, once the squares cover the screen the next wave can spawn underneath them
 # SQUARE_SPACING is dictated by the ratio of drawn to total width. Smaller number = more squares
 
 class TransitionBase:
-    def __init__(self, center, width, height, color, start_time, duration):
+    def __init__(self, game, center, width, height, color, start_time, duration):
         """
         Initializes a Square object that will expand over time.
 
+        :param game: Game object, its fx_rng picks anything random about the square
         :param center: The center of the game display
         :param width: Width of the game display
         :param height: Height of the game display
@@ -22,6 +21,7 @@ class TransitionBase:
         :param start_time: Milliseconds, when the square animation starts
         :param duration: Milliseconds, time for the square to start to when it reaches it's full size
         """
+        self.game = game
         self.center = center
         self.width = width
         self.height = height
@@ -67,8 +67,8 @@ class TransitionBase:
         pygame.draw.rect(surface, (255, 255, 255), rect)
 
 class CenterSquare(TransitionBase):
-    def __init__(self, center, width, height, color, start_time, duration):
-        super().__init__(center, width, height, color, start_time, duration)
+    def __init__(self, game, center, width, height, color, start_time, duration):
+        super().__init__(game, center, width, height, color, start_time, duration)
 
     def draw(self, surface):
         # determine the size of the square by expanding over a period of time to the full width/height
@@ -84,8 +84,8 @@ class CenterSquare(TransitionBase):
         pygame.draw.rect(surface, (255, 255, 255), rect)
 
 class VerticalSquare(TransitionBase):
-    def __init__(self, center, width, height, color, start_time, duration):
-        super().__init__(center, width, height, color, start_time, duration)
+    def __init__(self, game, center, width, height, color, start_time, duration):
+        super().__init__(game, center, width, height, color, start_time, duration)
 
     def draw(self, surface):
         # determine the size of the square by expanding over a period of time to the full width/height
@@ -101,8 +101,8 @@ class VerticalSquare(TransitionBase):
         pygame.draw.rect(surface, (255, 255, 255), rect)
 
 class HorizontalSquare(TransitionBase):
-    def __init__(self, center, width, height, color, start_time, duration):
-        super().__init__(center, width, height, color, start_time, duration)
+    def __init__(self, game, center, width, height, color, start_time, duration):
+        super().__init__(game, center, width, height, color, start_time, duration)
 
     def draw(self, surface):
         # determine the size of the square by expanding over a period of time to the full width/height
@@ -118,9 +118,9 @@ class HorizontalSquare(TransitionBase):
         pygame.draw.rect(surface, (255, 255, 255), rect)
 
 class LeftSquare(TransitionBase):
-    def __init__(self, center, width, height, color, start_time, duration):
-        super().__init__(center, width, height, color, start_time, duration)
-        self.side = random.choice(["left", "right"])
+    def __init__(self, game, center, width, height, color, start_time, duration):
+        super().__init__(game, center, width, height, color, start_time, duration)
+        self.side = self.game.fx_rng.choice(["left", "right"])
 
     def draw(self, surface):
         # determine the size of the square by expanding over a period of time to the full width/height
@@ -136,8 +136,8 @@ class LeftSquare(TransitionBase):
         pygame.draw.rect(surface, (255, 255, 255), rect)
 
 class RightSquare(TransitionBase):
-    def __init__(self, center, width, height, color, start_time, duration):
-        super().__init__(center, width, height, color, start_time, duration)
+    def __init__(self, game, center, width, height, color, start_time, duration):
+        super().__init__(game, center, width, height, color, start_time, duration)
 
     def draw(self, surface):
         # determine the size of the square by expanding over a period of time to the full width/height
@@ -153,8 +153,8 @@ class RightSquare(TransitionBase):
         pygame.draw.rect(surface, (255, 255, 255), rect)
 
 class TopSquare(TransitionBase):
-    def __init__(self, center, width, height, color, start_time, duration):
-        super().__init__(center, width, height, color, start_time, duration)
+    def __init__(self, game, center, width, height, color, start_time, duration):
+        super().__init__(game, center, width, height, color, start_time, duration)
 
     def draw(self, surface):
         # determine the size of the square by expanding over a period of time to the full width/height
@@ -170,8 +170,8 @@ class TopSquare(TransitionBase):
         pygame.draw.rect(surface, (255, 255, 255), rect)
 
 class BotSquare(TransitionBase):
-    def __init__(self, center, width, height, color, start_time, duration):
-        super().__init__(center, width, height, color, start_time, duration)
+    def __init__(self, game, center, width, height, color, start_time, duration):
+        super().__init__(game, center, width, height, color, start_time, duration)
 
     def draw(self, surface):
         # determine the size of the square by expanding over a period of time to the full width/height
@@ -207,8 +207,8 @@ class Transitions:
         if self.game.first_wave:
             self.square_type = CenterSquare
         else:
-            self.square_type = random.choice(TRANSITION_OPTIONS)
-        self.real_start = pygame.time.get_ticks()  # timer for the final square
+            self.square_type = self.game.fx_rng.choice(TRANSITION_OPTIONS)
+        self.real_start = self.game.sim_clock.get_ticks()  # timer for the final square
         self.square_dur = SQUARE_DURATION  # milliseconds, how long it takes for a square to get to the edge
         self.total_dur = TOTAL_DURATION  # milliseconds, how long until the final square will be drawn
         self.square_spacing = SQUARE_SPACING  # controls new squares being drawn,
@@ -224,6 +224,8 @@ class Transitions:
         self.first = True  # triggers the first square, which is generated outside the for loop
         self.last_done = False  # indicates that the last square has been created, stopping all further squares
         self.final_start = None  # the start time of the final square
+        self.final = None  # the final square, created once when the last square is done
+        self.final_t = 0  # Goes from 0 to 1, the size of the final square relative to its full size
         self.finished = False  # indicates that the last square has finished its animation, ending this class animation
 
         # Create a surface to draw our squares onto. This surface will then be blit onto the game.display
@@ -246,29 +248,31 @@ class Transitions:
             surf.fill((0, 0, 0, 0))
         return surf
 
-    def add_square(self):
+    def add_square(self, now):
         """
         Add a square to the stack.
         Each square will have a randomly generated color.
 
+        :param now: Time in milliseconds, when the square starts growing
         :return: None
         """
-        color = tuple(random.choices(range(256), k=3))
+        color = tuple(self.game.fx_rng.choices(range(256), k=3))
 
-        square = self.square_type(center=self.center,
+        square = self.square_type(game=self.game,
+                                  center=self.center,
                                   width=self.width,
                                   height=self.height,
                                   color=color,
-                                  start_time=pygame.time.get_ticks(),
+                                  start_time=now,
                                   duration=self.square_dur
                                   )
         self.squares_list.append(square)
 
     def normal_squares(self, now):
         """
-        Draw the squares transition using pygame.rect
+        Grow the squares of the transition, spawning new squares as the previous ones grow.
 
-        :param now: pygame.time.get_ticks()
+        :param now: game.sim_clock.get_ticks()
         :return: None
         """
         # use copy.copy() to safely edit lists in a loop
@@ -276,11 +280,10 @@ class Transitions:
         for square in square_copy:
 
             elapsed = square.update_ratio(now)  # update the ratio of the square
-            square.draw(self.transition_surf)
 
             # Add more squares based on how much the previous square has grown, until the last square has been drawn
             if square.square_spacing(self.square_spacing) and square.can_spawn_new and not self.last_done:
-                self.add_square()
+                self.add_square(now)
                 square.can_spawn_new = False
 
             # Keep the drawn squares on the screen for a period of time to allow the smaller squares to reach the edges
@@ -289,9 +292,9 @@ class Transitions:
 
     def final_square(self, now):
         """
-        Draw the final square animation, a transparent square that reveals the game.display surface state underneath.
+        Grow the final square, a transparent square that reveals the game.display surface state underneath.
 
-        :param now: pygame.time.ticks()
+        :param now: game.sim_clock.get_ticks()
         :return: None
         """
         total_elapsed = now - self.real_start
@@ -299,36 +302,49 @@ class Transitions:
 
         if self.last_done:
             if self.final_start is None:
-                self.final_start = pygame.time.get_ticks()
+                self.final_start = now
+                self.final = self.square_type(game=self.game,
+                                              center=self.center,
+                                              width=self.width,
+                                              height=self.height,
+                                              color=(255, 255, 255),
+                                              start_time=self.final_start,
+                                              duration=self.square_dur
+                                              )
             elapsed = now - self.final_start
-            final_t = min(elapsed / self.square_dur, 1)
-
-            self.square_type(center=self.center,
-                             width=self.width,
-                             height=self.height,
-                             color=(255, 255, 255),
-                             start_time=self.final_start,
-                             duration=self.square_dur
-                             ).draw_final(self.transition_surf, final_t)
-            self.transition_surf.set_colorkey((255, 255, 255))
+            self.final_t = min(elapsed / self.square_dur, 1)
 
             # signals to the game loop that the animation has completed
-            if final_t >= 1:
+            if self.final_t >= 1:
                 self.finished = True
 
-    def iterate(self):
+    def update(self):
         """
         Update the square dimensions based on the amount of time they have been active.
+        Nothing is drawn here, see draw().
 
         :return: None
         """
-        now = pygame.time.get_ticks()
+        now = self.game.sim_clock.get_ticks()
 
         # Add the initial square to the list to kick things off
         if self.first:
-            self.add_square()
+            self.add_square(now)
             self.first = False
         self.normal_squares(now)
         self.final_square(now)
 
+    def draw(self):
+        """
+        Draw the squares onto the transition surface, then blit it on top of the game.display.
+
+        :return: None
+        """
+        for square in self.squares_list:
+            square.draw(self.transition_surf)
+
+        if self.last_done:
+            self.final.draw_final(self.transition_surf, self.final_t)
+            self.transition_surf.set_colorkey((255, 255, 255))
+
         self.game.display.blit(self.transition_surf, (0, 0))
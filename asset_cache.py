@@ -0,0 +1,289 @@
+import argparse
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+# CONSTANTS
+BASE_DIR = Path(__file__).resolve().parent
+CACHE_PATH = BASE_DIR / "data" / "asset_cache.bin"
+CACHE_VERSION = 1  # bump if the file format changes
+MAGIC = b"RBTNASSET"
+HEADER = struct.Struct("<9sHI")  # magic, version, length of the json index
+IMAGE_SOURCES = ("data/images/**/*.png", "data/images/**/*.json")
+SOUND_SOURCES = ("data/audio/*.wav",)
+HASH_CHUNK_SIZE = 1 << 20  # bytes read at a time while hashing a source
+
+
+def hash_file(path):
+    """
+    Content hash of a source asset.
+
+    :param path: Path of the file
+    :return: hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def find_sources(known=None):
+    """
+    Find and hash every source asset compiled into the cache.
+
+    :param known: "stats" and "sources" of the index of an existing cache. Files with the same size and modification
+        time as when that cache was built are not hashed again.
+    :return: ({path relative to the repo: content hash}, {path relative to the repo: [size, modification time]}),
+        sorted by path
+    """
+    known_stats = known["stats"] if known else {}
+    known_sources = known["sources"] if known else {}
+    sources = {}
+    stats = {}
+    for pattern in IMAGE_SOURCES + SOUND_SOURCES:
+        for path in BASE_DIR.glob(pattern):
+            name = path.relative_to(BASE_DIR).as_posix()
+            stat = path.stat()
+            stats[name] = [stat.st_size, stat.st_mtime_ns]
+            if known_stats.get(name) == stats[name] and name in known_sources:
+                sources[name] = known_sources[name]
+            else:
+                sources[name] = hash_file(path)
+    return dict(sorted(sources.items())), dict(sorted(stats.items()))
+
+
+def decode_image(path):
+    """
+    Decode an image into RGBA bytes, the pygame.image.tobytes() format.
+
+    :param path: Path of the image
+    :return: ((width, height), bytes)
+    """
+    image = pygame.image.load(path)
+    if image.get_colorkey() is not None:
+        # the colorkey isn't part of the pixels, blit it onto a transparent surface to turn it into alpha
+        rgba = pygame.Surface(image.get_size(), pygame.SRCALPHA)
+        rgba.blit(image, (0, 0))
+        image = rgba
+    return image.get_size(), pygame.image.tobytes(image, "RGBA")
+
+
+class AssetCache:
+    """
+    Single file cache of the decoded game assets, so startup doesn't have to decode any PNG or WAV.
+
+    The cache holds the RGBA pixels of every image, the PCM samples of every sound in the format of the mixer and the
+    sprite sheet json files, behind a json index with the content hash of each source. It is memory-mapped when the
+    game starts and rebuilt first if a source was added, removed or changed, or the mixer format changed.
+
+    Anything missing from the cache is decoded from its source file as before, so the game runs without it.
+    Build it ahead of time with:
+        python -m asset_cache
+    """
+
+    def __init__(self, path=CACHE_PATH):
+        """
+        :param path: Path of the cache file
+        """
+        self.path = Path(path)
+        self.entries = {}  # source path: index entry
+        self.data = None  # memory map of the cache file
+        self.data_offset = 0  # position of the first blob in the file
+        self.opened = False
+        self.lock = threading.Lock()  # the sounds are loaded on a background thread, see Audio
+
+    def open(self):
+        """
+        Memory-map the cache, building it first if it is missing or stale.
+        Called by the first image(), sound() or json() lookup.
+
+        :return: None
+        """
+        self.opened = True
+        if sys.platform == "emscripten":
+            # the web build loads its assets from the browser, there is no disk to cache them on
+            return
+
+        mixer = pygame.mixer.get_init()
+        index = self.read_index()
+        sources, stats = find_sources(index)
+        # a cache built by a headless game has no sounds, it is rebuilt by the first game with audio
+        if index is None or index["sources"] != sources or (mixer and index["mixer"] != list(mixer)):
+            try:
+                self.build(sources, stats)
+            except (OSError, pygame.error) as e:
+                logger.warning(f"Could not build the asset cache {self.path}: {e}")
+                return
+            index = self.read_index()
+            if index is None:
+                return
+
+        with open(self.path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.entries = index["entries"]
+        self.data_offset = HEADER.size + index["length"]
+        logger.debug(f"Memory-mapped {len(self.entries)} assets from {self.path}")
+
+    def read_index(self):
+        """
+        Read the index at the start of the cache file.
+
+        :return: index dict, or None if there is no usable cache
+        """
+        try:
+            with open(self.path, "rb") as f:
+                magic, version, length = HEADER.unpack(f.read(HEADER.size))
+                if magic != MAGIC or version != CACHE_VERSION:
+                    return None
+                index = json.loads(f.read(length))
+        except (OSError, struct.error, ValueError):
+            return None
+        index["length"] = length
+        return index
+
+    def build(self, sources=None, stats=None):
+        """
+        Decode every source asset and write them to the cache file.
+        Sounds are only compiled when the mixer is initialized, they are stored in its sample format.
+
+        :param sources: Hashes from find_sources(), found again if None
+        :param stats: Stats from find_sources()
+        :return: None
+        """
+        if sources is None:
+            sources, stats = find_sources()
+        mixer = pygame.mixer.get_init()
+
+        entries = {}
+        blobs = []
+        offset = 0
+        for name in sources:
+            path = BASE_DIR / name
+            if name.endswith(".png"):
+                size, blob = decode_image(path)
+                entry = {"kind": "image", "size": size}
+            elif name.endswith(".json"):
+                blob = path.read_bytes()
+                entry = {"kind": "json"}
+            elif mixer:
+                blob = pygame.mixer.Sound(path).get_raw()
+                entry = {"kind": "sound"}
+            else:
+                continue
+            entry.update(offset=offset, length=len(blob))
+            entries[name] = entry
+            blobs.append(blob)
+            offset += len(blob)
+
+        index = json.dumps({"sources": sources, "stats": stats, "mixer": list(mixer) if mixer else None,
+                            "entries": entries})
+        index = index.encode()
+        # a temp file of its own next to the cache, so games building it at the same time don't write into each other
+        with tempfile.NamedTemporaryFile(dir=self.path.parent, prefix=self.path.name, suffix=".tmp",
+                                         delete=False) as f:
+            temp_path = f.name
+            try:
+                f.write(HEADER.pack(MAGIC, CACHE_VERSION, len(index)))
+                f.write(index)
+                for blob in blobs:
+                    f.write(blob)
+            except BaseException:
+                f.close()
+                os.remove(temp_path)
+                raise
+        # replace the old cache in one step, a game starting at the same time never sees half a file
+        try:
+            os.chmod(temp_path, 0o644)  # the temp file is only readable by its owner
+            os.replace(temp_path, self.path)
+        except OSError:
+            os.remove(temp_path)
+            raise
+        logger.info(f"Built the asset cache {self.path}: {len(entries)} assets, "
+                    f"{HEADER.size + len(index) + offset} bytes")
+
+    def lookup(self, path, kind):
+        """
+        Find the cached blob of a source asset.
+
+        :param path: Path of the source, relative to the working directory or absolute
+        :param str kind: "image", "sound" or "json"
+        :return: (index entry, memoryview of the blob), or (None, None) if it isn't cached
+        """
+        with self.lock:
+            if not self.opened:
+                self.open()
+        try:
+            name = Path(path).resolve().relative_to(BASE_DIR).as_posix()
+        except ValueError:
+            return None, None
+        entry = self.entries.get(name)
+        if entry is None or entry["kind"] != kind:
+            return None, None
+        start = self.data_offset + entry["offset"]
+        return entry, memoryview(self.data)[start:start + entry["length"]]
+
+    def image(self, path):
+        """
+        Load an image, same as pygame.image.load(). Colorkeys are turned into per-pixel alpha.
+
+        :param path: Path of the image
+        :return: pygame.Surface
+        """
+        entry, blob = self.lookup(path, "image")
+        if entry is None:
+            return pygame.image.load(path)
+        # frombuffer() doesn't copy, the surface reads straight from the memory map until it is converted
+        return pygame.image.frombuffer(blob, entry["size"], "RGBA")
+
+    def sound(self, path):
+        """
+        Load a sound, same as pygame.mixer.Sound(path).
+
+        :param path: Path of the sound
+        :return: pygame.mixer.Sound
+        """
+        entry, blob = self.lookup(path, "sound")
+        if entry is None:
+            return pygame.mixer.Sound(path)
+        return pygame.mixer.Sound(buffer=blob)
+
+    def json(self, path):
+        """
+        Load a json file.
+
+        :param path: Path of the json file
+        :return: Parsed json
+        """
+        entry, blob = self.lookup(path, "json")
+        if entry is None:
+            with open(path) as f:
+                return json.load(f)
+        return json.loads(bytes(blob))
+
+
+ASSETS = AssetCache()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile the game assets into the asset cache.")
+    parser.add_argument("--output", default=CACHE_PATH, help="path of the cache file")
+    parser.add_argument("--no-audio", action="store_true", help="leave the sounds out of the cache")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    pygame.init()
+    if not args.no_audio:
+        pygame.mixer.init()
+    AssetCache(args.output).build()
@@ -1,51 +1,195 @@
+import logging
 import sys
+import threading
+
 import pygame
 
+from asset_cache import ASSETS
+
+logger = logging.getLogger(__name__)
+
 # CONSTANTS
 DEFAULT_VOLUME = 0.5
 AUDIO_FILEPATH = "data/audio/"
+SOUND_NAMES = (
+    "enforcer_fire",
+    "grunt_walk",
+    "hero_death",
+    "hero_lazer",
+    "human_die",
+    "human_save",
+    "prog_transformation",
+    "quark_spawn",
+    "tank_explode",
+    "tank_projectile_bounce",
+)
+# long cues streamed from disk with pygame.mixer.music instead of being decoded into memory. Only one of them plays
+# at a time, they never overlap: level_transition plays between the waves and tank_fire during them.
+STREAMED_SOUND_NAMES = (
+    "level_transition",  # 5.9 seconds
+    "tank_fire",  # 24 seconds
+)
+VOICE_COUNT = 8  # mixer channels shared by all of the sound effects
+# sound name: (priority, max voices). When every channel is busy, a sound takes over the channel of a lower priority
+# one. A sound already playing on max voices restarts its oldest voice instead.
+SOUND_VOICES = {
+    "hero_death": (3, 1),
+    "human_save": (2, 1),
+    "human_die": (2, 1),
+    "prog_transformation": (2, 1),
+    "grunt_walk": (0, 1),
+    "tank_projectile_bounce": (0, 1),
+}
+DEFAULT_SOUND_VOICES = (1, 1)  # priority and max voices of the sounds not in SOUND_VOICES
 
 class Audio:
     """
     Handles the audio & sound effects for the game.
+
+    The sound effects are decoded on a background thread, so the first frame doesn't wait for them. Playing a sound
+    that isn't loaded yet does nothing. The long cues in STREAMED_SOUND_NAMES are streamed with pygame.mixer.music.
+
+    play() only queues the sound. flush() plays the queue once per frame, so a sound played by a hundred enemies
+    in the same frame starts a single voice, on a fixed pool of VOICE_COUNT channels. See SOUND_VOICES.
     """
 
-    def __init__(self):
+    def __init__(self, enabled=True):
+        """
+        :param bool enabled: If False the mixer is never initialized and every call is a no-op. Used by headless games.
+        """
+        self.sounds = {}  # sound name: pygame.mixer.Sound, filled in as the sounds are loaded
+        self.streamed = {}  # sound name: file path
+        self.streaming = None  # name of the streamed sound loaded into pygame.mixer.music
+        self.loader = None
+        self.queued = {}  # sound names played since the last flush(), in order
+        self.channels = []  # the voice pool
+        self.voices = []  # per channel: [sound name, start order] of the last sound played on it
+        self.started = 0  # number of voices started, orders the voices by age
+        if not enabled:
+            return
+
         pygame.mixer.init()
+        pygame.mixer.set_num_channels(VOICE_COUNT)
+        self.channels = [pygame.mixer.Channel(i) for i in range(VOICE_COUNT)]
+        self.voices = [[None, 0] for _ in range(VOICE_COUNT)]
 
         if sys.platform == "emscripten":
             extension = ".ogg"
         else:
             extension = ".wav"
 
-        self.sounds = {
-            "enforcer_fire": pygame.mixer.Sound(AUDIO_FILEPATH + "enforcer_fire" + extension),
-            "grunt_walk": pygame.mixer.Sound(AUDIO_FILEPATH + "grunt_walk" + extension),
-            "hero_death": pygame.mixer.Sound(AUDIO_FILEPATH + "hero_death" + extension),
-            "hero_lazer": pygame.mixer.Sound(AUDIO_FILEPATH + "hero_lazer" + extension),
-            "human_die": pygame.mixer.Sound(AUDIO_FILEPATH + "human_die" + extension),
-            "human_save": pygame.mixer.Sound(AUDIO_FILEPATH + "human_save" + extension),
-            "level_transition": pygame.mixer.Sound(AUDIO_FILEPATH + "level_transition" + extension),
-            "prog_transformation": pygame.mixer.Sound(AUDIO_FILEPATH + "prog_transformation" + extension),
-            "quark_spawn": pygame.mixer.Sound(AUDIO_FILEPATH + "quark_spawn" + extension),
-            "tank_explode": pygame.mixer.Sound(AUDIO_FILEPATH + "tank_explode" + extension),
-            "tank_fire": pygame.mixer.Sound(AUDIO_FILEPATH + "tank_fire" + extension),
-            "tank_projectile_bounce": pygame.mixer.Sound(AUDIO_FILEPATH + "tank_projectile_bounce" + extension)
-        }
-
-        # Set a default volume for all sounds
-        for sound in self.sounds.values():
-            sound.set_volume(DEFAULT_VOLUME)  
+        self.streamed = {name: AUDIO_FILEPATH + name + extension for name in STREAMED_SOUND_NAMES}
+        paths = {name: AUDIO_FILEPATH + name + extension for name in SOUND_NAMES}
+        if sys.platform == "emscripten":
+            # no threads in the browser
+            self.load_sounds(paths)
+        else:
+            self.loader = threading.Thread(target=self.load_sounds, args=(paths,), name="audio loader", daemon=True)
+            self.loader.start()
+
+    def load_sounds(self, paths):
+        """
+        Decode the sound effects, each one can be played as soon as it is loaded.
+
+        :param dict paths: {sound name: file path}
+        :return: None
+        """
+        for name, path in paths.items():
+            sound = ASSETS.sound(path)
+            sound.set_volume(DEFAULT_VOLUME)  # Set a default volume for all sounds
+            self.sounds[name] = sound
+        logger.debug(f"Loaded {len(self.sounds)} sounds")
+
+    def wait_until_loaded(self):
+        """
+        Block until every sound effect is loaded.
+
+        :return: None
+        """
+        if self.loader is not None:
+            self.loader.join()
+
+    def is_loaded(self, sound_name):
+        """
+        :param str sound_name: Name of the sound
+        :return: bool, True if the sound can be played
+        """
+        return sound_name in self.sounds or sound_name in self.streamed
 
     def play(self, sound_name):
-        if sound_name in self.sounds:
-            self.sounds[sound_name].stop() # Stop the sound if it's already playing
-            self.sounds[sound_name].play()
+        """
+        Queue a sound to be played by the next flush(). Playing the same sound again before then does nothing.
+
+        :param str sound_name: Name of the sound
+        :return: None
+        """
+        self.queued[sound_name] = None
+
+    def flush(self):
+        """
+        Play the sounds queued since the last flush(), the highest priority first. Called once per frame.
+
+        :return: None
+        """
+        if not self.queued:
+            return
+        queued = sorted(self.queued, key=lambda name: -SOUND_VOICES.get(name, DEFAULT_SOUND_VOICES)[0])
+        self.queued = {}
+        for sound_name in queued:
+            if sound_name in self.streamed:
+                if self.streaming != sound_name:
+                    pygame.mixer.music.load(self.streamed[sound_name])
+                    pygame.mixer.music.set_volume(DEFAULT_VOLUME)
+                    self.streaming = sound_name
+                pygame.mixer.music.play()  # restarts the sound if it's already playing
+                continue
+
+            sound = self.sounds.get(sound_name)
+            if sound is None:
+                continue
+            index = self.find_voice(sound_name)
+            if index is None:
+                continue
+            self.channels[index].play(sound)  # replaces whatever was playing on the channel
+            self.started += 1
+            self.voices[index] = [sound_name, self.started]
+
+    def find_voice(self, sound_name):
+        """
+        Pick the channel of the voice pool to play a sound on.
+
+        :param str sound_name: Name of the sound
+        :return: channel index, or None if every channel is busy with sounds of the same or a higher priority
+        """
+        priority, max_voices = SOUND_VOICES.get(sound_name, DEFAULT_SOUND_VOICES)
+        busy = [index for index, channel in enumerate(self.channels) if channel.get_busy()]
+        playing = [index for index in busy if self.voices[index][0] == sound_name]
+        if len(playing) >= max_voices:
+            # restart the oldest voice of the sound
+            return min(playing, key=lambda index: self.voices[index][1])
+        if len(busy) < len(self.channels):
+            return next(index for index, channel in enumerate(self.channels) if index not in busy)
+
+        # take over the oldest voice of the lowest priority sound
+        index = min(busy, key=lambda index: (SOUND_VOICES.get(self.voices[index][0], DEFAULT_SOUND_VOICES)[0],
+                                             self.voices[index][1]))
+        if SOUND_VOICES.get(self.voices[index][0], DEFAULT_SOUND_VOICES)[0] < priority:
+            return index
+        return None
 
     def stop(self, sound_name):
-        if sound_name in self.sounds:
-            self.sounds[sound_name].stop()
+        self.queued.pop(sound_name, None)
+        if sound_name in self.streamed:
+            if self.streaming == sound_name:
+                pygame.mixer.music.stop()
+            return
+        for channel, (name, _) in zip(self.channels, self.voices):
+            if name == sound_name:
+                channel.stop()
 
     def stop_all(self):
-        for sound in self.sounds.values():
-            sound.stop()
+        self.queued = {}
+        if self.streamed:
+            pygame.mixer.music.stop()
+        for channel in self.channels:
+            channel.stop()
@@ -0,0 +1,79 @@
+# CONSTANTS
+DEAD_ZONE = 4  # pixels, a target closer than this on an axis is straight ahead on that axis
+DANGER_DISTANCE = 60  # pixels, the kite policy backs away from robots closer than this
+HOLD_FIRE = [False, False, False, False]
+
+
+def towards(pos, target):
+    """
+    The [left, right, up, down] directions from a position to a target.
+
+    :param pos: (x, y) position to start from
+    :param target: (x, y) position to go to
+    :return: list of 4 bools
+    """
+    dx = target[0] - pos[0]
+    dy = target[1] - pos[1]
+    return [dx < -DEAD_ZONE, dx > DEAD_ZONE, dy < -DEAD_ZONE, dy > DEAD_ZONE]
+
+
+def closest(sprites, pos):
+    """
+    The sprite whose rect center is closest to a position.
+
+    :param sprites: Iterable of sprites
+    :param pos: (x, y) position
+    :return: the closest sprite, or None if there are no sprites
+    """
+    return min(sprites, default=None,
+               key=lambda sprite: (sprite.rect.centerx - pos[0]) ** 2 + (sprite.rect.centery - pos[1]) ** 2)
+
+
+def idle(game, rng):
+    """ Stand still and never fire. A lower bound for survival."""
+    return [False, False, False, False], HOLD_FIRE
+
+
+def random_walk(game, rng):
+    """ Press random directions and fire in random directions, like a toddler on the controls."""
+    return [rng.random() < 0.5 for _ in range(4)], [rng.random() < 0.5 for _ in range(4)]
+
+
+def turret(game, rng):
+    """ Stand still and fire at the closest robot."""
+    center = game.hero.rect.center
+    robot = closest(game.enemy_group.spritedict, center)
+    if robot is None:
+        return [False, False, False, False], HOLD_FIRE
+    return [False, False, False, False], towards(center, robot.rect.center)
+
+
+def kite(game, rng):
+    """
+    Fire at the closest robot and back away from it while it is too close,
+    otherwise go rescue the closest human.
+    """
+    center = game.hero.rect.center
+    robot = closest(game.enemy_group.spritedict, center)
+    shooting = HOLD_FIRE if robot is None else towards(center, robot.rect.center)
+
+    if robot is not None and (abs(robot.rect.centerx - center[0]) < DANGER_DISTANCE
+                              and abs(robot.rect.centery - center[1]) < DANGER_DISTANCE):
+        left, right, up, down = towards(center, robot.rect.center)
+        return [right, left, down, up], shooting
+
+    human = closest(game.family_group.spritedict, center)
+    if human is None:
+        return [False, False, False, False], shooting
+    return towards(center, human.rect.center), shooting
+
+
+# A policy is called once per tick as policy(game, rng) and returns the (hero_movement, hero_shooting) pair passed to
+# Game.step(), each a [left, right, up, down] list. rng is a random.Random seeded for the game. A policy must never draw
+# from game.rng, that would change the game it is playing.
+POLICIES = {
+    "idle": idle,
+    "random_walk": random_walk,
+    "turret": turret,
+    "kite": kite,
+}
@@ -0,0 +1,252 @@
+import argparse
+import csv
+import importlib
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from balance.policies import POLICIES
+from game import TICK_RATE, Game
+
+try:
+    import pandas as pd
+except ImportError:  # pandas is optional, only needed to write a Parquet report
+    pd = None
+
+logger = logging.getLogger(__name__)
+
+# CONSTANTS
+DEFAULT_OUTPUT = Path("balance_report.csv")
+GAMES_PER_WAVE = 100  # seeded games started at every wave
+MAX_WAVE_SECONDS = 180  # game time, a wave still going after this long is given up on
+JOBS_PER_WORKER = 8  # chunks handed to each worker, small enough to even out the long and short games
+SEED = 2084
+
+# Columns of the per-wave report, and of the per-game rows with --games-output
+REPORT_COLUMNS = ["wave", "games", "survival_rate", "timeout_rate", "clear_seconds_mean", "clear_seconds_median",
+                  "lives_lost_mean", "family_saved_mean", "family_lost_mean", "score_mean", "step_ms_mean",
+                  "step_ms_max"]
+GAME_COLUMNS = ["seed", "wave", "cleared", "timed_out", "ticks", "lives_lost", "family_saved", "family_lost", "score",
+                "step_ms_mean", "step_ms_max"]
+
+
+def load_policy(name):
+    """
+    Look up a policy by name, either one of POLICIES or "module:function" for a policy defined elsewhere.
+
+    :param str name: Name of the policy
+    :return: the policy function, see balance.policies
+    """
+    if name in POLICIES:
+        return POLICIES[name]
+    module, _, function = name.partition(":")
+    if not function:
+        raise ValueError(f"Unknown policy {name!r}, expected one of {', '.join(POLICIES)} or module:function")
+    return getattr(importlib.import_module(module), function)
+
+
+def play(job):
+    """
+    Play one headless game from the start of a wave, until the hero has cleared the number of waves asked for, runs
+    out of lives or takes too long. Runs in the worker processes, so it only takes and returns plain data.
+
+    :param tuple job: (seed, first wave, number of waves, policy name, stress, max ticks per wave)
+    :return: list of dicts, one row of GAME_COLUMNS for every wave played
+    """
+    seed, first_wave, waves, policy_name, stress, max_ticks = job
+    policy = load_policy(policy_name)
+    rng = random.Random(seed)
+    game = Game(headless=True, seed=seed, stress=stress)
+    game.wave_count = first_wave - 1  # the first step spawns the next wave
+
+    rows = []
+    row = None
+    step_ms = []
+    while True:
+        wave = game.wave_count
+        lives = game.life_count
+        start = time.perf_counter()
+        game.step(policy(game, rng))
+        step_ms.append((time.perf_counter() - start) * 1000)
+
+        if game.wave_count != wave:
+            if row is not None:
+                row["cleared"] = True
+                rows.append(finish_row(row, game, step_ms))
+            if len(rows) == waves:
+                return rows
+            row = {"seed": seed, "wave": game.wave_count, "cleared": False, "timed_out": False, "ticks": 0,
+                   "lives_lost": 0, "family_saved": game.family_saved_count, "family_lost": game.family_lost_count,
+                   "score": game.score_count}
+            step_ms = []
+            continue
+        if row is None:
+            continue
+
+        if game.life_count < lives:
+            row["lives_lost"] += lives - game.life_count
+        if not game.pause_entity_movement and not game.transition_flag:
+            row["ticks"] += 1  # only the ticks the robots were moving count torwards the time to clear the wave
+        if game.game_over or row["ticks"] >= max_ticks:
+            row["timed_out"] = not game.game_over
+            rows.append(finish_row(row, game, step_ms))
+            return rows
+
+
+def finish_row(row, game, step_ms):
+    """
+    Turn the counters at the start of a wave into what happened during it.
+
+    :param dict row: Row started when the wave spawned
+    :param game: Game object, at the end of the wave
+    :param list step_ms: ms taken by every step() of the wave
+    :return: the row
+    """
+    row["family_saved"] = game.family_saved_count - row["family_saved"]
+    row["family_lost"] = game.family_lost_count - row["family_lost"]
+    row["score"] = game.score_count - row["score"]
+    row["step_ms_mean"] = sum(step_ms) / len(step_ms)
+    row["step_ms_max"] = max(step_ms)
+    return row
+
+
+def aggregate(rows):
+    """
+    Combine the games into one row of REPORT_COLUMNS per wave.
+
+    :param rows: Rows returned by play()
+    :return: list of dicts, ordered by wave
+    """
+    waves = {}
+    for row in rows:
+        waves.setdefault(row["wave"], []).append(row)
+
+    report = []
+    for wave, games in sorted(waves.items()):
+        clear_seconds = [game["ticks"] / TICK_RATE for game in games if game["cleared"]]
+        report.append({
+            "wave": wave,
+            "games": len(games),
+            "survival_rate": sum(game["cleared"] for game in games) / len(games),
+            "timeout_rate": sum(game["timed_out"] for game in games) / len(games),
+            "clear_seconds_mean": statistics.fmean(clear_seconds) if clear_seconds else None,
+            "clear_seconds_median": statistics.median(clear_seconds) if clear_seconds else None,
+            "lives_lost_mean": statistics.fmean(game["lives_lost"] for game in games),
+            "family_saved_mean": statistics.fmean(game["family_saved"] for game in games),
+            "family_lost_mean": statistics.fmean(game["family_lost"] for game in games),
+            "score_mean": statistics.fmean(game["score"] for game in games),
+            "step_ms_mean": statistics.fmean(game["step_ms_mean"] for game in games),
+            "step_ms_max": max(game["step_ms_max"] for game in games),
+        })
+    return report
+
+
+def write_rows(rows, columns, path):
+    """
+    Write rows to a CSV file, or to a Parquet file if the path ends in .parquet.
+
+    :param rows: list of dicts
+    :param columns: Column names, in order
+    :param Path path: Output file
+    :return: None
+    """
+    if path.suffix == ".parquet":
+        if pd is None:
+            raise RuntimeError(f"Writing {path} needs pandas and pyarrow, write a .csv instead")
+        pd.DataFrame(rows, columns=columns).to_parquet(path, index=False)
+        return
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def init_worker():
+    logging.getLogger().setLevel(logging.WARNING)  # the game logs at DEBUG level
+
+
+def run(jobs, workers):
+    """
+    Play every job, spread over a pool of worker processes.
+
+    :param list jobs: Arguments of play()
+    :param int workers: Number of processes, 1 to play in this process
+    :return: list of the rows of every game
+    """
+    if workers == 1:
+        results = map(play, jobs)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=init_worker)
+        chunksize = max(1, len(jobs) // (workers * JOBS_PER_WORKER))
+        results = executor.map(play, jobs, chunksize=chunksize)
+
+    rows = []
+    for done, game_rows in enumerate(results, 1):
+        rows.extend(game_rows)
+        if done * 10 // len(jobs) != (done - 1) * 10 // len(jobs):
+            print(f"{done}/{len(jobs)} games")
+    if workers != 1:
+        executor.shutdown()
+    return rows
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Play seeded headless games with a scripted hero and report "
+                                                 "statistics for every wave")
+    parser.add_argument("--policy", default="kite",
+                        help=f"hero policy, one of: {', '.join(POLICIES)}, or module:function")
+    parser.add_argument("--first-wave", type=int, default=1, help="first wave games are started at")
+    parser.add_argument("--last-wave", type=int, default=40, help="last wave games are started at")
+    parser.add_argument("--games", type=int, default=GAMES_PER_WAVE, help="games started at every wave")
+    parser.add_argument("--waves-per-game", type=int, default=1,
+                        help="waves each game plays before it stops, if the hero survives them")
+    parser.add_argument("--stress", type=float, default=1.0, help="multiplier of the number of entities per wave")
+    parser.add_argument("--max-wave-seconds", type=float, default=MAX_WAVE_SECONDS,
+                        help="game time after which a wave is given up on")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--seed", type=int, default=SEED, help="seed of the first game, the others count up from it")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="per-wave report, .csv or .parquet")
+    parser.add_argument("--games-output", type=Path, help="also write a row for every wave of every game here")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+    load_policy(args.policy)  # fail here, not once in every worker
+
+    max_ticks = int(args.max_wave_seconds * TICK_RATE)
+    jobs = []
+    for wave in range(args.first_wave, args.last_wave + 1):
+        for game in range(args.games):
+            seed = args.seed + len(jobs)
+            jobs.append((seed, wave, args.waves_per_game, args.policy, args.stress, max_ticks))
+
+    start = time.perf_counter()
+    rows = run(jobs, args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"Played {len(jobs)} games, {len(rows)} waves, in {elapsed:.1f} s with {args.workers} worker(s)")
+
+    report = aggregate(rows)
+    for wave in report:
+        clear = wave["clear_seconds_mean"]
+        print(f"wave {wave['wave']:3}  survival {wave['survival_rate']:6.1%}  "
+              f"clear {'-' if clear is None else f'{clear:.1f} s':>8}  "
+              f"saved {wave['family_saved_mean']:5.2f}  lost {wave['family_lost_mean']:5.2f}  "
+              f"score {wave['score_mean']:8.0f}  step {wave['step_ms_mean']:6.3f} ms")
+
+    write_rows(report, REPORT_COLUMNS, args.output)
+    print(f"Report written to {args.output}")
+    if args.games_output is not None:
+        write_rows(rows, GAME_COLUMNS, args.games_output)
+        print(f"Games written to {args.games_output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+import argparse
+import gc
+import logging
+import sys
+import time
+import tracemalloc
+
+from entities.hulk import Hulk
+from game import Game
+
+logger = logging.getLogger(__name__)
+
+# CONSTANTS
+ENTITIES = 1000
+FRAMES = 60  # frames measured, one second of game time
+SEED = 2084
+
+
+def build_entities(game, count):
+    """
+    Construct hulks spread over the active area. Hulks are used because every frame they take the common movement
+    path of the entities: update() -> move_to_target() -> move_entity() -> animate().
+
+    :param game: headless Game object
+    :param int count: Number of hulks
+    :return: list of the hulks
+    """
+    area = game.active_area
+    columns = area.width // game.hulk_size[0]
+    entities = [None] * count  # allocated up front, so only the entities are measured
+    for i in range(count):
+        x = area.left + (i % columns) * game.hulk_size[0]
+        y = area.top + (i // columns) * 7 % (area.height - game.hulk_size[1])
+        entities[i] = Hulk(game, (x, y), game.hulk_size)
+    return entities
+
+
+def bytes_per_entity(game, count):
+    """
+    Memory held by each entity: the object, its attributes and the lists and rects it owns.
+    The animation images are shared by every entity of a type, so they aren't counted.
+
+    :param game: headless Game object
+    :param int count: Number of entities measured
+    :return: bytes per entity
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = build_entities(game, count)
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    # the list of the entities isn't part of them
+    return (held - sys.getsizeof(entities)) / len(entities)
+
+
+def temporary_bytes_per_frame(entities, frames):
+    """
+    Memory allocated and freed again while the entities move. CPython doesn't count allocations in a release build,
+    so this adds up the peak of the temporaries of every update() call: a list built and thrown away by the movement
+    shows up here, the floats of the new positions too.
+
+    :param list entities: Entities to update
+    :param int frames: Number of frames measured
+    :return: bytes per frame
+    """
+    tracemalloc.start()
+    total = 0
+    for _ in range(frames):
+        for entity in entities:
+            current = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            entity.update()
+            total += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+    return total / frames
+
+
+def ms_per_frame(entities, frames):
+    """
+    Time the update() of every entity, without tracemalloc slowing it down.
+
+    :param list entities: Entities to update
+    :param int frames: Number of frames measured
+    :return: ms per frame
+    """
+    start = time.perf_counter()
+    for _ in range(frames):
+        for entity in entities:
+            entity.update()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Memory held by the entities and allocated by their movement")
+    parser.add_argument("--entities", type=int, default=ENTITIES, help="number of entities")
+    parser.add_argument("--frames", type=int, default=FRAMES, help="measured frames")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    logging.getLogger().setLevel(logging.WARNING)  # the game logs at DEBUG level
+
+    game = Game(headless=True, seed=SEED)
+    print(f"{'bytes per entity':<28}{bytes_per_entity(game, args.entities):9.0f}")
+    entities = build_entities(game, args.entities)
+    temporary = temporary_bytes_per_frame(entities, args.frames)
+    print(f"{'temporary bytes per frame':<28}{temporary:9.0f}  ({args.entities} entities)")
+    if temporary:
+        # the lists are reused, the floats of the positions and steps can't be
+        print(f"{'':<28}{temporary / len(entities):9.0f}  per entity, the movement is not allocation-free")
+    print(f"{'ms per frame':<28}{ms_per_frame(entities, args.frames):9.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
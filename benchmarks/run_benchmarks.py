@@ -0,0 +1,142 @@
+import argparse
+import json
+import logging
+import platform
+import sys
+import time
+from pathlib import Path
+
+import pygame
+
+from benchmarks.scenarios import SCENARIOS, build_arena, maintain_arena
+from game import Game
+
+logger = logging.getLogger(__name__)
+
+# CONSTANTS
+BENCHMARK_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCHMARK_DIR / "baseline.json"
+DEFAULT_OUTPUT = BENCHMARK_DIR / "results.json"
+WARMUP_FRAMES = 30  # frames run before measuring, to fill caches and let the arena settle
+MEASURED_FRAMES = 300  # frames measured per scenario, 5 seconds of game time
+DEFAULT_TOLERANCE = 0.15  # a scenario regresses if its mean frame cost grows by more than this fraction
+SEED = 2084
+
+
+def run_scenario(name, frames=MEASURED_FRAMES, seed=SEED):
+    """
+    Build the scenario in a headless game and time step() + render() for every frame.
+    Rendering goes to the off-screen display surface, nothing is presented.
+
+    :param str name: key of SCENARIOS
+    :param int frames: number of measured frames
+    :param int seed: game seed, the same seed always builds the same arena
+    :return: dict of results
+    """
+    scenario = SCENARIOS[name]
+    game = Game(headless=True, seed=seed)
+    build_arena(game, scenario)
+
+    frame_ms = []
+    for i in range(WARMUP_FRAMES + frames):
+        maintain_arena(game, scenario)
+        start = time.perf_counter()
+        game.step()
+        game.render()
+        if i >= WARMUP_FRAMES:
+            frame_ms.append((time.perf_counter() - start) * 1000)
+
+    ordered = sorted(frame_ms)
+    mean_ms = sum(frame_ms) / len(frame_ms)
+    return {
+        "fps": 1000 / mean_ms,
+        "mean_ms": mean_ms,
+        "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+        "max_ms": ordered[-1],
+        "sprites": len(game.allsprites),
+        "phases": {phase: {"min_ms": low, "avg_ms": avg, "p99_ms": p99}
+                   for phase, low, avg, p99 in game.profiler.stats()},
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compare the mean frame cost of every scenario against the baseline.
+
+    :param dict results: scenario name: results, from run_scenario()
+    :param dict baseline: scenario name: results, from a previous run
+    :param float tolerance: allowed fractional growth of the mean frame cost
+    :return: list of regressed scenario names
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            logger.warning(f"{name}: no baseline, skipping comparison")
+            continue
+        base_ms = baseline[name]["mean_ms"]
+        change = (result["mean_ms"] - base_ms) / base_ms
+        status = "REGRESSION" if change > tolerance else "ok"
+        print(f"{name:<28}{base_ms:9.3f} ms -> {result['mean_ms']:9.3f} ms  {change:+7.1%}  {status}")
+        if change > tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Headless game loop benchmarks")
+    parser.add_argument("scenarios", nargs="*", default=list(SCENARIOS),
+                        help=f"scenarios to run, default all of: {', '.join(SCENARIOS)}")
+    parser.add_argument("--frames", type=int, default=MEASURED_FRAMES, help="measured frames per scenario")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="where to write the results json")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline results json")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed fractional growth of the mean frame cost before failing")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="write the results to the baseline instead of comparing against it")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    logging.getLogger().setLevel(logging.WARNING)  # the game logs at DEBUG level
+
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        print(f"Unknown scenarios: {', '.join(unknown)}")
+        return 2
+
+    results = {}
+    for name in args.scenarios:
+        results[name] = run_scenario(name, frames=args.frames)
+        print(f"{name:<28}{results[name]['fps']:9.1f} fps  mean {results[name]['mean_ms']:7.3f} ms  "
+              f"p99 {results[name]['p99_ms']:7.3f} ms  ({results[name]['sprites']} sprites)")
+
+    report = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+        "frames": args.frames,
+        "scenarios": results,
+    }
+    output = args.baseline if args.update_baseline else args.output
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+
+    if args.update_baseline:
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}, run with --update-baseline to create one")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)["scenarios"]
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"{len(regressions)} scenario(s) regressed: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+from animations.explode import ExplodeAnimations
+from entities.grunt import Grunt
+from projectiles.tank_projectiles import TankProjectiles
+from sprite_pool import get_pool
+
+# CONSTANTS
+HERO_INVULN_TIME = 10 ** 9  # frames, keeps the hero alive for the whole benchmark
+EXPLODE_LOGIC = (("horizontal", False), ("vertical", False), ("diagonal", False), ("diagonal", True))
+
+# Every scenario is built from the real Spawner, entity classes and Game collision code.
+#   enemies:          e_type: count, passed to Spawner.spawn_enemies(). Needs at least one grunt or the wave ends.
+#   family:           e_type: count, passed to Spawner.spawn_family()
+#   tank_projectiles: number of bouncing tank shells kept alive in the arena
+#   explosions:       number of simultaneous ExplodeAnimations kept running
+#   shooting:         hero fire direction [left, right, up, down], or None to hold fire
+SCENARIOS = {
+    "grunts_500": {
+        "enemies": {"grunts": 500},
+    },
+    "grunts_2000": {
+        "enemies": {"grunts": 2000},
+    },
+    "hulks_200": {
+        "enemies": {"grunts": 10, "hulks": 200},
+        "family": {"dad": 20, "mom": 20, "mike": 20},
+    },
+    "electrodes_500_firefight": {
+        "enemies": {"grunts": 200, "electrodes": 500},
+        "shooting": [True, False, True, False],
+    },
+    "tank_projectiles_300": {
+        "enemies": {"grunts": 10},
+        "tank_projectiles": 300,
+    },
+    "brains_50": {
+        "enemies": {"grunts": 10, "brains": 50},
+        "family": {"dad": 30, "mom": 30, "mike": 30},
+    },
+    "explosions_200": {
+        "enemies": {"grunts": 10},
+        "explosions": 200,
+    },
+}
+
+
+def build_arena(game, scenario):
+    """
+    Spawn the scenario's entities into a headless game and skip straight past the wave transition.
+
+    :param game: headless Game object
+    :param dict scenario: one of SCENARIOS
+    :return: None
+    """
+    game.wave_count = 1
+    game.spawner.spawn_enemies(counts=scenario.get("enemies", {}))
+    game.spawner.spawn_family(counts=scenario.get("family", {}))
+
+    # skip the Squares transition and the convergence, start in the middle of the wave
+    game.transition_flag = False
+    game.level_transition = False
+    game.pause_entity_movement = False
+    game.converged = True
+    game.first_wave = False
+
+    game.hero.respawn_invuln = HERO_INVULN_TIME
+    if scenario.get("shooting"):
+        game.hero_shooting = list(scenario["shooting"])
+
+    maintain_arena(game, scenario)
+
+
+def maintain_arena(game, scenario):
+    """
+    Top up the projectiles and explosions that expired during the last frame, so every frame measures the same load.
+
+    :param game: headless Game object
+    :param dict scenario: one of SCENARIOS
+    :return: None
+    """
+    missing = scenario.get("tank_projectiles", 0) - len(game.enemy_projectiles)
+    if missing > 0:
+        for pos in game.spawner.spawn_positions("tank_projectiles", missing):
+            projectile = get_pool(game, TankProjectiles).acquire("tank_projectile", list(pos))
+            game.enemy_projectiles.add(projectile)
+            game.allsprites.add(projectile)
+
+    missing = scenario.get("explosions", 0) - len(game.active_animations)
+    if missing > 0:
+        for i, pos in enumerate(game.spawner.spawn_positions("explosions", missing)):
+            # the grunt is only used as the source image of the explosion, it never joins the game
+            grunt = Grunt(game, pos, game.grunt_size)
+            game.active_animations.append(ExplodeAnimations(game, grunt, EXPLODE_LOGIC[i % len(EXPLODE_LOGIC)]))
@@ -0,0 +1,79 @@
+import pygame
+
+# CONSTANTS
+PRELOADED_CHARACTERS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ :'.!"
+MAX_CACHED_STRINGS = 64  # composed strings kept per font, the oldest one is dropped first
+
+
+class BitmapFont:
+    """
+    Text renderer that rasterizes each glyph once into an atlas and composes strings out of it.
+
+    Composed strings are cached by value, so drawing the same text every frame is a dict lookup instead of a
+    font.render(). Characters that are not in the atlas yet, like lower case letters, are added the first time
+    they are used.
+    """
+
+    def __init__(self, font, color, characters=PRELOADED_CHARACTERS):
+        """
+        :param font: pygame.font.Font to rasterize the glyphs with
+        :param color: Text color
+        :param str characters: Glyphs to put in the atlas up front
+        """
+        self.font = font
+        self.color = color
+        self.height = font.get_height()
+        self.atlas = pygame.Surface((0, self.height), pygame.SRCALPHA)
+        self.glyphs = {}  # character: pygame.Rect of the glyph in the atlas
+        self.strings = {}  # text: composed surface, in the order they were composed
+        self.add_glyphs(characters)
+
+    def add_glyphs(self, characters):
+        """
+        Rasterize the characters that are not in the atlas yet and rebuild the atlas with them.
+
+        :param str characters: Characters to add
+        :return: None
+        """
+        new = [char for char in dict.fromkeys(characters) if char not in self.glyphs]
+        if not new:
+            return
+
+        surfaces = {char: self.atlas.subsurface(rect) for char, rect in self.glyphs.items()}
+        for char in new:
+            surfaces[char] = self.font.render(char, True, self.color)
+
+        atlas = pygame.Surface((sum(surface.get_width() for surface in surfaces.values()), self.height),
+                               pygame.SRCALPHA)
+        glyphs = {}
+        x = 0
+        for char, surface in surfaces.items():
+            # BLEND_RGBA_MAX copies the glyph as-is onto the transparent atlas, a normal blit would darken the edges
+            glyphs[char] = atlas.blit(surface, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            x += surface.get_width()
+        self.atlas = atlas
+        self.glyphs = glyphs
+
+    def render(self, text):
+        """
+        Get the surface of the text, composing it out of the atlas the first time it is asked for.
+
+        :param str text: Text to render
+        :return: pygame.Surface
+        """
+        surface = self.strings.get(text)
+        if surface is not None:
+            return surface
+
+        self.add_glyphs(text)
+        surface = pygame.Surface((sum(self.glyphs[char].width for char in text), self.height), pygame.SRCALPHA)
+        x = 0
+        for char in text:
+            rect = self.glyphs[char]
+            surface.blit(self.atlas, (x, 0), rect, special_flags=pygame.BLEND_RGBA_MAX)
+            x += rect.width
+
+        if len(self.strings) >= MAX_CACHED_STRINGS:
+            del self.strings[next(iter(self.strings))]
+        self.strings[text] = surface
+        return surface
@@ -0,0 +1,97 @@
+import pygame
+
+# CONSTANTS
+MAX_DIRTY_RECTS = 250  # above this many changed regions, presenting the whole frame is cheaper
+
+
+class DirtySurface(pygame.Surface):
+    """
+    Display surface that remembers where it was drawn on, so a frame only has to erase and present what changed.
+
+    Every blit() and blits() is recorded. clear() erases the regions drawn last frame instead of redrawing the whole
+    background, and scale_to() scales only the regions erased or drawn this frame up onto the screen, so just those have
+    to be pushed to the window with pygame.display.update(). Drawing that doesn't go through blit() or blits(), like
+    pygame.draw on the transition squares, must call invalidate() so the frame is erased and presented in full.
+
+    Usage:
+        display.clear(background)
+        ... draw the frame with display.blit() ...
+        rects = display.scale_to(screen)
+        pygame.display.flip() if rects is None else pygame.display.update(rects)
+    """
+
+    def __init__(self, size):
+        super().__init__(size)
+        self.drawn = []  # rects blitted this frame
+        self.erased = []  # rects cleared at the start of this frame, what was drawn last frame
+        self.full_frame = True  # the first frame is always presented in full
+        self.recording = True  # False once this frame drew more than MAX_DIRTY_RECTS regions
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        rect = super().blit(source, dest, area, special_flags)
+        if self.recording:
+            self.drawn.append(rect)
+            if len(self.drawn) > MAX_DIRTY_RECTS:
+                # too busy for dirty rects, the whole frame will be presented. Skip the recording until clear().
+                self.recording = False
+        return rect
+
+    def blits(self, blit_sequence, doreturn=True):
+        rects = super().blits(blit_sequence, True)
+        if self.recording:
+            self.drawn.extend(rects)
+            if len(self.drawn) > MAX_DIRTY_RECTS:
+                self.recording = False
+        return rects if doreturn else None
+
+    def invalidate(self):
+        """
+        Erase and present the whole of the current and next frame.
+
+        :return: None
+        """
+        self.full_frame = True
+
+    def clear(self, background):
+        """
+        Erase everything drawn during the last frame by copying the background over it.
+
+        :param background: pygame.Surface the same size as this one
+        :return: None
+        """
+        # the base class blit(), so the background isn't recorded as drawn
+        if self.full_frame or not self.recording:
+            pygame.Surface.blit(self, background, (0, 0))
+            self.erased = [self.get_rect()]
+        else:
+            for rect in self.drawn:
+                pygame.Surface.blit(self, background, rect, rect)
+            self.erased = self.drawn
+        self.drawn = []
+        self.full_frame = False
+        self.recording = True  # record the blits again
+
+    def scale_to(self, screen):
+        """
+        Scale the changed parts of the frame up onto the screen.
+
+        :param screen: pygame display surface, a whole multiple of the size of this surface
+        :return: list of the updated screen rects, or None if the whole screen was updated
+        """
+        scale_x = screen.get_width() // self.get_width()
+        scale_y = screen.get_height() // self.get_height()
+
+        full_frame = self.full_frame or not self.recording
+        if not full_frame:
+            # a sprite that didn't move was erased and drawn at the same place
+            rects = {tuple(rect) for rect in self.erased + self.drawn if rect.w and rect.h}
+            full_frame = len(rects) > MAX_DIRTY_RECTS
+        if full_frame:
+            screen.blit(pygame.transform.scale(self, screen.get_size()), (0, 0))
+            return None
+
+        updated = []
+        for x, y, w, h in rects:
+            scaled = pygame.transform.scale(self.subsurface((x, y, w, h)), (w * scale_x, h * scale_y))
+            updated.append(screen.blit(scaled, (x * scale_x, y * scale_y)))
+        return updated
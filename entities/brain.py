@@ -1,6 +1,7 @@
 from entities.entities import PhysicsEntity
 from entities.prog import Prog
 from projectiles.brain_projectile import BrainProjectile
+from sprite_pool import get_pool
 
 
 class Brain(PhysicsEntity):
@@ -14,7 +15,7 @@ class Brain(PhysicsEntity):
     POINT_VALUE = 500  # point value for the brain
     MOVEMENT_SPEED = 0.2  # movement speed of the brain
     PROJECTILE_FIRE_TIMER = (
-        150  # Frames, controls how often the brain will fire at the hero
+        2500  # ms, controls how often the brain will fire at the hero
     )
 
     def __init__(self, game, pos, size):
@@ -27,14 +28,17 @@ class Brain(PhysicsEntity):
 
         # inheret the PhysicsEntity class
         super().__init__(game, self.__class__.__name__.lower(), pos, size)
+
+    def reset(self, pos, size):
+        super().reset(pos, size)
         self.image = self.game.robotrons_animations.animations[self.e_type][
             self.action
         ][0]
         self.action = "idle"  # initial stance
         self.target_pos = [0, 0]  # target position for the brain to move to
-        self.projectile_timer = (
+        self.projectile_timer = self.game.sim_clock.ms_to_ticks(
             self.PROJECTILE_FIRE_TIMER
-        )  # timer counter for firing projectiles
+        )  # timer counter for firing projectiles, ticks
         self.block_actions = False  # brains can act immediately
 
     def update(self, movement=(0, 0)):
@@ -51,29 +55,23 @@ class Brain(PhysicsEntity):
         target_pos = [self.game.hero.rect[0], self.game.hero.rect[1]]
 
         # unless there are humans left, chase the closest one
-        humans = self.game.family_group.sprites()
-
-        if len(humans) > 0:
-            # initialize the closest human position
-            smallest_distance = 0
-
-            # loop through the humans to find the closest one
-            for human in humans:
-                x = self.pos[0] - human.pos[0]
-                y = self.pos[1] - human.pos[1]
-                distance = abs(x) + abs(y)
-
-                # Update the smallest distance and target position if a closer human is found
-                if smallest_distance == 0 or distance <= smallest_distance:
-                    smallest_distance = distance
-                    target_pos = human.pos
+        human = self.game.family_index.nearest(self.pos)
+        if human is not None:
+            target_pos = human.pos
 
         # decrement the projectile timer and fire if ready
         self.projectile_timer -= 1
         if self.projectile_timer <= 0:
             # fire torwards the player
             self.fire_projectile()
-            self.projectile_timer = self.PROJECTILE_FIRE_TIMER
+            self.projectile_timer = self.game.sim_clock.ms_to_ticks(self.PROJECTILE_FIRE_TIMER)
+
+        if human is None:
+            # the same step as move_to_target(), around the electrodes and hulks in the way
+            direction = self.game.hero_field.steer(self.rect.x, self.rect.y, self.direction_to_target(target_pos))
+            speed = self.MOVEMENT_SPEED * self.game.sim_clock.speed_scale
+            self.move_entity([direction[0] * speed, direction[1] * speed])
+            return
 
         # move to the target position
         super().move_to_target(
@@ -87,9 +85,10 @@ class Brain(PhysicsEntity):
         """
 
         if not self.block_actions:
-            projectile = BrainProjectile(self.game, "brain_projectile", self.pos)
+            projectile = get_pool(self.game, BrainProjectile).acquire("brain_projectile", self.pos)
             self.game.enemy_projectiles.add(projectile)
             self.game.allsprites.add(projectile)
+            self.game.trail_group.add(projectile)
 
     def spawn_prog(self):
         """
@@ -98,9 +97,12 @@ class Brain(PhysicsEntity):
         """
 
         # spawn the prog at the brain's position
-        prog = Prog(self.game, (self.pos[0], self.pos[1]), self.game.prog_size)
+        prog = get_pool(self.game, Prog).acquire((self.pos[0], self.pos[1]), self.game.prog_size)
         self.game.enemy_group.add(prog)
+        self.game.prog_swarm.add(prog)
         self.game.allsprites.add(prog)
+        self.game.trail_group.add(prog)
+        self.game.family_index.invalidate()  # the human is gone
 
     def hit_by_projectile(self, **kwargs):
         """
@@ -1,6 +1,5 @@
 from entities.entities import PhysicsEntity
 import logging
-import random
 
 logger = logging.getLogger(__name__)
 
@@ -8,7 +7,10 @@ logger = logging.getLogger(__name__)
 class Electrode(PhysicsEntity):
     def __init__(self, game, pos, size):
         super().__init__(game, "electrode", pos, size)
-        electrode_type = random.randint(0, 3)  # pick between 1 of 3 electrodes
+
+    def reset(self, pos, size):
+        super().reset(pos, size)
+        electrode_type = self.game.rng.randint(0, 3)  # pick between 1 of 3 electrodes
         if electrode_type == 2:
             self.size = (
                 5,
@@ -16,4 +18,4 @@ class Electrode(PhysicsEntity):
             )  # This will eventually be replaced when we extract sizes from the json
         self.image = self.game.robotrons_animations.animations[self.e_type][
             str(electrode_type)
-        ][random.randint(0, 1)]
+        ][self.game.rng.randint(0, 1)]
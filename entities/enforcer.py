@@ -1,11 +1,12 @@
 from entities.entities import PhysicsEntity
 from projectiles.enforcer_projectiles import EnforcerProjectiles
+from sprite_pool import get_pool
 import logging
 
 logger = logging.getLogger(__name__)
 
 # CONSTANTS
-PROJECTILE_FIRE_TIMER = 60  # Frames, controls how often the enforcer will fire at the hero
+PROJECTILE_FIRE_TIMER = 1000  # ms, controls how often the enforcer will fire at the hero
 ENFORCER_MOVEMENT_SCALER = 0.7  # Scales the movement speed of the enforcer
 
 class Enforcer(PhysicsEntity):
@@ -15,8 +16,11 @@ class Enforcer(PhysicsEntity):
 
     def __init__(self, game, pos, size):
         super().__init__(game, "enforcer", pos, size)
+
+    def reset(self, pos, size):
+        super().reset(pos, size)
         self.image = self.game.robotrons_animations.animations[self.e_type]["0"][0]
-        self.projectile_timer = PROJECTILE_FIRE_TIMER
+        self.projectile_timer = self.game.sim_clock.ms_to_ticks(PROJECTILE_FIRE_TIMER)  # ticks
 
         self.target_posit = self.random_movement()
 
@@ -27,7 +31,7 @@ class Enforcer(PhysicsEntity):
         :return: None
         """
         if not self.block_actions:
-            projectile = EnforcerProjectiles(self.game, "enforcer_projectile", self.pos)
+            projectile = get_pool(self.game, EnforcerProjectiles).acquire("enforcer_projectile", self.pos)
             self.game.enemy_projectiles.add(projectile)
             self.game.allsprites.add(projectile)
             self.game.audio.play("enforcer_fire")
@@ -52,7 +56,7 @@ class Enforcer(PhysicsEntity):
             if self.projectile_timer <= 0:
                 # fire torwards the player
                 self.fire_projectile()
-                self.projectile_timer = PROJECTILE_FIRE_TIMER
+                self.projectile_timer = self.game.sim_clock.ms_to_ticks(PROJECTILE_FIRE_TIMER)
 
             # if reached its target, calculate a new target
             self.target_posit = self.reached_target(target_pos=self.target_posit)
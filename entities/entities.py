@@ -1,14 +1,15 @@
 import pygame
 import logging
-import random
 
 logger = logging.getLogger(__name__)
 
 FAMILY_MEMBERS = ("mom", "dad", "mike")
 
 # CONSTANTS
-BUFFER_LENGTH = 20  # Frames, the time delay before the flipbook animation will cycle to the next image
+BUFFER_LENGTH = 333  # ms, the time delay before the flipbook animation will cycle to the next image
 BUFFER = 0  # the counter for buffer, will count to the buffer_length then cycle
+ANIM_FLIPBOOK = (0, 1, 0, 2)  # order of the animation images, one tuple shared by every entity
+SPAWN_FRAME_TIME = 500  # ms, each image of the special spawn animation of the enforcer and the tank is shown this long
 
 
 class PhysicsEntity(pygame.sprite.Sprite):
@@ -16,15 +17,27 @@ class PhysicsEntity(pygame.sprite.Sprite):
         pygame.sprite.Sprite.__init__(self)
         self.game = game
         self.e_type = e_type
+        self.reset(pos, size)
+
+    def reset(self, pos, size):
+        """
+        Start a new life at a position, like a newly constructed entity. Used by SpritePool to recycle dead entities,
+        the subclasses reset their own state after calling this.
+
+        :param pos: [x, y] position
+        :param size: (width, height) pixel size
+        :return: None
+        """
         self.pos = list(pos)
         self.size = size
         self.rect = pygame.Rect(self.pos[0], self.pos[1], self.size[0], self.size[1])
         self.action = "idle"
+        self.frame_movement = [0, 0]  # the last step, reused by move_entity() instead of a new list every frame
 
         # animation variables, see _iterate_animation_frames() for more information
-        self.anim_flipbook = [0, 1, 0, 2]  # controls the animation static image
+        self.anim_flipbook = ANIM_FLIPBOOK  # controls the animation static image
         self.flipbook_index = 0  # indexes the anim_flipbook list
-        self.buffer_length = BUFFER_LENGTH
+        self.buffer_length = self.game.sim_clock.ms_to_ticks(BUFFER_LENGTH)  # ticks
         self.buffer = BUFFER
         self.anim_length = len(
             self.anim_flipbook
@@ -53,7 +66,7 @@ class PhysicsEntity(pygame.sprite.Sprite):
         """
         # spawn the entity
         self.anim_frame_delay += 1
-        if self.anim_frame_delay == 30:
+        if self.anim_frame_delay == self.game.sim_clock.ms_to_ticks(SPAWN_FRAME_TIME):
             self.iterate_animation_frames()
             # the dictionary is indexed by a number, indicating the current "frame" of the spawn
             # I did it this way because each piece of the spawn changes size
@@ -71,7 +84,7 @@ class PhysicsEntity(pygame.sprite.Sprite):
         """
         Update the animation frames.
         There are two counters, the buffer and the flipbook index.
-        The buffer is the length of time in game frames, while the
+        The buffer is the length of time in game ticks, while the
         flipbook index is the index for the individual images in the animation.
         :return: None
         """
@@ -112,9 +125,10 @@ class PhysicsEntity(pygame.sprite.Sprite):
 
     def move_entity(self, movement=(0, 0)):
         if len(movement) == 4:
-            # hero logic is given in a list of len==4, not len==2
-            x_dir = movement[1] - movement[0]
-            y_dir = movement[3] - movement[2]
+            # hero logic is given in a list of len==4, not len==2. The hero moves 1 pixel per reference tick.
+            speed = self.game.sim_clock.speed_scale
+            x_dir = (movement[1] - movement[0]) * speed
+            y_dir = (movement[3] - movement[2]) * speed
 
             # check out of bounds
             in_bounds = self.check_movement_in_bounds([x_dir, y_dir])
@@ -128,13 +142,17 @@ class PhysicsEntity(pygame.sprite.Sprite):
             self.rect.y = self.pos[1]
             return
 
-        frame_movement = [movement[0], movement[1]]
+        # reuse the entity's list, movement may be a tuple or the caller's list
+        frame_movement = self.frame_movement
+        frame_movement[0] = movement[0]
+        frame_movement[1] = movement[1]
 
-        self.pos[0] += frame_movement[0]
-        self.pos[1] += frame_movement[1]
+        pos = self.pos
+        pos[0] += frame_movement[0]
+        pos[1] += frame_movement[1]
 
-        self.rect.x = self.pos[0]
-        self.rect.y = self.pos[1]
+        self.rect.x = pos[0]
+        self.rect.y = pos[1]
 
         # update animations
         self.animate(frame_movement)
@@ -191,16 +209,17 @@ class PhysicsEntity(pygame.sprite.Sprite):
 
         :param target_pos: [x, y] position for the entity to move torwards
         :param movement: default movement (0, 0)
-        :param float scaler: Scales how fast the enemy moves in relation to the target.
+        :param float scaler: Scales how fast the enemy moves in relation to the target, pixels per reference tick.
         :param str or None move_dir: "x" or "y". Selects which direction the entity will move in.
         :return: None
         """
-        target_pos = list(target_pos)
-
-        frame_movement = list(self.direction_to_target(target_pos))
-
-        # scale the movement, can be used later to increase difficulty if desired.
-        frame_movement = [frame_movement[0] * scaler, frame_movement[1] * scaler]
+        # the same direction as direction_to_target(), worked out in place so every frame doesn't build new lists.
+        # Scale the movement, can be used later to increase difficulty if desired.
+        rect = self.rect
+        frame_movement = self.frame_movement
+        scaler = scaler * self.game.sim_clock.speed_scale
+        frame_movement[0] = ((target_pos[0] > rect.x) - (target_pos[0] < rect.x)) * scaler
+        frame_movement[1] = ((target_pos[1] > rect.y) - (target_pos[1] < rect.y)) * scaler
 
         if move_dir is not None:
             if move_dir == "x":
@@ -243,13 +262,15 @@ class PhysicsEntity(pygame.sprite.Sprite):
 
     def random_movement(self):
         """
-        Pick a new position for the hulk to travel to.
+        Pick a new position inside the active area for the entity to travel to.
+        The whole sprite fits at the position, so entities clamped to the active area can always reach it.
 
         :return: [x, y]
         """
+        area = self.game.active_area
         posit = [
-            random.choice(range(self.game.active_area.width)),
-            random.choice(range(self.game.active_area.height)),
+            self.game.rng.randrange(area.left, area.right - self.size[0]),
+            self.game.rng.randrange(area.top, area.bottom - self.size[1]),
         ]
         return posit
 
@@ -1,29 +1,24 @@
 from entities.entities import PhysicsEntity
 
 # CONSTANTS
-MOVE_AT_TIME = 20  # Frames, dictates the frame interval when all the grunts move at once
-GRUNT_MOVEMENT_SCALER = 3
+MOVE_AT_TIME = 333  # ms, dictates the interval when all the grunts move at once
+GRUNT_MOVEMENT_SCALER = 3  # pixels per move, the grunts move in steps instead of every tick
 
 class Grunt(PhysicsEntity):
     def __init__(self, game, pos, size):
         super().__init__(game, "grunt", pos, size)  # inheret the PhysicsEntity class
+
+    def reset(self, pos, size):
+        super().reset(pos, size)
         self.image = self.game.robotrons_animations.animations[self.e_type][self.action][0]
-        self.move_at_time = MOVE_AT_TIME
 
     def update(self, movement=(0, 0)):
         """
-        The grunt should slowly move torwards the hero entity.
+        The grunts slowly move torwards the hero entity, all at once. They are moved together by game.grunt_swarm.
 
         :param movement: Movement in (x, y). Default (0, 0)
         :return: None
         """
-        self.move_at_time -= 1
-        if self.move_at_time <= 0:
-            super().move_to_target(target_pos=(self.game.hero.rect.x, self.game.hero.rect.y),
-                                   movement=movement,
-                                   scaler=GRUNT_MOVEMENT_SCALER)
-            self.move_at_time = MOVE_AT_TIME
-            self.game.audio.play("grunt_walk")
 
     def iterate_animation_frames(self):
         # the grunt already moves on a "delay", so no buffer is required.
@@ -1,8 +1,10 @@
 from entities.entities import PhysicsEntity
 from projectiles.hero_projectiles import HeroProjectiles
+from sprite_pool import get_pool
 
 # CONSTANTS
-PROJECTILE_RELOAD_TIMER = 10  # Frames
+PROJECTILE_RELOAD_TIMER = 167  # ms
+BUFFER_LENGTH = 167  # ms, the hero's walk animation cycles twice as fast as the robots'
 
 class Hero(PhysicsEntity):
     def __init__(self, game, pos, size):
@@ -11,9 +13,9 @@ class Hero(PhysicsEntity):
         self.size = size
         super().__init__(self.game, "hero", self.pos, self.size)
         self.image = self.game.hero_animations.animations[self.e_type][self.action][0]
-        self.buffer_length = 10  # the time delay before the flipbook index will cycle
-        self.projectile_reload = PROJECTILE_RELOAD_TIMER  # frames
-        self.respawn_invuln = 0  # frames
+        self.buffer_length = self.game.sim_clock.ms_to_ticks(BUFFER_LENGTH)  # ticks before the flipbook index cycles
+        self.projectile_reload = self.game.sim_clock.ms_to_ticks(PROJECTILE_RELOAD_TIMER)  # ticks
+        self.respawn_invuln = 0  # ticks
 
         self.action = "idle"  # initial stance
 
@@ -26,7 +28,7 @@ class Hero(PhysicsEntity):
 
     def update(self, movement=(False, False, False, False), shooting=(False, False, False, False)):
         if self.respawn_invuln:
-            # Frame counter to make the hero invulnerable after respawn. Will be set to an integer in the game loop.
+            # Tick counter to make the hero invulnerable after respawn. Will be set to an integer in the game loop.
             self.respawn_invuln -= 1
 
         self.movement = self._directions_logic(movement, self.h_stack_movement, self.v_stack_shooting)
@@ -43,10 +45,10 @@ class Hero(PhysicsEntity):
         if self.projectile_reload > 0:
             self.projectile_reload -= 1
         if True in self.shooting and (self.projectile_reload <= 0):
-            projectile = HeroProjectiles(self.game, "hero_projectile", self.pos, self.shooting)
+            projectile = get_pool(self.game, HeroProjectiles).acquire("hero_projectile", self.pos, self.shooting)
             self.game.hero_projectiles.add(projectile)
             self.game.allsprites.add(projectile)
-            self.projectile_reload = PROJECTILE_RELOAD_TIMER  # Reload the gun
+            self.projectile_reload = self.game.sim_clock.ms_to_ticks(PROJECTILE_RELOAD_TIMER)  # Reload the gun
             self.game.audio.play("hero_lazer")
 
     def _directions_logic(self, player_inputs, h_stack, v_stack):
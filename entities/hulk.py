@@ -1,5 +1,4 @@
 from entities.entities import PhysicsEntity
-import random
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,7 +15,7 @@ DIRECTION_MAP = {
 }
 
 # CONSTANTS
-SLOWED_TIMER = 300  # frames. Controls how long the hulk will be slowed by.
+SLOWED_TIMER = 5000  # ms. Controls how long the hulk will be slowed by.
 DEFAULT_MOVE_SPEED_SCALER = 0.6  # The normal movement speed of the hulk
 SLOWED_MOVE_SPEED_SCALER = 0.2  # Movement speed of the hulk when slowed by hero projectile
 
@@ -27,8 +26,11 @@ class Hulk(PhysicsEntity):
 
     def __init__(self, game, pos, size):
         super().__init__(game, "hulk", pos, size)  # inheret the PhysicsEntity class
+
+    def reset(self, pos, size):
+        super().reset(pos, size)
         self.image = self.game.robotrons_animations.animations[self.e_type][self.action][0]
-        self.slowed_timer = SLOWED_TIMER
+        self.slowed_timer = self.game.sim_clock.ms_to_ticks(SLOWED_TIMER)  # ticks
 
         self.target_posit = self.random_movement()
         self.move_dir = None
@@ -49,7 +51,7 @@ class Hulk(PhysicsEntity):
 
         # pick movement direction, x or y
         if self.move_dir is None:
-            self.move_dir = random.choice(["x", "y"])
+            self.move_dir = self.game.rng.choice(["x", "y"])
         # move x
         if self.move_dir == "x":
             if abs(self.pos[0] - self.target_posit[0]) < 2:  # get it close, won't ever be exact due to speed variation
@@ -94,7 +96,7 @@ class Hulk(PhysicsEntity):
         :return: None
         """
         # This will slow down the movement scaler in update()
-        self.slowed_timer = SLOWED_TIMER
+        self.slowed_timer = self.game.sim_clock.ms_to_ticks(SLOWED_TIMER)
         
         # Push back the hulk in the direction it was hit
         for k, val in kwargs.items():
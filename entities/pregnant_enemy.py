@@ -1,11 +1,12 @@
-import random
 import logging
 from entities.entities import PhysicsEntity
 
 logger = logging.getLogger(__name__)
 
 # CONSTANTS
-SPAWN_TIME = random.randint(480, 600)  # frames, spawn sub-entities between 8 and 10 seconds
+SPAWN_TIME = (8000, 10000)  # (min, max) ms, spawn sub-entities between 8 and 10 seconds
+FULL_ANIM_TIME = 3000  # ms before spawning a sub-entity, when the full animation starts playing
+ANIM_FRAME_TIME = 133  # ms, each image of the animation is shown this long
 
 class PregnantEnemy(PhysicsEntity):
     """
@@ -15,6 +16,9 @@ class PregnantEnemy(PhysicsEntity):
 
     def __init__(self, game, e_type, pos, size):
         super().__init__(game, e_type, pos, size)  # inheret the PhysicsEntity class
+
+    def reset(self, pos, size):
+        super().reset(pos, size)
         self.block_actions = False  # override parent class variabled
         self.full_anim = False  # used to stop the full animation trigger logic from looping endlessly
         self.frame_counter = 4  # init this enemy at its largest size so it is easy to see spawning in
@@ -26,8 +30,8 @@ class PregnantEnemy(PhysicsEntity):
         self.number_of_children = None
 
         self.target_posit = self.random_movement()
-        self.spawn_counter = 0
-        self.spawn_time = SPAWN_TIME
+        self.spawn_counter = 0  # ticks
+        self.spawn_time = self.game.rng.randint(*map(self.game.sim_clock.ms_to_ticks, SPAWN_TIME))
 
     def animate(self, frame_movement=None):
         """
@@ -41,7 +45,7 @@ class PregnantEnemy(PhysicsEntity):
 
     def special_animation(self):
         self.anim_frame_delay += 1
-        if self.anim_frame_delay == 8:
+        if self.anim_frame_delay == self.game.sim_clock.ms_to_ticks(ANIM_FRAME_TIME):
             # the dictionary is indexed by a number, indicating the current "frame" of the spawn
             # I did it this because each piece of the spawn changes size
             self.image = self.game.robotrons_animations.animations[self.e_type][str(self.frame_counter)][0]
@@ -6,6 +6,8 @@ logger = logging.getLogger(__name__)
 
 # CONSTANTS
 IMAGE_TRAIL_LENGTH = 15    # number of trail images to store
+PROG_MOVEMENT_SCALER = 0.7  # controls the movement speed of the prog, like a fast grunt
+TRAIL_TINT = (255, 255, 0, 100)  # added to the image of the prog for the trail images
 
 class Prog(PhysicsEntity):
     """
@@ -14,9 +16,11 @@ class Prog(PhysicsEntity):
 
     def __init__(self, game, pos, size):
         super().__init__(game, self.__class__.__name__.lower(), pos, size)
+
+    def reset(self, pos, size):
+        super().reset(pos, size)
         self.animations = self.game.human_family_animations.animations[self.e_type] # they were originally humans
         self.image = self.animations[self.action][0] 
-        self.target_posit = self.random_movement()
 
         self.block_actions = True  # block movement until the prog has fully spawned
         self.spawn_frames = 6  # the number of animations frames in the prog spawn
@@ -38,13 +42,6 @@ class Prog(PhysicsEntity):
         if len(self.image_trail_positions) > IMAGE_TRAIL_LENGTH:
             self.image_trail_positions.pop(0)
 
-        # Draw trail images at their respective positions
-        for i, trail_pos in enumerate(self.image_trail_positions):
-            if i % 5 == 0:  # Only draw every 3rd image for performance
-                colored_image = self.image.copy()
-                colored_image.fill((255, 255, 0, 100), special_flags=pygame.BLEND_RGBA_ADD)
-                self.game.display.blit(colored_image, (trail_pos[0], trail_pos[1]), special_flags=pygame.BLEND_ADD)
-
         # Iterate the animation frames
         super().iterate_animation_frames()
         
@@ -59,11 +56,22 @@ class Prog(PhysicsEntity):
                 
         self.image = self.game.human_family_animations.animations[self.e_type][self.action][self.anim_flipbook[self.flipbook_index]]
 
+    def draw_trail(self, surface):
+        """
+        Draw the trail images at their respective positions.
+
+        :param surface: pygame.Surface to draw the trail on
+        :return: None
+        """
+        for i, trail_pos in enumerate(self.image_trail_positions):
+            if i % 5 == 0:  # Only draw every 3rd image for performance
+                colored_image = self.game.human_family_animations.get(self.image, tint=TRAIL_TINT)
+                surface.blit(colored_image, (trail_pos[0], trail_pos[1]), special_flags=pygame.BLEND_ADD)
+
     def update(self, movement=(0, 0)):
-        # if reached its target, calculate a new target
-        self.target_posit = self.reached_target(target_pos=self.target_posit)
+        """
+        Progs chase the hero around the electrodes and hulks, they are moved together by game.prog_swarm.
 
-        super().move_to_target(target_pos=self.target_posit,
-                            movement=movement,
-                            scaler=.7,
-                            move_dir=None)
\ No newline at end of file
+        :param movement: Movement in (x, y). Default (0, 0)
+        :return: None
+        """
\ No newline at end of file
@@ -1,5 +1,6 @@
-from entities.pregnant_enemy import PregnantEnemy
+from entities.pregnant_enemy import FULL_ANIM_TIME, PregnantEnemy
 from entities.tank import Tank
+from sprite_pool import get_pool
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,6 +15,9 @@ class Quark(PregnantEnemy):
 
     def __init__(self, game, pos, size):
         super().__init__(game, "quark", pos, size)  # inheret from PhysicsEntity class
+
+    def reset(self, pos, size):
+        super().reset(pos, size)
         self.number_of_children = 1
 
     def update(self, movement=(0, 0)):
@@ -25,14 +29,15 @@ class Quark(PregnantEnemy):
         """
         self.spawn_counter += 1
 
-        if (self.spawn_time - self.spawn_counter <= 180) and not self.full_anim:
+        full_anim_ticks = self.game.sim_clock.ms_to_ticks(FULL_ANIM_TIME)
+        if (self.spawn_time - self.spawn_counter <= full_anim_ticks) and not self.full_anim:
             self.full_anim = True  # used to stop this from setting the variable endlessly
             self.num_frames = 7  # use all the frames once close to spawning an entity
 
         # spawn tank
         if self.spawn_counter == self.spawn_time:
             # spawn the tank
-            tank = Tank(self.game, (self.pos[0], self.pos[1]), self.game.tank_size)
+            tank = get_pool(self.game, Tank).acquire((self.pos[0], self.pos[1]), self.game.tank_size)
             self.game.enemy_group.add(tank)
             self.game.allsprites.add(tank)
 
@@ -0,0 +1,160 @@
+import pygame
+
+# CONSTANTS
+CELL_SIZE = 32  # pixels, a little larger than the biggest sprite
+SEPARATION = 2  # pixels kept free between the sprites spawned in the same wave
+MAX_ATTEMPTS = 30  # candidates tried per position before accepting one that overlaps, when the area is too crowded
+MAX_COVERAGE = 0.4  # dart throwing stalls well before 55% of the area is covered, crowded waves are spaced closer
+
+
+class SpawnSampler:
+    """
+    Picks random, non-overlapping spawn positions inside an area, outside of the bands around the hero spawn point.
+
+    The valid x and y intervals of each sprite size are computed once, after that a position is two random draws.
+    Positions are placed by dart throwing, like Poisson-disk sampling: a candidate whose footprint overlaps the footprint
+    of a sprite already placed this wave is thrown again, checking only the nearby cells of a grid of the footprints.
+    A footprint is the sprite plus SEPARATION. When the footprints of a wave would cover more than MAX_COVERAGE of the
+    area, they are shrunk to fit, so a crowded wave still spreads out evenly instead of stacking.
+    """
+
+    def __init__(self, rng, area, exclude_center, exclude_distance):
+        """
+        :param rng: random.Random to draw the positions with
+        :param area: pygame.Rect the sprites must fit inside
+        :param exclude_center: (x, y) of the hero spawn point
+        :param int exclude_distance: pixels, no sprite is placed with its x or y closer than this to the spawn point
+        """
+        self.rng = rng
+        self.area = area
+        self.exclude_center = exclude_center
+        self.exclude_distance = exclude_distance
+        self.intervals = {}  # sprite size: (x intervals, y intervals), each a list of (start, length)
+        self.cells = {}  # (cell x, cell y): [pygame.Rect footprints of the sprites placed this wave]
+        self.max_size = (0, 0)  # largest footprint placed this wave
+        self.covered = 0  # square pixels covered by the footprints placed this wave
+
+    def reset(self):
+        """
+        Forget the sprites placed so far, for a new wave.
+
+        :return: None
+        """
+        self.cells = {}
+        self.max_size = (0, 0)
+        self.covered = 0
+
+    def get_intervals(self, size):
+        """
+        Valid top-left coordinates of a sprite of the given size.
+
+        :param size: (width, height) of the sprite
+        :return: (x intervals, y intervals), lists of (start, length)
+        """
+        intervals = self.intervals.get(size)
+        if intervals is None:
+            intervals = self.intervals[size] = (
+                self.axis_intervals(self.area.left, self.area.right - size[0], self.exclude_center[0]),
+                self.axis_intervals(self.area.top, self.area.bottom - size[1], self.exclude_center[1]),
+            )
+        return intervals
+
+    def axis_intervals(self, start, stop, center):
+        """
+        :param int start: First valid coordinate
+        :param int stop: Coordinate after the last valid one
+        :param int center: Coordinate of the hero spawn point on this axis
+        :return: list of (start, length) of [start, stop) minus the band around center
+        """
+        intervals = []
+        for low, high in ((start, min(stop, center - self.exclude_distance)),
+                          (max(start, center + self.exclude_distance), stop)):
+            if high > low:
+                intervals.append((low, high - low))
+        if not intervals:
+            # the area is smaller than the band, ignore the band
+            intervals.append((start, max(stop - start, 1)))
+        return intervals
+
+    def draw(self, intervals):
+        """
+        Draw a coordinate uniformly from a list of intervals.
+
+        :param intervals: list of (start, length)
+        :return: int
+        """
+        value = self.rng.randrange(sum(length for _, length in intervals))
+        for start, length in intervals:
+            if value < length:
+                return start + value
+            value -= length
+
+    def overlaps(self, rect):
+        """
+        :param rect: pygame.Rect footprint of a candidate
+        :return: bool, True if the rect overlaps a footprint placed this wave
+        """
+        left = (rect.left - self.max_size[0]) // CELL_SIZE
+        top = (rect.top - self.max_size[1]) // CELL_SIZE
+        for cx in range(left, rect.right // CELL_SIZE + 1):
+            for cy in range(top, rect.bottom // CELL_SIZE + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is not None and rect.collidelist(cell) != -1:
+                    return True
+        return False
+
+    def place(self, rect):
+        """
+        Remember the footprint of a placed sprite, filed under the cell of its top-left corner.
+
+        :param rect: pygame.Rect footprint
+        :return: None
+        """
+        key = (rect.left // CELL_SIZE, rect.top // CELL_SIZE)
+        cell = self.cells.get(key)
+        if cell is None:
+            self.cells[key] = [rect]
+        else:
+            cell.append(rect)
+        self.max_size = (max(self.max_size[0], rect.width), max(self.max_size[1], rect.height))
+        self.covered += rect.width * rect.height
+
+    def sample(self, count, size, separate=True):
+        """
+        Pick spawn positions.
+
+        :param int count: Number of positions
+        :param size: (width, height) of the sprites
+        :param bool separate: False to allow overlaps and not keep the positions out of later samples, for things
+            that aren't part of the wave like the projectiles of the benchmarks
+        :return: list of (x, y) top-left positions
+        """
+        x_intervals, y_intervals = self.get_intervals(size)
+        footprint = (size[0] + SEPARATION, size[1] + SEPARATION)
+        if separate and count:
+            area = sum(length for _, length in x_intervals) * sum(length for _, length in y_intervals)
+            coverage = (self.covered + count * footprint[0] * footprint[1]) / area
+            if coverage > MAX_COVERAGE:
+                scale = (MAX_COVERAGE / coverage) ** 0.5
+                footprint = (max(int(footprint[0] * scale), 1), max(int(footprint[1] * scale), 1))
+
+        attempts = MAX_ATTEMPTS if separate else 1
+        positions = []
+        for _ in range(count):
+            for attempt in range(attempts):
+                pos = (self.draw(x_intervals), self.draw(y_intervals))
+                if not separate:
+                    break
+                # the footprint is centered on the sprite
+                rect = pygame.Rect(pos[0] + (size[0] - footprint[0]) // 2, pos[1] + (size[1] - footprint[1]) // 2,
+                                   footprint[0], footprint[1])
+                if not self.overlaps(rect):
+                    break
+            else:
+                # the area is full. The last candidate is placed anyway, so a crowded wave still spawns every sprite,
+                # and the rest of the sprites don't waste their attempts.
+                attempts = 1
+            if separate:
+                self.place(rect)
+            positions.append(pos)
+        return positions
@@ -1,7 +1,4 @@
-import random
 import logging
-import json
-import sys
 from entities.electrode import Electrode
 from entities.grunt import Grunt
 from entities.hulk import Hulk
@@ -9,11 +6,26 @@ from entities.spheroid import Spheroid
 from entities.brain import Brain
 from entities.quark import Quark
 from entities.family import Dad, Mom, Mike
+from entities.spawn_sampler import SpawnSampler
+from sprite_pool import get_pool
 
 logger = logging.getLogger(__name__)
 
-with open("data/spawn_counts.json", "r") as f:
-    WAVE_INTENSITY = json.load(f)
+# CONSTANTS
+HERO_EXCLUSION_DISTANCE = 30  # pixels, nothing spawns with its x or y this close to the hero spawn point
+# e_type: Game attribute with the pixel size of the sprite. Types without a size, like the projectiles spawned by the
+# benchmarks, use the grunt size and may overlap.
+SPAWN_SIZES = {
+    "electrodes": "electrode_size",
+    "grunts": "grunt_size",
+    "hulks": "hulk_size",
+    "spheroids": "spheroid_size",
+    "quarks": "quark_size",
+    "brains": "brain_size",
+    "dad": "dad_size",
+    "mom": "mom_size",
+    "mike": "mike_size",
+}
 
 class Spawner:
     def __init__(self, game):
@@ -23,124 +35,106 @@ class Spawner:
         self.game = game
         self.active_area = self.game.active_area
 
-    @staticmethod
-    def get_valid_position(size, exclude_range):
-        """ Return valid positions within the active area."""
-        valid_positions = [i for i in range(size) if not (exclude_range[0] <= i < exclude_range[1])]
-        return random.choice(valid_positions)
+        # the hero spawns at the center of the map, use int() to get integer rather than float.
+        hero_spawn = (int(self.active_area.width / 2), int(self.active_area.height / 2))
+        self.sampler = SpawnSampler(self.game.rng, self.active_area, hero_spawn, HERO_EXCLUSION_DISTANCE)
 
-    def spawn_positions(self, e_type):
+    def spawn_positions(self, e_type, num_robots=None):
         """
         Given enemy type, give a list of enemy locations.
 
+        :param e_type: entity type, as named in spawn_counts.json
+        :param int or None num_robots: number of positions to generate. If None, use the count for the current wave.
         :return: List of randomized positions per enemy_type
         """
+        # get the intensity of the wave, see WaveTable
+        if num_robots is None:
+            num_robots = self.game.waves.get(self.level).get(e_type, 0)
+
         # account for the size of the robots to avoid clipping off the edge of the map
-        # TODO: update self.game.grunt_size to the size of the specific entity
-        mod_surf_size_x = self.active_area.width - self.game.grunt_size[0]
-        mod_surf_size_y = self.active_area.height - self.game.grunt_size[1]
-
-        # get the center of the map, use int() to get integer rather than float.
-        map_center_x = int(self.active_area.width / 2)
-        map_center_y = int(self.active_area.height / 2)
-
-        # get the intensity. Search by entity type, then by level number (which has to be a string).
-        try:
-            num_robots = WAVE_INTENSITY.get(e_type).get(str(self.level))
-        except AttributeError as e:
-            logger.critical(e)
-            logger.critical("Error getting the entity or level from the JSON. Double check the variable names.")
-            sys.exit()
-        posits = []
-
-        # need to define an exclusion zone around the hero spawn area
-        x_exclude = range(map_center_x - 30, map_center_x + 30)
-        y_exclude = range(map_center_y - 30, map_center_y + 30)
-
-        for i in range(0, num_robots):
-            posits.append(((random.choice([x for x in range(mod_surf_size_x) if x not in x_exclude])),
-                           random.choice([y for y in range(mod_surf_size_y) if y not in y_exclude])))
-        return posits
-
-    def spawn_enemies(self):
+        size = getattr(self.game, SPAWN_SIZES.get(e_type, "grunt_size"))
+        return self.sampler.sample(num_robots, size, separate=e_type in SPAWN_SIZES)
+
+    def spawn(self, entity_class, positions, size, *groups):
+        """
+        Spawn entities of one class, recycling the ones killed during the previous waves.
+
+        :param entity_class: PhysicsEntity subclass
+        :param positions: List of positions, see spawn_positions()
+        :param size: (width, height) pixel size of the entities
+        :param groups: Groups to add the entities to, all of them at once
+        :return: list of the entities
+        """
+        return get_pool(self.game, entity_class).spawn([(pos, size) for pos in positions], *groups)
+
+    @staticmethod
+    def _count(counts, e_type):
+        """ Return the overridden count for e_type, or None to use the count for the current wave."""
+        if counts is None:
+            return None
+        return counts.get(e_type, 0)
+
+    def spawn_enemies(self, counts=None):
         """
         Used to spawn enemies for a new wave.
 
+        :param dict or None counts: e_type: number of robots, overriding spawn_counts.json. Missing types spawn 0.
+            Used by the benchmarks to build synthetic arenas.
         :return: None
         """
         self.level = self.game.wave_count  # update the wave
+        self.sampler.reset()  # a new wave, nothing has been placed yet
 
         # spawn electrodes
-        electrode_positions = self.spawn_positions("electrodes")
-        for pos in electrode_positions:
-            electrode = Electrode(self.game, pos, self.game.grunt_size)
-            self.game.enemy_group.add(electrode)
-            self.game.allsprites.add(electrode)
+        electrode_positions = self.spawn_positions("electrodes", self._count(counts, "electrodes"))
+        self.spawn(Electrode, electrode_positions, self.game.electrode_size,
+                   self.game.enemy_group, self.game.electrodes_group, self.game.allsprites)
 
         # spawn grunts
-        grunt_positions = self.spawn_positions("grunts")
-        for pos in grunt_positions:
-            grunt = Grunt(self.game, pos, self.game.grunt_size)
-            self.game.enemy_group.add(grunt)
-            self.game.grunts_group.add(grunt)
-            self.game.allsprites.add(grunt)
+        grunt_positions = self.spawn_positions("grunts", self._count(counts, "grunts"))
+        self.spawn(Grunt, grunt_positions, self.game.grunt_size,
+                   self.game.enemy_group, self.game.grunts_group, self.game.grunt_swarm, self.game.allsprites)
 
         # spawn hulks
-        hulk_positions = self.spawn_positions("hulks")
-        for pos in hulk_positions:
-            hulk = Hulk(self.game, pos, self.game.hulk_size)
-            self.game.enemy_group.add(hulk)
-            self.game.hulks_group.add(hulk)
-            self.game.allsprites.add(hulk)
+        hulk_positions = self.spawn_positions("hulks", self._count(counts, "hulks"))
+        self.spawn(Hulk, hulk_positions, self.game.hulk_size,
+                   self.game.enemy_group, self.game.hulks_group, self.game.allsprites)
 
         # spawn spheroids
-        spheroid_positions = self.spawn_positions("spheroids")
-        for pos in spheroid_positions:
-            spheroid = Spheroid(self.game, pos, self.game.spheroid_size)
-            self.game.enemy_group.add(spheroid)
-            self.game.allsprites.add(spheroid)
+        spheroid_positions = self.spawn_positions("spheroids", self._count(counts, "spheroids"))
+        self.spawn(Spheroid, spheroid_positions, self.game.spheroid_size,
+                   self.game.enemy_group, self.game.allsprites)
 
         # spawn quarks
-        quark_positions =self.spawn_positions("quarks")
-        for pos in quark_positions:
-            quark = Quark(self.game, pos, self.game.quark_size)
-            self.game.enemy_group.add(quark)
-            self.game.allsprites.add(quark)
+        quark_positions =self.spawn_positions("quarks", self._count(counts, "quarks"))
+        if self.spawn(Quark, quark_positions, self.game.quark_size, self.game.enemy_group, self.game.allsprites):
             self.game.audio.play("quark_spawn")
 
         # spawn brains
-        brain_positions = self.spawn_positions("brains")
-        for pos in brain_positions:
-            brain = Brain(self.game, pos, self.game.brain_size)
-            self.game.enemy_group.add(brain)
-            self.game.brains_group.add(brain)
-            self.game.allsprites.add(brain)
-
-    def spawn_family(self):
+        brain_positions = self.spawn_positions("brains", self._count(counts, "brains"))
+        self.spawn(Brain, brain_positions, self.game.brain_size,
+                   self.game.enemy_group, self.game.brains_group, self.game.allsprites)
+
+    def spawn_family(self, counts=None):
         """
         Used to spawn family members for a new wave.
 
+        :param dict or None counts: e_type: number of family members, overriding spawn_counts.json
         :return: None
         """
         self.level = self.game.wave_count  # update the wave
 
         # spawn dads
-        dad_positions = self.spawn_positions("dad")
-        for pos in dad_positions:
-            dad = Dad(self.game, pos, self.game.dad_size)
-            self.game.family_group.add(dad)
-            self.game.allsprites.add(dad)
+        dad_positions = self.spawn_positions("dad", self._count(counts, "dad"))
+        self.spawn(Dad, dad_positions, self.game.dad_size,
+                   self.game.family_group, self.game.family_swarm, self.game.allsprites)
 
         # spawn moms
-        mom_positions = self.spawn_positions("mom")
-        for pos in mom_positions:
-            mom = Mom(self.game, pos, self.game.mom_size)
-            self.game.family_group.add(mom)
-            self.game.allsprites.add(mom)
+        mom_positions = self.spawn_positions("mom", self._count(counts, "mom"))
+        self.spawn(Mom, mom_positions, self.game.mom_size,
+                   self.game.family_group, self.game.family_swarm, self.game.allsprites)
 
         # spawn mikes
-        mike_positions = self.spawn_positions("mike")
-        for pos in mike_positions:
-            mike = Mike(self.game, pos, self.game.mike_size)
-            self.game.family_group.add(mike)
-            self.game.allsprites.add(mike)
+        mike_positions = self.spawn_positions("mike", self._count(counts, "mike"))
+        self.spawn(Mike, mike_positions, self.game.mike_size,
+                   self.game.family_group, self.game.family_swarm, self.game.allsprites)
@@ -1,14 +1,15 @@
 from entities.enforcer import Enforcer
-from entities.pregnant_enemy import PregnantEnemy
-import random
+from entities.pregnant_enemy import FULL_ANIM_TIME, PregnantEnemy
+from sprite_pool import get_pool
 import logging
 
 logger = logging.getLogger(__name__)
 
 # CONSTANTS
-NUMBER_OF_CHILDREN = random.randint(2, 5)  # controls how many enforcers will be spawned for each spheroid
-PAUSE_LIMIT = 60  # Controls how long the spheroid will wait while dropping off an enforcer
-SECONDARY_SPAWN_TIMER = random.randint(120, 360)  # speed up the enforcer spawn times after the first drop-off
+NUMBER_OF_CHILDREN = (2, 5)  # (min, max), controls how many enforcers will be spawned for each spheroid
+PAUSE_LIMIT = 1000  # ms, controls how long the spheroid will wait while dropping off an enforcer
+PAUSE_TIME = 500  # ms before dropping off an enforcer, when the spheroid stops moving
+SECONDARY_SPAWN_TIMER = (2000, 6000)  # (min, max) ms, speed up the enforcer spawn times after the first drop-off
 SPHEROID_MOVEMENT_SCALER = 0.7  # scales how fast the spheroid moves
 
 class Spheroid(PregnantEnemy):
@@ -17,13 +18,17 @@ class Spheroid(PregnantEnemy):
     every few seconds. Eventually, they will vanish after
     dropping off so many Enforcer robots.
     """
+
     def __init__(self, game, pos, size):
         super().__init__(game, "spheroid", pos, size)  # inheret from PhysicsEntity class
-        self.number_of_children = NUMBER_OF_CHILDREN
+
+    def reset(self, pos, size):
+        super().reset(pos, size)
+        self.number_of_children = self.game.rng.randint(*NUMBER_OF_CHILDREN)
 
         self.pause_mvmt = False  # pause the movement briefly when spawning an enforcer
         self.pause_timer = 0
-        self.pause_limit = PAUSE_LIMIT
+        self.pause_limit = self.game.sim_clock.ms_to_ticks(PAUSE_LIMIT)  # ticks
 
     def update(self, movement=(0, 0)):
         """
@@ -42,12 +47,13 @@ class Spheroid(PregnantEnemy):
                 self.pause_timer = 0
 
         # Once the spheroid is close to spawning an enforcer, start playing the full animation
-        if (self.spawn_time - self.spawn_counter <= 180) and not self.full_anim:
+        full_anim_ticks = self.game.sim_clock.ms_to_ticks(FULL_ANIM_TIME)
+        if (self.spawn_time - self.spawn_counter <= full_anim_ticks) and not self.full_anim:
             self.full_anim = True  # used to stop this from setting the variable endlessly
             self.num_frames = 7  # use all the frames once close to spawning an entity
 
         # when the spheroid is about to spawn an enforcer, stop movement
-        if (self.spawn_time - self.spawn_counter) <= 30:
+        if (self.spawn_time - self.spawn_counter) <= self.game.sim_clock.ms_to_ticks(PAUSE_TIME):
             self.pause_mvmt = True
 
         # spawn enforcers
@@ -55,9 +61,9 @@ class Spheroid(PregnantEnemy):
             # spawn the enforcer
             # TODO: tried to spawn it in the center of the spheroid,
             #  but this still needs some tweaking due to top-left nature of pygame
-            enforcer = Enforcer(self.game, (self.pos[0]+self.game.enforcer_size[0]/2,
-                                            self.pos[1]+self.game.enforcer_size[1]/2),
-                                self.game.enforcer_size)
+            enforcer = get_pool(self.game, Enforcer).acquire((self.pos[0]+self.game.enforcer_size[0]/2,
+                                                              self.pos[1]+self.game.enforcer_size[1]/2),
+                                                             self.game.enforcer_size)
             self.game.enemy_group.add(enforcer)
             self.game.allsprites.add(enforcer)
 
@@ -66,7 +72,7 @@ class Spheroid(PregnantEnemy):
             if self.number_of_children == 0:
                 self.kill()
             self.spawn_counter = 0
-            self.spawn_time = SECONDARY_SPAWN_TIMER
+            self.spawn_time = self.game.rng.randint(*map(self.game.sim_clock.ms_to_ticks, SECONDARY_SPAWN_TIMER))
 
         # if reached its target, calculate a new target
         self.target_posit = self.reached_target(target_pos=self.target_posit)
@@ -1,5 +1,49 @@
 import pygame
-import json
+import logging
+
+from asset_cache import ASSETS
+
+logger = logging.getLogger(__name__)
+
+# CONSTANTS
+ATLAS_COLORKEY = (1, 0, 1)  # transparent color of the converted sprite sheets, a near black no sprite uses
+
+
+class SpriteVariants:
+    """Memoized flipped, rotated and tinted copies of sprite surfaces.
+
+    Each variant is computed the first time it is asked for and the same surface is returned after that,
+    so don't draw on the returned surfaces.
+    """
+
+    def __init__(self):
+        self.variants = {}  # (surface, flip_x, rotate, tint): variant surface
+
+    def get(self, frame, flip_x=False, rotate=0, tint=None):
+        """Get a variant of a surface. The surface is rotated first, then flipped, then tinted.
+
+        :param frame: Original pygame.Surface
+        :param bool flip_x: True to mirror the surface horizontally
+        :param int rotate: Counter-clockwise rotation in degrees
+        :param tint: (r, g, b, a) added to every visible pixel with BLEND_RGBA_ADD, or None
+        :return: Variant surface, the frame itself if nothing is asked for
+        """
+        key = (frame, flip_x, rotate, tint)
+        variant = self.variants.get(key)
+        if variant is None:
+            variant = frame
+            if rotate:
+                variant = pygame.transform.rotate(variant, rotate)
+            if flip_x:
+                variant = pygame.transform.flip(variant, True, False)
+            if tint is not None:
+                # only tint the visible pixels, the transparent ones stay transparent black
+                tinted = variant.convert_alpha()
+                tinted.fill(tint, special_flags=pygame.BLEND_RGBA_ADD)
+                variant = pygame.mask.from_surface(variant).to_surface(setsurface=tinted, unsetcolor=(0, 0, 0, 0))
+            self.variants[key] = variant
+        return variant
+
 
 class SpriteSheet:
     def __init__(self, filename):
@@ -8,21 +52,31 @@ class SpriteSheet:
         You must ensure there is a .json file with the same name as the .png file
         containing the necessary metadata for the sprite sheet.
 
+        The sheet is kept as a single atlas surface and every frame is a subsurface of it, so the frames share the
+        atlas pixels instead of each being a copy.
+
         :param filename: Relative path to the sprite sheet image file
         """
         
-        self.sprite_sheet = pygame.image.load(filename).convert_alpha() #convert_alpha allows for transparency
+        self.sprite_sheet = self.load_atlas(filename)
         self.animations = {}
+        self.variants = SpriteVariants()
 
         # Load the meta data for the sprite sheet
         self.meta_data = filename.replace('png', 'json')
-        with open(self.meta_data) as f:
-            self.data = json.load(f)
+        self.data = ASSETS.json(self.meta_data)
 
         # Parse the sprite sheet for each entity found in the json file
         for entity_name, entity_data in self.data['entities'].items():
             self.animations[entity_name] = {}
             for animation_name, animation_data in entity_data['animations'].items():
+                if 'frames' in animation_data:
+                    # frames of different sizes, listed one by one
+                    self.animations[entity_name][animation_name] = [
+                        self.get_sprite(frame['x'], frame['y'], frame['w'], frame['h'])
+                        for frame in animation_data['frames']
+                    ]
+                    continue
                 # Save the necessary frames for each animation
                 self.animations[entity_name][animation_name] = self.get_sprites(
                     animation_data['frame_data']['x'],
@@ -35,23 +89,67 @@ class SpriteSheet:
                     animation_data['frame_padding']['y']
                 )
 
+        logger.debug(f"Loaded {filename}: {self.frame_count()} frames, {self.memory_footprint()} bytes of atlas")
+
+    @staticmethod
+    def load_atlas(filename):
+        """Load the sprite sheet image.
+
+        Sheets that are either fully transparent or fully opaque in every pixel are converted to the display format
+        with a colorkey, which blits faster than per-pixel alpha. Anything else keeps its per-pixel alpha.
+
+        :return: Atlas surface
+        """
+        sheet = ASSETS.image(filename).convert_alpha()  # convert_alpha allows for transparency
+        visible = pygame.mask.from_surface(sheet, 0)
+        opaque = pygame.mask.from_surface(sheet, 254)
+        keyed = pygame.mask.from_threshold(sheet, ATLAS_COLORKEY, (1, 1, 1, 255))
+        if visible.count() != opaque.count() or keyed.overlap_area(opaque, (0, 0)):
+            # partially transparent pixels, or the colorkey is used by the sprites
+            return sheet
+
+        atlas = pygame.Surface(sheet.get_size()).convert()
+        atlas.fill(ATLAS_COLORKEY)
+        atlas.blit(sheet, (0, 0))
+        atlas.set_colorkey(ATLAS_COLORKEY)
+        return atlas
+
+    def get(self, frame, flip_x=False, rotate=0, tint=None):
+        """Get a flipped, rotated or tinted frame of one of the animations, see SpriteVariants.get().
+
+        :return: Sprite surface
+        """
+        return self.variants.get(frame, flip_x, rotate, tint)
+
+    def frame_count(self):
+        """Count the frames of all of the animations.
+
+        :return: int
+        """
+        return sum(len(frames) for animations in self.animations.values() for frames in animations.values())
+
+    def memory_footprint(self):
+        """Get the memory used by the atlas pixels. The frames are views into the atlas and don't add to it.
+
+        :return: Size in bytes
+        """
+        return self.sprite_sheet.get_pitch() * self.sprite_sheet.get_height()
+
     def get_sprite(self, x, y, width, height):
         """Get a single sprite from the sprite sheet.
         
-        :return: Sprite surface
+        :return: Sprite surface, a subsurface of the atlas. Don't draw on it.
         """
 
-        sprite = pygame.Surface((width, height)).convert()              # define an empty surface
-        sprite.blit(self.sprite_sheet, (0, 0), (x, y, width, height))   # copy the sprite from the sprite sheet to the surface
-        return sprite                                                   # return the surface
-    
+        return self.sprite_sheet.subsurface((x, y, width, height))
+
     def get_sprites(self, x, y, width, height, rows, cols, x_padding=0, y_padding=0):
         """Get a grid of sprites from the sprite sheet.
         
         :return: List of sprite surfaces
         """
 
-        # TODO: Right now this only works for a grid of same-size sprites. This may need updated if the sprites in the sheet aren't uniform in size.
+        # Sprites of different sizes are listed one by one under 'frames' in the json file instead.
         sprites = []        
         for row in range(rows):
             #row padding
@@ -0,0 +1,186 @@
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, the swarm moves its members one at a time without it
+    np = None
+
+# CONSTANTS
+REACHED_TOLERANCE = 2  # pixels, same as PhysicsEntity.reached_target()
+COMPACT_FRACTION = 0.25  # drop the rows of killed members once they are this fraction of the arrays
+
+
+class Swarm(pygame.sprite.Group):
+    """
+    Group of entities that only ever step torwards a target, like the grunts, progs and family.
+
+    The positions and targets of the members live in numpy arrays owned by the swarm, so move() moves every member in
+    a single vectorized pass: a step of scaler along the sign of the distance to the target on each axis, clamped
+    inside the active area, the same as PhysicsEntity.move_to_target(). Only the pos, rect and animation of the
+    members are written back. Members join and leave like any other group, with add() and kill().
+
+    Without numpy, move() steps the members one at a time with the same math.
+    """
+
+    def __init__(self, game, scaler, move_interval=1, chase_hero=False, move_sound=None):
+        """
+        :param game: Game object
+        :param float scaler: Movement per step on each axis in pixels, already scaled to the tick length
+        :param int move_interval: Ticks, all of the members step together once every move_interval ticks
+        :param bool chase_hero: True to move torwards the hero, around the obstacles of game.hero_field,
+            False to wander between random targets
+        :param str or None move_sound: Sound played once every time the members step
+        """
+        super().__init__()
+        self.game = game
+        self.scaler = scaler
+        self.move_interval = move_interval
+        self.move_timer = move_interval
+        self.chase_hero = chase_hero
+        self.move_sound = move_sound
+
+        self.members = []  # slot: sprite, None if the sprite was killed since the arrays were last compacted
+        self.slots = {}  # sprite: slot
+        self.joining = {}  # sprites added since the last move(), given a slot at the start of the next one
+        self.killed = 0  # number of None slots in self.members
+        if np is not None:
+            self.pos = np.empty((0, 2))
+            self.target = np.empty((0, 2))
+            self.size = np.empty((0, 2))
+            self.alive = np.empty(0, dtype=bool)
+
+    def add_internal(self, sprite, layer=None):
+        if not self.spritedict:
+            # a new wave, start counting down to the first step
+            self.move_timer = self.move_interval
+        super().add_internal(sprite, layer)
+        if np is not None:
+            self.joining[sprite] = None
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        if np is None:
+            return
+        slot = self.slots.pop(sprite, None)
+        if slot is None:
+            del self.joining[sprite]
+            return
+        self.members[slot] = None
+        self.alive[slot] = False
+        self.killed += 1
+
+    def move(self):
+        """
+        Step the members torwards their targets, if it is time to.
+
+        :return: None
+        """
+        if not self.spritedict:
+            return
+        self.move_timer -= 1
+        if self.move_timer > 0:
+            return
+        self.move_timer = self.move_interval
+
+        if np is None:
+            self.move_python()
+        else:
+            self.move_numpy()
+
+        if self.move_sound is not None:
+            self.game.audio.play(self.move_sound)
+
+    def sync(self):
+        """
+        Give the sprites that joined since the last move() a slot in the arrays,
+        and drop the slots of killed sprites once there are enough of them.
+
+        :return: None
+        """
+        if self.killed > len(self.members) * COMPACT_FRACTION:
+            keep = self.alive
+            self.members = [sprite for sprite in self.members if sprite is not None]
+            self.slots = {sprite: slot for slot, sprite in enumerate(self.members)}
+            self.pos = self.pos[keep]
+            self.target = self.target[keep]
+            self.size = self.size[keep]
+            self.alive = self.alive[keep]
+            self.killed = 0
+
+        if self.joining:
+            for sprite in self.joining:
+                self.slots[sprite] = len(self.members)
+                self.members.append(sprite)
+            joining = list(self.joining)
+            self.joining = {}
+            self.pos = np.concatenate((self.pos, [sprite.pos for sprite in joining]))
+            self.target = np.concatenate((self.target, [getattr(sprite, "target_posit", sprite.pos)
+                                                        for sprite in joining]))
+            self.size = np.concatenate((self.size, [sprite.rect.size for sprite in joining]))
+            self.alive = np.concatenate((self.alive, np.ones(len(joining), dtype=bool)))
+
+    def move_numpy(self):
+        """
+        Vectorized step of every member.
+
+        :return: None
+        """
+        self.sync()
+        area = self.game.active_area
+        alive = self.alive
+
+        if self.chase_hero:
+            target = np.array((self.game.hero.rect.x, self.game.hero.rect.y), dtype=np.float64)
+        else:
+            # members that reached their target pick a new one, in group order so the rng draws are reproducible
+            reached = alive & np.all(np.abs(self.pos - self.target) < REACHED_TOLERANCE, axis=1)
+            for slot in np.flatnonzero(reached).tolist():
+                sprite = self.members[slot]
+                sprite.target_posit = sprite.random_movement()
+                self.target[slot] = sprite.target_posit
+            target = self.target
+
+        # direction_to_target() measures from the rect, pygame rounds the position to get it
+        rect_pos = np.floor(self.pos + 0.5)
+        direction = np.sign(target - rect_pos)
+        if self.chase_hero:
+            direction = self.game.hero_field.steer_array(rect_pos, direction)
+        movement = direction * self.scaler
+        pos = self.pos + movement
+        np.clip(pos, (area.left, area.top), np.array((area.right, area.bottom)) - self.size, out=pos)
+        self.pos = pos
+
+        # write back the members that are still alive
+        slots = np.flatnonzero(alive)
+        members = self.members
+        for slot, (x, y), frame_movement in zip(slots.tolist(), pos[slots].tolist(), movement[slots].tolist()):
+            sprite = members[slot]
+            sprite.pos[0] = x
+            sprite.pos[1] = y
+            sprite.rect.topleft = (x, y)
+            sprite.animate(frame_movement)
+
+    def move_python(self):
+        """
+        Same as move_numpy(), one member at a time.
+
+        :return: None
+        """
+        area = self.game.active_area
+        for sprite in self.sprites():
+            if self.chase_hero:
+                target = (self.game.hero.rect.x, self.game.hero.rect.y)
+            else:
+                sprite.target_posit = sprite.reached_target(sprite.target_posit)
+                target = sprite.target_posit
+
+            rect = sprite.rect
+            direction = ((target[0] > rect.x) - (target[0] < rect.x), (target[1] > rect.y) - (target[1] < rect.y))
+            if self.chase_hero:
+                direction = self.game.hero_field.steer(rect.x, rect.y, direction)
+            move_x = direction[0] * self.scaler
+            move_y = direction[1] * self.scaler
+            sprite.pos[0] = min(max(sprite.pos[0] + move_x, area.left), area.right - rect.w)
+            sprite.pos[1] = min(max(sprite.pos[1] + move_y, area.top), area.bottom - rect.h)
+            rect.topleft = (sprite.pos[0], sprite.pos[1])
+            sprite.animate([move_x, move_y])
@@ -1,14 +1,15 @@
 from entities.entities import PhysicsEntity
 from projectiles.tank_projectiles import TankProjectiles
-from pygame import transform
+from sprite_pool import get_pool
 import logging
 
 logger = logging.getLogger(__name__)
 
 # CONSTANTS
-FIRE_RATE = 90  # frames, time before firing another projectile
+FIRE_RATE = 1500  # ms, time before firing another projectile
 TANK_SPEED_SCALER = 0.4  # Scales the speed of the tank
 PROJECTILE_LIMIT = 20  # The tank has a limit of projectiles before running out of ammo
+ANIM_FLIPBOOK = (0, 1, 2, 3)  # the tank cycles through all four of its images
 
 class Tank(PhysicsEntity):
     """
@@ -17,15 +18,18 @@ class Tank(PhysicsEntity):
 
     def __init__(self, game, pos, size):
         super().__init__(game, "tank", pos, size)
+
+    def reset(self, pos, size):
+        super().reset(pos, size)
         self.image = self.game.robotrons_animations.animations[self.e_type]["0"][0]
         self.spawn_frames = 4  # dictated by the spritesheet
 
         # override default animation logic
-        self.anim_flipbook = [0, 1, 2, 3]  # dictated by the spritesheet
+        self.anim_flipbook = ANIM_FLIPBOOK  # dictated by the spritesheet
         self.flipbook_index = 0
 
         self.projectile_reload = 0
-        self.projectile_timer = FIRE_RATE
+        self.projectile_timer = self.game.sim_clock.ms_to_ticks(FIRE_RATE)  # ticks
         self.projectile_limit = PROJECTILE_LIMIT
 
         self.target_posit = self.random_movement()
@@ -37,7 +41,7 @@ class Tank(PhysicsEntity):
         :return: None
         """
         if not self.block_actions:
-            projectile = TankProjectiles(self.game, "tank_projectile", self.pos)
+            projectile = get_pool(self.game, TankProjectiles).acquire("tank_projectile", self.pos)
             self.game.enemy_projectiles.add(projectile)
             self.game.allsprites.add(projectile)
             self.game.audio.play("tank_fire")
@@ -63,20 +67,17 @@ class Tank(PhysicsEntity):
             self.iterate_animation_frames()
 
             # switch the image based on x-movement, to have the tank treads move the correct direction
-            if self.pos[0] - self.target_posit[0] <= 0:
-                # moving left to right
-                self.image = self.game.robotrons_animations.animations[self.e_type]["walk"][
-                    self.anim_flipbook[self.flipbook_index]]
-            else:
-                self.image = transform.flip(self.game.robotrons_animations.animations[self.e_type]["walk"][
-                    self.anim_flipbook[self.flipbook_index]], True, False)
+            frame = self.game.robotrons_animations.animations[self.e_type]["walk"][
+                self.anim_flipbook[self.flipbook_index]]
+            # flipped when moving right to left
+            self.image = self.game.robotrons_animations.get(frame, flip_x=self.pos[0] - self.target_posit[0] > 0)
 
             # fire projectiles
             self.projectile_reload -= 1
             if self.projectile_reload <= 0 and self.projectile_limit:
                 # fire torwards the player
                 self.fire_projectile()
-                self.projectile_reload = FIRE_RATE
+                self.projectile_reload = self.game.sim_clock.ms_to_ticks(FIRE_RATE)
                 self.projectile_limit -= 1
 
             # if reached its target, calculate a new target
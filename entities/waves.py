@@ -0,0 +1,70 @@
+import json
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# CONSTANTS
+SPAWN_COUNTS_PATH = Path(__file__).resolve().parent.parent / "data" / "spawn_counts.json"
+WAVE_CYCLE = 5  # the tabulated waves repeat their composition every 5 waves, the brain waves are the 5th of each cycle
+WAVE_GROWTH = 0.1  # extra fraction of the counts of the last tabulated cycle, per generated cycle
+COMPILED_WAVES = 100  # waves compiled up front, the later ones are compiled the first time they are asked for
+
+
+class WaveTable:
+    """
+    Number of entities of each type for every wave.
+
+    The first waves come from data/spawn_counts.json. The waves after the table repeat its last cycle of WAVE_CYCLE
+    waves, growing by WAVE_GROWTH every cycle, so an endurance session never runs out of waves. Every count is then
+    scaled by the stress multiplier, to test the game with thousands of enemies.
+
+    The compositions are compiled into a list once, get() is an index into it.
+    """
+
+    def __init__(self, stress=1.0, path=SPAWN_COUNTS_PATH):
+        """
+        :param float stress: Multiplier of every entity count
+        :param path: Path of the spawn counts json, {e_type: {wave number as a string: count}}
+        """
+        self.stress = stress
+        with open(path) as f:
+            spawn_counts = json.load(f)
+        self.e_types = list(spawn_counts)
+        self.tabulated = []  # composition of every tabulated wave, unscaled. Index 0 is wave 1.
+        wave = 1
+        while all(str(wave) in counts for counts in spawn_counts.values()):
+            self.tabulated.append({e_type: counts[str(wave)] for e_type, counts in spawn_counts.items()})
+            wave += 1
+        if len(self.tabulated) < WAVE_CYCLE:
+            raise ValueError(f"{path} must list at least {WAVE_CYCLE} waves for every entity type")
+
+        self.waves = [{e_type: 0 for e_type in self.e_types}]  # wave 0, before the first wave
+        self.compile(COMPILED_WAVES)
+
+    def compile(self, last_wave):
+        """
+        Compile the compositions up to and including a wave.
+
+        :param int last_wave: Wave number
+        :return: None
+        """
+        for wave in range(len(self.waves), last_wave + 1):
+            if wave <= len(self.tabulated):
+                counts = self.tabulated[wave - 1]
+                growth = 1.0
+            else:
+                # repeat the last cycle of the table, one cycle bigger every time
+                generated = wave - len(self.tabulated) - 1
+                counts = self.tabulated[len(self.tabulated) - WAVE_CYCLE + generated % WAVE_CYCLE]
+                growth = 1.0 + WAVE_GROWTH * (generated // WAVE_CYCLE + 1)
+            self.waves.append({e_type: round(count * growth * self.stress) for e_type, count in counts.items()})
+
+    def get(self, wave):
+        """
+        :param int wave: Wave number, starting at 1
+        :return: dict of {e_type: count}. Don't modify it, it is shared.
+        """
+        if wave >= len(self.waves):
+            self.compile(wave)
+        return self.waves[wave]
@@ -0,0 +1,183 @@
+import itertools
+import logging
+import random
+
+import numpy as np
+
+from game import Game
+
+try:
+    import gymnasium
+except ImportError:  # gymnasium is optional, the env is a gymnasium.Env and describes its spaces with it
+    gymnasium = None
+
+logger = logging.getLogger(__name__)
+
+# CONSTANTS
+CELL_SIZE = 16  # pixels, side of a cell of the occupancy grids
+ACTION_SIZE = 8  # [move left, right, up, down, shoot left, right, up, down]
+MAX_OCCUPANCY = 255  # sprites counted in one cell, the grids are uint8
+
+# Channels of the observation, one occupancy grid each. The robots are put on their channel by e_type.
+CHANNELS = ("hero", "hero_projectile", "grunt", "hulk", "electrode", "brain", "prog", "spawner", "shooter",
+            "enemy_projectile", "family")
+ENEMY_CHANNELS = {
+    "grunt": CHANNELS.index("grunt"),
+    "hulk": CHANNELS.index("hulk"),
+    "electrode": CHANNELS.index("electrode"),
+    "brain": CHANNELS.index("brain"),
+    "prog": CHANNELS.index("prog"),
+    "spheroid": CHANNELS.index("spawner"),
+    "quark": CHANNELS.index("spawner"),
+    "enforcer": CHANNELS.index("shooter"),
+    "tank": CHANNELS.index("shooter"),
+}
+
+# Game groups whose sprites all go on the same channel
+GROUP_CHANNELS = (
+    ("hero_group", CHANNELS.index("hero")),
+    ("hero_projectiles", CHANNELS.index("hero_projectile")),
+    ("enemy_projectiles", CHANNELS.index("enemy_projectile")),
+    ("family_group", CHANNELS.index("family")),
+)
+
+
+class RobotronEnv(gymnasium.Env if gymnasium is not None else object):
+    """
+    Gymnasium wrapper around a headless Game, for training agents as fast as the game logic can be stepped.
+
+    An action is the 8 booleans of the hero inputs: the movement then the shooting, each [left, right, up, down]. An
+    observation is a uint8 array of shape (len(CHANNELS), rows, cols), one grid over the active area per kind of
+    sprite, counting the sprites whose rect center is in each cell. Nothing is ever drawn.
+
+    The ticks the hero can't act in, the wave transitions and the robots converging, are stepped through inside
+    step() and reset(), so every step is one the action matters for. The reward is the score earned.
+
+    If gymnasium is installed, this is a gymnasium.Env with an action_space and an observation_space. Without it the
+    API is the same.
+
+    Usage:
+        env = RobotronEnv()
+        observation, info = env.reset(seed=2084)
+        observation, reward, terminated, truncated, info = env.step([False, True, False, False] * 2)
+    """
+
+    def __init__(self, cell_size=CELL_SIZE, frame_skip=1, max_episode_steps=None, stress=1.0):
+        """
+        :param int cell_size: Pixels, side of a cell of the occupancy grids
+        :param int frame_skip: Ticks every action is held for, the rewards of all of them are added up
+        :param int or None max_episode_steps: Steps after which an episode is truncated, None for no limit
+        :param float stress: Multiplier of the number of entities in every wave, see WaveTable
+        """
+        self.cell_size = cell_size
+        self.frame_skip = frame_skip
+        self.max_episode_steps = max_episode_steps
+        self.stress = stress
+
+        self.game = None
+        self.seed_rng = random.Random()  # seeds of the episodes reset without one
+        self.episode_steps = 0
+
+        # the size of the active area comes from the HUD, a throwaway game gives it
+        area = Game(headless=True, seed=0).active_area
+        self.cols = -(-area.width // self.cell_size)
+        self.rows = -(-area.height // self.cell_size)
+        self.observation_shape = (len(CHANNELS), self.rows, self.cols)
+
+        if gymnasium is not None:
+            self.action_space = gymnasium.spaces.MultiBinary(ACTION_SIZE)
+            self.observation_space = gymnasium.spaces.Box(0, MAX_OCCUPANCY, self.observation_shape, np.uint8)
+
+    def reset(self, seed=None, options=None):
+        """
+        Start a new game.
+
+        :param int or None seed: Seed of the game. If None, the next seed drawn from the last seed given.
+        :param dict or None options: Unused, part of the gymnasium reset() signature
+        :return: (observation, info)
+        """
+        if gymnasium is not None:
+            super().reset(seed=seed)  # seeds gymnasium's np_random, the game itself only uses its own seed
+        if seed is not None:
+            self.seed_rng.seed(seed)
+        else:
+            seed = self.seed_rng.randrange(2 ** 32)
+
+        self.game = Game(headless=True, seed=seed, stress=self.stress)
+        self.episode_steps = 0
+
+        skipped = self.skip_transitions()
+        return self.observe(), {"seed": seed, "skipped_ticks": skipped, **self.stats()}
+
+    def step(self, action):
+        """
+        Hold the action for frame_skip ticks, then step through any transition that follows.
+
+        :param action: 8 booleans, the hero movement then the hero shooting, each [left, right, up, down]
+        :return: (observation, reward, terminated, truncated, info)
+        """
+        game = self.game
+        inputs = ([bool(pressed) for pressed in action[:4]], [bool(pressed) for pressed in action[4:ACTION_SIZE]])
+        score = game.score_count
+        lives = game.life_count
+
+        for _ in range(self.frame_skip):
+            game.step(inputs)
+            if game.game_over:
+                break
+        skipped = self.skip_transitions()
+        self.episode_steps += 1
+
+        info = {"skipped_ticks": skipped, "lives_lost": max(lives - game.life_count, 0), **self.stats()}
+        truncated = self.max_episode_steps is not None and self.episode_steps >= self.max_episode_steps
+        return self.observe(), game.score_count - score, game.game_over, truncated and not game.game_over, info
+
+    def skip_transitions(self):
+        """
+        Step the game with no inputs until the robots move again, or the game is over.
+
+        :return: number of ticks stepped
+        """
+        game = self.game
+        no_inputs = ([False, False, False, False], [False, False, False, False])
+        ticks = 0
+        while (game.pause_entity_movement or game.transition_flag) and not game.game_over:
+            game.step(no_inputs)
+            ticks += 1
+        return ticks
+
+    def stats(self):
+        """
+        Counters of the game, added to the info of every step.
+
+        :return: dict
+        """
+        return {"wave": self.game.wave_count, "lives": self.game.life_count, "score": self.game.score_count}
+
+    def observe(self):
+        """
+        Count the sprites of every channel in every cell.
+
+        :return: uint8 numpy array of observation_shape
+        """
+        game = self.game
+        centers = []
+        channels = []
+        for group_name, channel in GROUP_CHANNELS:
+            group_centers = [sprite.rect.center for sprite in getattr(game, group_name).spritedict]
+            centers += group_centers
+            channels += [channel] * len(group_centers)
+        enemies = game.enemy_group.spritedict
+        centers += [sprite.rect.center for sprite in enemies]
+        channels += [ENEMY_CHANNELS[sprite.e_type] for sprite in enemies]
+
+        area = game.active_area
+        cells = np.fromiter(itertools.chain.from_iterable(centers), dtype=np.intp, count=2 * len(centers))
+        cells = (cells.reshape(-1, 2) - (area.left, area.top)) // self.cell_size
+        np.maximum(cells, 0, out=cells)
+        np.minimum(cells, (self.cols - 1, self.rows - 1), out=cells)
+        cells = (np.array(channels) * self.rows + cells[:, 1]) * self.cols + cells[:, 0]
+        counts = np.bincount(cells, minlength=len(CHANNELS) * self.rows * self.cols)
+        if counts.max() > MAX_OCCUPANCY:
+            np.minimum(counts, MAX_OCCUPANCY, out=counts)
+        return counts.astype(np.uint8).reshape(self.observation_shape)
@@ -0,0 +1,158 @@
+import logging
+import multiprocessing
+
+import numpy as np
+
+from envs.robotron_env import RobotronEnv
+
+logger = logging.getLogger(__name__)
+
+
+class VectorEnv:
+    """
+    Many RobotronEnv stepped in lockstep, taking and returning batches: one row of actions per env in, one stacked
+    observation, reward, terminated and truncated per env out.
+
+    With workers=0 the envs are stepped one after the other in this process. Otherwise they are split between worker
+    subprocesses, which step their share at the same time, and only the actions and the stacked results cross the
+    pipes.
+
+    An env whose episode ended is reset in the same step. Its row of the observations is then the first observation of
+    the new episode, and the last one of the old episode is in its info as "final_observation".
+
+    Usage:
+        envs = VectorEnv(16, workers=4)
+        observations, infos = envs.reset(seed=2084)
+        observations, rewards, terminated, truncated, infos = envs.step(actions)  # actions of shape (16, 8)
+        envs.close()
+    """
+
+    def __init__(self, num_envs, workers=0, **env_kwargs):
+        """
+        :param int num_envs: Number of envs
+        :param int workers: Number of worker subprocesses, 0 to step every env in this process
+        :param env_kwargs: Arguments of every RobotronEnv
+        """
+        self.num_envs = num_envs
+        self.workers = min(workers, num_envs)
+        self.envs = []
+        self.connections = []
+        self.processes = []
+        self.slices = []  # (start, stop) of the envs of every worker
+
+        if not self.workers:
+            self.envs = [RobotronEnv(**env_kwargs) for _ in range(num_envs)]
+            return
+
+        for worker in range(self.workers):
+            start = num_envs * worker // self.workers
+            stop = num_envs * (worker + 1) // self.workers
+            connection, worker_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_worker, args=(worker_connection, stop - start, env_kwargs),
+                                              daemon=True)
+            process.start()
+            worker_connection.close()
+            self.connections.append(connection)
+            self.processes.append(process)
+            self.slices.append((start, stop))
+
+    def reset(self, seed=None):
+        """
+        Start a new game in every env.
+
+        :param int or None seed: Seed of the first env, the others count up from it. If None, every env draws its seed.
+        :return: (observations, infos)
+        """
+        seeds = [None if seed is None else seed + i for i in range(self.num_envs)]
+        if not self.workers:
+            results = [env.reset(seed=env_seed) for env, env_seed in zip(self.envs, seeds)]
+            return np.stack([observation for observation, _ in results]), [info for _, info in results]
+
+        for connection, (start, stop) in zip(self.connections, self.slices):
+            connection.send(("reset", seeds[start:stop]))
+        observations = []
+        infos = []
+        for connection in self.connections:
+            worker_observations, worker_infos = connection.recv()
+            observations.append(worker_observations)
+            infos.extend(worker_infos)
+        return np.concatenate(observations), infos
+
+    def step(self, actions):
+        """
+        Step every env with its row of the actions.
+
+        :param actions: Array-like of shape (num_envs, 8), see RobotronEnv.step()
+        :return: (observations, rewards, terminated, truncated, infos)
+        """
+        if not self.workers:
+            return self.step_envs(actions)
+
+        actions = np.asarray(actions, dtype=bool)
+        for connection, (start, stop) in zip(self.connections, self.slices):
+            connection.send(("step", actions[start:stop]))
+        results = [connection.recv() for connection in self.connections]
+        infos = [info for result in results for info in result[4]]
+        return (np.concatenate([result[0] for result in results]), np.concatenate([result[1] for result in results]),
+                np.concatenate([result[2] for result in results]), np.concatenate([result[3] for result in results]),
+                infos)
+
+    def step_envs(self, actions):
+        """
+        step() of the envs in this process, resetting the ones whose episode ended.
+
+        :param actions: Array-like of shape (len(self.envs), 8)
+        :return: (observations, rewards, terminated, truncated, infos)
+        """
+        count = len(self.envs)
+        observations = np.empty((count, *self.envs[0].observation_shape), dtype=np.uint8)
+        rewards = np.empty(count)
+        terminated = np.empty(count, dtype=bool)
+        truncated = np.empty(count, dtype=bool)
+        infos = []
+        for i, (env, action) in enumerate(zip(self.envs, actions)):
+            observation, rewards[i], terminated[i], truncated[i], info = env.step(action)
+            if terminated[i] or truncated[i]:
+                info["final_observation"] = observation
+                observation, reset_info = env.reset()
+                info["reset_info"] = reset_info
+            observations[i] = observation
+            infos.append(info)
+        return observations, rewards, terminated, truncated, infos
+
+    def close(self):
+        """
+        Stop the worker subprocesses.
+
+        :return: None
+        """
+        for connection in self.connections:
+            connection.send(("close", None))
+            connection.close()
+        for process in self.processes:
+            process.join()
+        self.connections = []
+        self.processes = []
+
+
+def _worker(connection, num_envs, env_kwargs):
+    """
+    Loop of a worker subprocess, stepping its envs in lockstep on the commands of the VectorEnv.
+
+    :param connection: multiprocessing Connection to the VectorEnv
+    :param int num_envs: Number of envs of this worker
+    :param dict env_kwargs: Arguments of every RobotronEnv
+    :return: None
+    """
+    logging.getLogger().setLevel(logging.WARNING)  # the game logs at DEBUG level
+    envs = VectorEnv(num_envs, **env_kwargs)
+    while True:
+        command, data = connection.recv()
+        if command == "reset":
+            results = [env.reset(seed=seed) for env, seed in zip(envs.envs, data)]
+            connection.send((np.stack([observation for observation, _ in results]), [info for _, info in results]))
+        elif command == "step":
+            connection.send(envs.step_envs(data))
+        else:
+            connection.close()
+            return
@@ -0,0 +1,203 @@
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, steer_array() is only used by the vectorized swarm
+    np = None
+
+# CONSTANTS
+CELL_SIZE = 16  # pixels, side of a cell of the grid. About a hulk's width, a few grunt steps.
+OBSTACLE_COST = 4  # steps, the cost of entering a cell an electrode or hulk overlaps. A short detour is cheaper.
+NEIGHBORS = ((0, -1), (-1, 0), (1, 0), (0, 1), (-1, -1), (1, -1), (-1, 1), (1, 1))  # straight steps win ties
+
+
+class FlowField:
+    """
+    Distances to the hero over a coarse grid of the active area, shared by every enemy that chases the hero.
+
+    The enemies step diagonally as fast as they step straight, so the distance is counted in 8-connected steps between
+    cells. The cells overlapped by an electrode or a hulk are soft obstacles: entering one costs OBSTACLE_COST steps, so
+    the chasers go around a lone obstacle but still push through a wall of them if that is shorter.
+
+    The field is kept up to date by the first query of a tick. It is only searched again when the hero or an obstacle
+    changes cells, and not at all while there are no obstacles, since the straight line is then always the shortest.
+
+    steer() keeps the step straight at the hero, the way every chaser moved before there was a field, unless that step
+    leads into a cell farther from the hero than the best neighbor of the chaser's cell. Only then does the chaser take
+    the step the field points to.
+    """
+
+    def __init__(self, game, obstacle_groups):
+        """
+        :param game: Game object
+        :param obstacle_groups: Groups of the sprites that are soft obstacles
+        """
+        self.game = game
+        self.obstacle_groups = obstacle_groups
+        self.area = game.active_area
+        self.cols = -(-self.area.width // CELL_SIZE)
+        self.rows = -(-self.area.height // CELL_SIZE)
+
+        # cell: list of (neighbor cell, dx, dy), in NEIGHBORS order
+        self.neighbors = []
+        for row in range(self.rows):
+            for col in range(self.cols):
+                self.neighbors.append([((row + dy) * self.cols + col + dx, dx, dy) for dx, dy in NEIGHBORS
+                                       if 0 <= col + dx < self.cols and 0 <= row + dy < self.rows])
+
+        self.updated_tick = None  # sim_clock tick the field was last checked on
+        self.key = None  # (hero cell, obstacle cells) the field was searched for
+        self.open = True  # True while there are no obstacles, steer() then never changes the step
+        self.distance = []  # cell: steps to the hero's cell
+        self.closest_neighbors = {}  # cell: (neighbor cell, dx, dy), filled in by closest_neighbor()
+        if np is not None:
+            self.distance_array = None  # same as self.distance
+            self.best_array = None  # cell: distance of the closest neighbor
+            self.steps_array = None  # cell: (dx, dy) step torwards the closest neighbor
+
+    def cell(self, x, y):
+        """
+        The cell a position is in, positions outside the area are moved to the closest cell.
+
+        :param x: x position
+        :param y: y position
+        :return: (col, row)
+        """
+        col = min(max(int((x - self.area.left) // CELL_SIZE), 0), self.cols - 1)
+        row = min(max(int((y - self.area.top) // CELL_SIZE), 0), self.rows - 1)
+        return col, row
+
+    def obstacle_cells(self):
+        """
+        Every cell overlapped by an obstacle.
+
+        :return: sorted tuple of cells
+        """
+        cells = set()
+        for group in self.obstacle_groups:
+            for sprite in group.spritedict:
+                rect = sprite.rect
+                col0, row0 = self.cell(rect.left, rect.top)
+                col1, row1 = self.cell(rect.right - 1, rect.bottom - 1)
+                for row in range(row0, row1 + 1):
+                    for col in range(col0, col1 + 1):
+                        cells.add(row * self.cols + col)
+        return tuple(sorted(cells))
+
+    def update(self):
+        """
+        Search the field again if the hero or an obstacle changed cells since the last search.
+
+        :return: None
+        """
+        tick = self.game.sim_clock.ticks
+        if tick == self.updated_tick:
+            return
+        self.updated_tick = tick
+
+        hero_col, hero_row = self.cell(self.game.hero.rect.x, self.game.hero.rect.y)
+        key = (hero_row * self.cols + hero_col, self.obstacle_cells())
+        if key == self.key:
+            return
+        self.key = key
+        self.open = not key[1]
+        if not self.open:
+            self.search(*key)
+
+    def search(self, start, obstacles):
+        """
+        Dial's algorithm from the hero's cell, a breadth first search with one bucket per distance.
+
+        :param int start: Cell of the hero
+        :param obstacles: Cells that cost OBSTACLE_COST to enter
+        :return: None
+        """
+        cost = [1] * (self.cols * self.rows)
+        for cell in obstacles:
+            cost[cell] = OBSTACLE_COST
+
+        unreached = self.cols * self.rows * OBSTACLE_COST
+        distance = [unreached] * len(cost)
+        distance[start] = 0
+        buckets = [[start]]
+        steps_taken = 0
+        while steps_taken < len(buckets):
+            for cell in buckets[steps_taken]:
+                if distance[cell] != steps_taken:
+                    continue  # reached for less after it was put in this bucket
+                for neighbor, _, _ in self.neighbors[cell]:
+                    new_distance = steps_taken + cost[neighbor]
+                    if new_distance < distance[neighbor]:
+                        distance[neighbor] = new_distance
+                        while len(buckets) <= new_distance:
+                            buckets.append([])
+                        buckets[new_distance].append(neighbor)
+            steps_taken += 1
+
+        self.distance = distance
+        self.closest_neighbors = {}
+        if np is not None:
+            # the closest neighbor of every cell at once, the edges padded with a distance never reached
+            padded = np.full((self.rows + 2, self.cols + 2), unreached + 1)
+            padded[1:-1, 1:-1] = np.reshape(distance, (self.rows, self.cols))
+            around = np.stack([padded[1 + dy:1 + dy + self.rows, 1 + dx:1 + dx + self.cols].ravel()
+                               for dx, dy in NEIGHBORS])
+            closest = around.argmin(axis=0)  # the first of equals, like min()
+            self.distance_array = padded[1:-1, 1:-1].ravel()
+            self.best_array = around[closest, np.arange(closest.size)]
+            self.steps_array = np.array(NEIGHBORS, dtype=np.float64)[closest]
+
+    def closest_neighbor(self, cell):
+        """
+        The neighbor of a cell closest to the hero, worked out the first time a chaser in the cell asks for it.
+
+        :param int cell: Cell of the grid
+        :return: (neighbor cell, dx, dy)
+        """
+        closest = self.closest_neighbors.get(cell)
+        if closest is None:
+            distance = self.distance
+            closest = min(self.neighbors[cell], key=lambda neighbor: distance[neighbor[0]])
+            self.closest_neighbors[cell] = closest
+        return closest
+
+    def steer(self, x, y, direction):
+        """
+        The step of one chaser.
+
+        :param x: x of the chaser's rect
+        :param y: y of the chaser's rect
+        :param direction: (x, y) step straight at the hero, each -1, 0 or 1, see PhysicsEntity.direction_to_target()
+        :return: (x, y) step, direction unless an obstacle is in the way
+        """
+        self.update()
+        if self.open:
+            return direction
+        col, row = self.cell(x, y)
+        cell = row * self.cols + col
+        if self.distance[cell] == 0:
+            return direction  # in the hero's cell, nothing left to go around
+        ahead_col = min(max(col + direction[0], 0), self.cols - 1)
+        ahead_row = min(max(row + direction[1], 0), self.rows - 1)
+        closest, step_x, step_y = self.closest_neighbor(cell)
+        if self.distance[ahead_row * self.cols + ahead_col] <= self.distance[closest]:
+            return direction
+        return step_x, step_y
+
+    def steer_array(self, rect_pos, direction):
+        """
+        steer() for many chasers at once.
+
+        :param rect_pos: numpy array of the (x, y) of the chasers' rects
+        :param direction: numpy array of the (x, y) steps straight at the hero
+        :return: numpy array of the (x, y) steps
+        """
+        self.update()
+        if self.open:
+            return direction
+        col = np.clip((rect_pos[:, 0] - self.area.left) // CELL_SIZE, 0, self.cols - 1).astype(np.intp)
+        row = np.clip((rect_pos[:, 1] - self.area.top) // CELL_SIZE, 0, self.rows - 1).astype(np.intp)
+        cell = row * self.cols + col
+        ahead_col = np.clip(col + direction[:, 0].astype(np.intp), 0, self.cols - 1)
+        ahead_row = np.clip(row + direction[:, 1].astype(np.intp), 0, self.rows - 1)
+        straight = ((self.distance_array[ahead_row * self.cols + ahead_col] <= self.best_array[cell])
+                    | (self.distance_array[cell] == 0))
+        return np.where(straight[:, None], direction, self.steps_array[cell])
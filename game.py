@@ -1,4 +1,6 @@
+import os
 import sys
+import math
 import pygame
 import logging
 import random
@@ -9,12 +11,25 @@ from entities.hero import Hero
 from entities.spawner import Spawner
 from utils import load_image
 from hud import HUD
-from entities.spritesheet import SpriteSheet
+from entities.spritesheet import SpriteSheet, SpriteVariants
 from scoring import Scoring
+from recorder import InputRecorder
+from profiler import FrameProfiler
+from spatial import SpatialHash
+from proximity import ProximityIndex
+from flow_field import FlowField
+from dirty_rects import DirtySurface
+from entities.swarm import Swarm
+from projectiles.projectile_pool import ProjectilePool
+from entities.waves import WaveTable
+from entities.grunt import MOVE_AT_TIME as GRUNT_MOVE_AT_TIME, GRUNT_MOVEMENT_SCALER
+from entities.prog import PROG_MOVEMENT_SCALER
+from entities.family import FAMILY_MOVEMENT_SCALER
+from sim_clock import SimClock
 from animations.explode import ExplodeAnimations
-from animations.converge import ConvergenceAnimations
+from animations.converge import ConvergenceAnimations, ANIMATION_DURATION as CONVERGE_DURATION
 from animations.float import FloatingAnimations
-from animations.transitions import Transitions
+from animations.transitions import Transitions, SCREEN_COVERED_TIME
 from animations.shrink import ShrinkAnimations
 
 logging.basicConfig(format='%(name)s %(levelname)s %(asctime)s %(module)s (line: %(lineno)d) -- %(message)s',
@@ -27,24 +42,72 @@ WAVE_COUNT = 0
 LIFE_COUNT = 5
 
 # HERO CONSTANTS
-HERO_INVULN_TIME = 90  # set the hero invulnerable for 1.5 seconds
+HERO_INVULN_TIME = 1500  # ms, set the hero invulnerable for 1.5 seconds
 
-# TRANSITION CONSTANTS
-TRANSITION_TIMER = 30  # frames, tied to the length of the Squares transition animation
-SPAWN_TIMER = 90  # frames, tied to the duration set in ConvergenceAnimation
+# LOOP CONSTANTS
+TICK_RATE = 60  # logic ticks per second, the timers and speeds are converted for any other rate by SimClock
+RENDER_FPS = 60  # rendered frames per second, 0 for uncapped
+MAX_FRAME_TIME = 250  # ms, cap on the time simulated per rendered frame, so a long hitch can't snowball
+INTERPOLATION_SNAP_DISTANCE = 32  # pixels per reference tick, sprites that moved further in a tick (respawns) snap
 
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False, tick_rate=TICK_RATE, render_fps=RENDER_FPS, seed=None, record_path=None,
+                 profile_path=None, dirty_rects=False, stress=1.0):
+        """
+        :param bool headless: Run without a window or audio. Only the game logic is stepped, see step().
+        :param int tick_rate: Logic ticks per second. The game plays at the same speed at any rate, a lower one is
+            cheaper and coarser. Rendering is decoupled from this, see main().
+        :param int render_fps: Cap on the rendered frames per second, 0 for uncapped.
+        :param int or None seed: Seed for all of the gameplay randomness. Picked at random if None.
+        :param str or None record_path: If given, the hero inputs of every tick are recorded and saved here on quit.
+        :param str or None profile_path: If given, the per-phase frame timings are saved to this csv on quit.
+        :param bool dirty_rects: Only erase and present the parts of the frame that changed, see DirtySurface.
+        :param float stress: Multiplier of the number of entities in every wave, see WaveTable.
+        """
+        self.headless = headless
+
+        # All of the gameplay randomness comes from this RNG, so a game can be replayed from its seed and inputs
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        # Cosmetic randomness (transition squares, convergence directions) has its own RNG,
+        # so drawing or not drawing the animations never changes the gameplay.
+        self.fx_rng = random.Random(self.seed)
+
+        self.record_path = record_path
+        self.recorder = InputRecorder(self.seed, tick_rate, stress) if self.record_path else None
+
+        self.waves = WaveTable(stress=stress)  # number of entities of each type in every wave
+
+        # Per-phase frame timings, F3 toggles the on-screen table
+        self.profiler = FrameProfiler()
+        self.profile_path = profile_path
+        self.show_profiler = False
+        self.render_fps = render_fps
+        if self.headless:
+            # SDL still needs a video driver for surfaces and fonts, it just never has to show anything
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
         pygame.init()
 
         pygame.display.set_caption("robotron")
-        self.screen = pygame.display.set_mode((1280, 960))  # Top-left is 0-0
+        if self.headless:
+            # convert() and convert_alpha() need a display mode to be set, even if it is never flipped
+            self.screen = pygame.display.set_mode((1, 1))
+        else:
+            self.screen = pygame.display.set_mode((1280, 960))  # Top-left is 0-0
         # Put assets onto the display. Display will then be projected onto the screen for a more pixel-art look.
-        self.display = pygame.Surface((640, 480))
+        self.dirty_rects = dirty_rects
+        if self.dirty_rects:
+            self.display = DirtySurface((640, 480))
+        else:
+            self.display = pygame.Surface((640, 480))
 
         self.clock = pygame.time.Clock()
+        self.sim_clock = SimClock(tick_rate)  # game time, read by every animation and timer
+        self.prev_positions = {}  # sprite: rect.topleft before the last step(), used to interpolate rendering
 
-        self.audio = Audio() # initialize audio manager
+        self.audio = Audio(enabled=not self.headless)  # initialize audio manager
 
         self.hero_movement = [False, False, False, False]  # [left, right, up, down]
         self.hero_shooting = [False, False, False, False]  # [left, right, up, down]
@@ -56,6 +119,7 @@ class Game:
             "brain_projectile": load_image("projectiles/brain_projectile.png"),
             "skull_and_bones": load_image("skull_and_bones.png")
         }
+        self.asset_variants = SpriteVariants()  # flipped, rotated and tinted assets
 
         # pixel size of sprite
         self.grunt_size = (9, 13)
@@ -80,6 +144,8 @@ class Game:
         self.score_count = SCORE_COUNT
         self.wave_count = WAVE_COUNT
         self.life_count = LIFE_COUNT
+        self.family_saved_count = 0  # humans rescued by the hero this game
+        self.family_lost_count = 0  # humans killed by the hulks or turned into progs by the brains this game
 
         # initalize the score counter
         self.scoring = Scoring(self)
@@ -97,12 +163,13 @@ class Game:
         self.shrink_list = []
         self.floating_animations = FloatingAnimations(self)
         self.transition_squares = None  # will hold the Squares class
-        self.transition_timer = TRANSITION_TIMER  # tied to the Squares class square_dur attribute
+        # ticks until the Squares transition covers the screen
+        self.transition_timer = self.sim_clock.ms_to_ticks(SCREEN_COVERED_TIME)
         self.transition_flag = True  # Indicates when the squares transition animation is active
         self.level_transition = False  # Stops entity movement after level complete, resets once transition fill the screen
         self.first_wave = True  # Tells the Squares animation whether to draw a black screen or not to block the HUD
 
-        self.spawn_timer = SPAWN_TIMER  # tied to the duration set in ConvergenceAnimation
+        self.spawn_timer = self.sim_clock.ms_to_ticks(CONVERGE_DURATION)  # ticks, the ConvergenceAnimation duration
         self.spawn_counter = 0
         self.pause_entity_movement = True  # This flag is active when entities are spawning into the map, blocks entity updates+movement
 
@@ -120,25 +187,53 @@ class Game:
         self.hero_group.add(self.hero)
         self.allsprites.add(self.hero)
 
+        # Dead sprites of every class, recycled by the next one spawned, see SpritePool
+        self.sprite_pools = {}
+
         # Projectile holder
         self.hero_projectiles = pygame.sprite.Group()
-        self.enemy_projectiles = pygame.sprite.Group()
+        self.enemy_projectiles = ProjectilePool(self)
 
         # Enemy groups
         self.spawner = Spawner(self)
         self.grunts_group = pygame.sprite.Group()
         self.enemy_group = pygame.sprite.Group()
         self.hulks_group = pygame.sprite.Group()
+        self.electrodes_group = pygame.sprite.Group()
         self.brains_group = pygame.sprite.Group()
 
+        # Entities that leave a trail behind them, like progs and the brain's cruise missiles
+        self.trail_group = pygame.sprite.Group()
+
         # Family group
         self.family_group = pygame.sprite.Group()
 
+        # Collision broadphase, one grid for each group the collision checks query
+        self.enemy_hash = SpatialHash(self.active_area)
+        self.family_hash = SpatialHash(self.active_area)
+
+        # Closest human lookups for the brains, the family positions are indexed once per tick
+        self.family_index = ProximityIndex(self, self.family_group)
+
+        # Steps around the electrodes and hulks for everything that chases the hero
+        self.hero_field = FlowField(self, (self.electrodes_group, self.hulks_group))
+
+        # Entities that only step torwards a target are moved together, one vectorized pass per group
+        # The grunts take a step of a fixed size every GRUNT_MOVE_AT_TIME, the others move every tick
+        speed_scale = self.sim_clock.speed_scale
+        self.grunt_swarm = Swarm(self, GRUNT_MOVEMENT_SCALER,
+                                 move_interval=self.sim_clock.ms_to_ticks(GRUNT_MOVE_AT_TIME), chase_hero=True,
+                                 move_sound="grunt_walk")
+        self.prog_swarm = Swarm(self, PROG_MOVEMENT_SCALER * speed_scale, chase_hero=True)
+        self.family_swarm = Swarm(self, FAMILY_MOVEMENT_SCALER * speed_scale)
+
     def reset_game(self):
         """ Restart the game by setting counters and flags back to their original values."""
         self.score_count = SCORE_COUNT
         self.wave_count = WAVE_COUNT
         self.life_count = LIFE_COUNT
+        self.family_saved_count = 0
+        self.family_lost_count = 0
         self.game_over = False
         self.game_reset = False
         self.pause_entity_movement = True
@@ -150,213 +245,374 @@ class Game:
             # this will trigger the spawn enemies code.
             entity.kill()
 
-    async def main(self):
-        while True:
-            self.display.fill((0, 0, 0))  # black background
-
-            if self.game_reset:
-                self.reset_game()
-
-            # Spawn enemies
-            if not self.grunts_group:  # TODO: This will eventually need to be a 'everything except hulks' group
-                self.pause_entity_movement = True
-                self.transition_flag = True
-                self.converged = False
-                self.level_transition = True
-                # wait for the Squares animation to fill the screen before spawning and moving entities for a new wave
-                if self.transition_timer == 0:
-                    # empty out any previous wave stuff
-                    for enemy in self.enemy_group:
-                        enemy.kill()
-                    for projectile in self.hero_projectiles:
-                        projectile.kill()
-                    for projectile in self.enemy_projectiles:
-                        projectile.kill()
-                    for family in self.family_group:
-                        family.kill()  # :(
-                    # respawn the player
-                    self.hero.move_to_center()
-                    # reset the family score multiplier
-                    self.scoring.reset_score_mult()
-                    # spawn new wave
-                    self.wave_count += 1
-                    self.spawner.spawn_enemies()
-                    self.spawner.spawn_family()
-                    self.transition_timer = TRANSITION_TIMER
-                    self.first_wave = False
-                    self.level_transition = False
-                else:
-                    self.transition_timer -= 1
-
-            # collision detection
-            #   hero_projectile-to-enemy
-            enemy_hit = pygame.sprite.groupcollide(self.hero_projectiles, self.enemy_group, True, False)
-            if enemy_hit:
-                affected_enemy = list(enemy_hit.values())[0][0]  # determine the affected enemy
-                # returns {<Projectiles Sprite(in 0 groups)>: [<Grunt Sprite(in 3 groups)>]}
-                for projectile in enemy_hit:
-                    explode_logic = projectile.explode_logic  # explode logic is dictated by the projectile direction
-                    projectile_direction = projectile.direction
-                # update the score
-                self.scoring.update_score(affected_enemy.e_type)
-                # Update the entity via its object
-                affected_enemy.hit_by_projectile(hit_dir=projectile_direction)
-                if affected_enemy.e_type != "hulk" and affected_enemy.e_type != "electrode":
-                    self.active_animations.append(ExplodeAnimations(self, affected_enemy, explode_logic))
-                if affected_enemy.e_type == "electrode":
-                    self.shrink_list.append(ShrinkAnimations(self, affected_enemy))
-                if affected_enemy.e_type == "tank":
-                    self.audio.play("tank_explode")
-            #  hero_projectile-to-enemy_projectile
-            projectile_hit = pygame.sprite.groupcollide(self.hero_projectiles, self.enemy_projectiles, True, True)
-            
-            if projectile_hit:
-                self.scoring.update_score("projectile")
-            #   enemy-to-hero
-            hero_collision = pygame.sprite.spritecollide(self.hero, self.enemy_group, False)
-            hero_shot = pygame.sprite.spritecollide(self.hero, self.enemy_projectiles, False)
-            if hero_shot:
-                # need to kill the projectile that hit the hero,
-                #  otherwise it could cause instant game-over if the hero is at the center of the screen
-                affected_projectile = hero_shot[0]  # determine the projectile
-                affected_projectile.kill()
-            if hero_collision or hero_shot:
-                if not self.hero.respawn_invuln:
-                    # check if the hero is invulnerable due to respawn
-                    # if the player is not invulnerable, they lose a life.
-                    if self.life_count != 0:
-                        # this is here because otherwise you end up with a -1 life indication at the GAME OVER screen
-                        self.life_count -= 1
-                        self.audio.play("hero_death")
-                    if self.life_count == 0:
-                        self.game_over = True
-                    else:
-                        # respawn the hero at the center of the screen and toggle invulnerability
-                        self.hero.move_to_center()
-                        self.hero.respawn_invuln = HERO_INVULN_TIME  # set the hero invulnerable
-                        self.converge_list.append(ConvergenceAnimations(self, self.hero,
-                                                                            (random.choice(["vertical", "horizontal"]),
-                                                                             0)))
-            #   hulk-to-family
-            hulk_to_fam = pygame.sprite.groupcollide(self.hulks_group, self.family_group, False, True)
-            if hulk_to_fam:
-                # {<Hulk Sprite(in 3 groups)>: [<Dad Sprite(in 0 groups)>]}
-                self.hud.add_family_death(list(hulk_to_fam.values())[0][0].pos)
-                self.audio.play("human_die")
-
-            # brain-to-family
-            brain_to_fam = pygame.sprite.groupcollide(self.brains_group, self.family_group, False, True)
-            for brain in brain_to_fam:
-                # spawn a prog
-                brain.spawn_prog()
-                self.hud.add_family_death(list(brain_to_fam.values())[0][0].pos)
-                self.audio.play("human_die")
-                self.audio.play("prog_transformation")
-
-            #   hero-to-family
-            family_saved = pygame.sprite.groupcollide(self.hero_group, self.family_group, False, True)
-            if family_saved:
-                self.scoring.update_score("family", pos=self.hero.pos)
-                self.audio.play("human_save")
+    def step(self, inputs=None):
+        """
+        Advance the game logic by a single frame. Nothing is drawn here, so this can be called
+        as fast as the CPU allows when running headless.
+
+        :param inputs: Optional (hero_movement, hero_shooting) pair, each a [left, right, up, down] list.
+            If None, the inputs gathered by handle_events() are used.
+        :return: None
+        """
+        if inputs is not None:
+            self.hero_movement = list(inputs[0])
+            self.hero_shooting = list(inputs[1])
+
+        if self.recorder is not None:
+            self.recorder.record(self.hero_movement, self.hero_shooting, self.game_reset)
 
+        self.sim_clock.advance()
+
+        if self.game_reset:
+            self.reset_game()
+
+        with self.profiler.phase("wave_spawn"):
+            self.update_wave()
+        with self.profiler.phase("collisions"):
+            self.check_collisions()
+
+        with self.profiler.phase("updates"):
             if not self.game_over and not self.pause_entity_movement and not self.transition_flag:
                 # Update hero
                 self.hero.update(movement=self.hero_movement,
                                  shooting=self.hero_shooting)
 
                 # Update groups
-                self.hero_projectiles.update()
+                self.update_hero_projectiles()
                 self.enemy_projectiles.update()
                 self.enemy_group.update()
                 self.family_group.update()
+                self.grunt_swarm.move()
+                self.prog_swarm.move()
+                self.family_swarm.move()
+
+        self.update_transitions()
+
+    def update_wave(self):
+        """
+        Clear out the previous wave and spawn the next one once the transition squares have filled the screen.
+
+        :return: None
+        """
+        if not self.grunts_group:  # TODO: This will eventually need to be a 'everything except hulks' group
+            self.pause_entity_movement = True
+            self.transition_flag = True
+            self.converged = False
+            self.level_transition = True
+            # wait for the Squares animation to fill the screen before spawning and moving entities for a new wave
+            if self.transition_timer == 0:
+                # empty out any previous wave stuff
+                for enemy in self.enemy_group:
+                    enemy.kill()
+                for projectile in self.hero_projectiles:
+                    projectile.kill()
+                for projectile in self.enemy_projectiles:
+                    projectile.kill()
+                for family in self.family_group:
+                    family.kill()  # :(
+                # respawn the player
+                self.hero.move_to_center()
+                # reset the family score multiplier
+                self.scoring.reset_score_mult()
+                # spawn new wave
+                self.wave_count += 1
+                self.spawner.spawn_enemies()
+                self.spawner.spawn_family()
+                self.family_index.invalidate()
+                self.transition_timer = self.sim_clock.ms_to_ticks(SCREEN_COVERED_TIME)
+                self.first_wave = False
+                self.level_transition = False
+            else:
+                self.transition_timer -= 1
+
+    def check_collisions(self):
+        """
+        Collision detection between the hero, the robots, the family and all of the projectiles.
+
+        :return: None
+        """
+        # Broadphase. Each grid is only built if enough sprites will be tested against its group this frame.
+        # The enemy projectiles test their rects in bulk instead, see ProjectilePool.
+        self.enemy_hash.update(self.enemy_group, queries=len(self.hero_projectiles) + 1)
+        self.family_hash.update(self.family_group, queries=len(self.hulks_group) + len(self.brains_group) + 1)
+
+        self.check_hero_shots()
+
+        #   enemy-to-hero
+        hero_collision = self.enemy_hash.spritecollide(self.hero, False)
+        hero_shot = self.enemy_projectiles.spritecollide(self.hero, False)
+        if hero_shot:
+            # need to kill the projectile that hit the hero,
+            #  otherwise it could cause instant game-over if the hero is at the center of the screen
+            affected_projectile = hero_shot[0]  # determine the projectile
+            affected_projectile.kill()
+        if hero_collision or hero_shot:
+            if not self.hero.respawn_invuln:
+                # check if the hero is invulnerable due to respawn
+                # if the player is not invulnerable, they lose a life.
+                if self.life_count != 0:
+                    # this is here because otherwise you end up with a -1 life indication at the GAME OVER screen
+                    self.life_count -= 1
+                    self.audio.play("hero_death")
+                if self.life_count == 0:
+                    self.game_over = True
+                else:
+                    # respawn the hero at the center of the screen and toggle invulnerability
+                    self.hero.move_to_center()
+                    self.hero.respawn_invuln = self.sim_clock.ms_to_ticks(HERO_INVULN_TIME)  # set the hero invulnerable
+                    if not self.headless:
+                        self.converge_list.append(ConvergenceAnimations(self, self.hero,
+                                                                        (self.fx_rng.choice(["vertical", "horizontal"]),
+                                                                         0)))
+        #   hulk-to-family
+        hulk_to_fam = self.family_hash.groupcollide(self.hulks_group, False, True)
+        if hulk_to_fam:
+            # {<Hulk Sprite(in 3 groups)>: [<Dad Sprite(in 0 groups)>]}
+            self.hud.add_family_death(list(hulk_to_fam.values())[0][0].pos)
+            self.audio.play("human_die")
+            self.family_index.invalidate()
+            self.family_lost_count += sum(len(family) for family in hulk_to_fam.values())
+
+        # brain-to-family
+        brain_to_fam = self.family_hash.groupcollide(self.brains_group, False, True)
+        for brain in brain_to_fam:
+            # spawn a prog
+            brain.spawn_prog()
+            self.family_lost_count += len(brain_to_fam[brain])
+            self.hud.add_family_death(list(brain_to_fam.values())[0][0].pos)
+            self.audio.play("human_die")
+            self.audio.play("prog_transformation")
+
+        #   hero-to-family
+        family_saved = self.family_hash.groupcollide(self.hero_group, False, True)
+        if family_saved:
+            self.scoring.update_score("family", pos=self.hero.pos)
+            self.audio.play("human_save")
+            self.family_index.invalidate()
+            self.family_saved_count += len(family_saved[self.hero])
+
+    def check_hero_shots(self):
+        """
+        Collision detection between the hero projectiles and the robots and their projectiles.
+
+        :return: None
+        """
+        #   hero_projectile-to-enemy
+        enemy_hit = self.enemy_hash.groupcollide(self.hero_projectiles, True, False)
+        if enemy_hit:
+            affected_enemy = list(enemy_hit.values())[0][0]  # determine the affected enemy
+            # returns {<Projectiles Sprite(in 0 groups)>: [<Grunt Sprite(in 3 groups)>]}
+            for projectile in enemy_hit:
+                explode_logic = projectile.explode_logic  # explode logic is dictated by the projectile direction
+                projectile_direction = projectile.direction
+            # update the score
+            self.scoring.update_score(affected_enemy.e_type)
+            # Update the entity via its object
+            affected_enemy.hit_by_projectile(hit_dir=projectile_direction)
+            if not self.headless:
+                if affected_enemy.e_type != "hulk" and affected_enemy.e_type != "electrode":
+                    self.active_animations.append(ExplodeAnimations(self, affected_enemy, explode_logic))
+                if affected_enemy.e_type == "electrode":
+                    self.shrink_list.append(ShrinkAnimations(self, affected_enemy))
+            if affected_enemy.e_type == "tank":
+                self.audio.play("tank_explode")
+        #  hero_projectile-to-enemy_projectile
+        projectile_hit = self.enemy_projectiles.groupcollide(self.hero_projectiles, True, True)
+
+        if projectile_hit:
+            self.scoring.update_score("projectile")
+
+    def update_hero_projectiles(self):
+        """
+        Move the hero projectiles. Below the reference tick rate a shot moves further than its length in a tick and
+        would fly through the thin robots, so it moves in steps of its reference tick length instead, and is tested
+        against the robots after every step but the last. check_collisions() tests the last one, next tick.
+
+        :return: None
+        """
+        steps = math.ceil(self.sim_clock.speed_scale)
+        for step in range(steps):
+            if step:
+                self.check_hero_shots()
+            self.hero_projectiles.update(1 / steps)
+
+    def update_transitions(self):
+        """
+        Step the wave transition state machine: the Squares transition, the robot convergence and the spawn countdown.
+
+        :return: None
+        """
+        if self.transition_flag and self.transition_squares is None:
+            # if transition is true, init the Squares transition
+            self.audio.stop_all()  # stop all audio to prepare for the next wave's music and sound effects
+            self.transition_squares = Transitions(self)
+        if self.transition_squares:
+            self.transition_squares.update()
+            if self.transition_squares.finished:
+                self.transition_squares = None
+                self.transition_flag = False
+
+        if not self.transition_flag and not self.converged:
+            # only trigger once, to put all the current entities into the ConvergenceAnimation sequence
+            if not self.headless:
+                for entity in self.allsprites:
+                    if entity.e_type != "mike" and entity.e_type != "mom" and entity.e_type != "dad":
+                        # if the entity is not a family member, spawn them on the screen using ConvergenceAnimations
+                        self.converge_list.append(ConvergenceAnimations(self, entity,
+                                                                        (self.fx_rng.choice(["vertical", "horizontal"]), 0)))
+            self.converged = True
+
+        if not self.level_transition and not self.transition_flag and self.pause_entity_movement:
+            # Robot entity spawn, after the transition has completed. Wait for the convergence to finish.
+            if self.spawn_counter >= self.spawn_timer:
+                self.pause_entity_movement = False
+                self.spawn_counter = 0
+                self.audio.stop("level_transition")
+            else:
+                self.spawn_counter += 1
+
+    def quit(self):
+        """
+        Save the input recording, if there is one, and close the game.
+
+        :return: None
+        """
+        if self.recorder is not None:
+            self.recorder.save(self.record_path)
+        if self.profile_path:
+            self.profiler.dump_csv(self.profile_path)
+        pygame.quit()
+        sys.exit()
+
+    def handle_events(self):
+        """
+        Poll the pygame event queue and update the hero inputs.
+
+        :return: None
+        """
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.quit()
+            if event.type == pygame.WINDOWEXPOSED and self.dirty_rects:
+                # the window contents were lost, the next frame has to be presented in full
+                self.display.invalidate()
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_a:
+                    self.hero_movement[0] = True
+                if event.key == pygame.K_d:
+                    self.hero_movement[1] = True
+                if event.key == pygame.K_w:
+                    self.hero_movement[2] = True
+                if event.key == pygame.K_s:
+                    self.hero_movement[3] = True
+                if event.key == pygame.K_LEFT:
+                    self.hero_shooting[0] = True
+                if event.key == pygame.K_RIGHT:
+                    self.hero_shooting[1] = True
+                if event.key == pygame.K_UP:
+                    self.hero_shooting[2] = True
+                if event.key == pygame.K_DOWN:
+                    self.hero_shooting[3] = True
+                if event.key == pygame.K_r:
+                    if self.game_over:
+                        # if the game is over, restart the game.
+                        self.game_reset = True
+                if event.key == pygame.K_F3:
+                    self.show_profiler = not self.show_profiler
+            if event.type == pygame.KEYUP:
+                if event.key == pygame.K_a:
+                    self.hero_movement[0] = False
+                if event.key == pygame.K_d:
+                    self.hero_movement[1] = False
+                if event.key == pygame.K_w:
+                    self.hero_movement[2] = False
+                if event.key == pygame.K_s:
+                    self.hero_movement[3] = False
+                if event.key == pygame.K_LEFT:
+                    self.hero_shooting[0] = False
+                if event.key == pygame.K_RIGHT:
+                    self.hero_shooting[1] = False
+                if event.key == pygame.K_UP:
+                    self.hero_shooting[2] = False
+                if event.key == pygame.K_DOWN:
+                    self.hero_shooting[3] = False
+
+    def snapshot_positions(self):
+        """
+        Store where every sprite is before the next step(), so render() can interpolate between the last two ticks.
+
+        :return: None
+        """
+        self.prev_positions = {sprite: sprite.rect.topleft for sprite in self.allsprites}
+
+    def draw_group(self, group, alpha=1.0):
+        """
+        Draw the sprites of a group, placing each sprite between its previous and current tick position.
+
+        :param group: pygame.sprite.Group to draw
+        :param float alpha: 0 to 1, how far the render time is between the previous and current tick
+        :return: None
+        """
+        snap_distance = INTERPOLATION_SNAP_DISTANCE * self.sim_clock.speed_scale
+        blits = []
+        for sprite in group:
+            x, y = sprite.rect.topleft
+            prev = self.prev_positions.get(sprite)
+            if prev is not None and abs(x - prev[0]) + abs(y - prev[1]) < snap_distance:
+                x = round(prev[0] + (x - prev[0]) * alpha)
+                y = round(prev[1] + (y - prev[1]) * alpha)
+            blits.append((sprite.image, (x, y)))
+        # one call for the whole group, hundreds of projectiles don't each pay for a blit() call
+        self.display.blits(blits, False)
+
+    def render(self, alpha=1.0):
+        """
+        Draw the current game state onto the display surface.
+
+        :param float alpha: 0 to 1, how far the render time is between the previous and current tick
+        :return: None
+        """
+        with self.profiler.phase("draw"):
+            # black background with the HUD border
+            if self.dirty_rects:
+                self.display.clear(self.hud.background)  # only erase what was drawn last frame
+            else:
+                self.display.blit(self.hud.background, (0, 0))
+
+            # draw the prog and cruise missile trails underneath the sprites
+            for sprite in self.trail_group:
+                sprite.draw_trail(self.display)
 
             # draw sprites
             if self.level_transition:
                 # Keeps all of the entities on the screen until the Squares animation fills the screen.
                 # Only activates between waves
-                self.allsprites.draw(self.display)
+                self.draw_group(self.allsprites, alpha)
             elif self.transition_flag:
                 # Main transition animation. The family should spawn in once the squares have filled the screen
-                self.family_group.draw(self.display)
+                self.draw_group(self.family_group, alpha)
             elif self.pause_entity_movement:
-                # Robot entity spawn, after the transition has completed. It starts the convergence loop
+                # Robot entity spawn, after the transition has completed. The convergence animations draw the robots.
                 # robots should spawn into the world with the family already there, like aliens invading.
-                self.family_group.draw(self.display)
-                if self.spawn_counter >= self.spawn_timer:
-                    self.pause_entity_movement = False
-                    self.spawn_counter = 0
-                    self.audio.stop("level_transition")
-                else:
-                    self.spawn_counter += 1
+                self.draw_group(self.family_group, alpha)
             else:
                 # Main draw loop, active if movement is not paused for spawn animations or transitions
-                self.allsprites.draw(self.display)
+                self.draw_group(self.allsprites, alpha)
 
+        with self.profiler.phase("hud"):
             if self.game_over:
                 # GAME OVER text drawn here to ensure it is drawn on top of all the other sprites.
                 self.hud.game_over()
 
-            # event manager
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_a:
-                        self.hero_movement[0] = True
-                    if event.key == pygame.K_d:
-                        self.hero_movement[1] = True
-                    if event.key == pygame.K_w:
-                        self.hero_movement[2] = True
-                    if event.key == pygame.K_s:
-                        self.hero_movement[3] = True
-                    if event.key == pygame.K_LEFT:
-                        self.hero_shooting[0] = True
-                    if event.key == pygame.K_RIGHT:
-                        self.hero_shooting[1] = True
-                    if event.key == pygame.K_UP:
-                        self.hero_shooting[2] = True
-                    if event.key == pygame.K_DOWN:
-                        self.hero_shooting[3] = True
-                    if event.key == pygame.K_r:
-                        if self.game_over:
-                            # if the game is over, restart the game.
-                            self.game_reset = True
-                if event.type == pygame.KEYUP:
-                    if event.key == pygame.K_a:
-                        self.hero_movement[0] = False
-                    if event.key == pygame.K_d:
-                        self.hero_movement[1] = False
-                    if event.key == pygame.K_w:
-                        self.hero_movement[2] = False
-                    if event.key == pygame.K_s:
-                        self.hero_movement[3] = False
-                    if event.key == pygame.K_LEFT:
-                        self.hero_shooting[0] = False
-                    if event.key == pygame.K_RIGHT:
-                        self.hero_shooting[1] = False
-                    if event.key == pygame.K_UP:
-                        self.hero_shooting[2] = False
-                    if event.key == pygame.K_DOWN:
-                        self.hero_shooting[3] = False
-
             # draw the HUD
             self.hud.render(self.display)
 
+        with self.profiler.phase("animations"):
             for animation in self.active_animations:
                 animation.animate_slices()
                 if animation.finished:
                     self.active_animations.remove(animation)
 
-            if not self.transition_flag and not self.converged:
-                # only trigger once, to put all the current entities into the ConvergenceAnimation sequence
-                for entity in self.allsprites:
-                    if entity.e_type != "mike" and entity.e_type != "mom" and entity.e_type != "dad":
-                        # if the entity is not a family member, spawn them on the screen using ConvergenceAnimations
-                        self.converge_list.append(ConvergenceAnimations(self, entity,
-                                                                        (random.choice(["vertical", "horizontal"]), 0)))
-                self.converged = True
-
             if self.converged:
                 # after all the entities are in the converge_list, we can start the animation sequence
                 for animation in self.converge_list:
@@ -372,24 +628,66 @@ class Game:
                 if animation.finished:
                     self.shrink_list.remove(animation)
 
-            if self.transition_flag and self.transition_squares is None:
-                # if transition is true, init the Squares transition
-                self.audio.stop_all()  # stop all audio to prepare for the next wave's music and sound effects
-                self.transition_squares = Transitions(self)
+        with self.profiler.phase("transitions"):
             if self.transition_squares:
-                self.transition_squares.iterate()
-                if self.transition_squares.finished:
-                    self.transition_squares = None
-                    self.transition_flag = False
+                self.transition_squares.draw()
+                if self.dirty_rects:
+                    # the squares are drawn with pygame.draw, which the dirty rects can't see
+                    self.display.invalidate()
+
+        if self.show_profiler:
+            self.profiler.draw(self.display)
+
+    def present(self):
+        """
+        Scale up the pixel art by bliting the smaller display onto the larger screen, then flip it to the window.
+
+        :return: None
+        """
+        if self.dirty_rects:
+            with self.profiler.phase("scale"):
+                updated = self.display.scale_to(self.screen)
+            with self.profiler.phase("flip"):
+                if updated is None:
+                    pygame.display.flip()
+                else:
+                    pygame.display.update(updated)
+            return
 
-            # Scale up the pixel art by bliting the smaller display onto the larger screen.
+        with self.profiler.phase("scale"):
             self.screen.blit(pygame.transform.scale(self.display, self.screen.get_size()), (0, 0))
 
-            # update the screen
+        # update the screen
+        with self.profiler.phase("flip"):
             pygame.display.flip()
-            self.clock.tick(60)  # framerate
+
+    async def main(self):
+        """
+        Fixed timestep game loop. The time taken by each rendered frame is added to an accumulator, which is spent
+        in step()s of exactly one sim_clock tick each. A render hitch therefore doesn't slow down the gameplay,
+        and the render rate can be lower or higher than the tick rate.
+        """
+        accumulator = 0
+        while True:
+            if self.headless:
+                # logic only, uncapped
+                self.step()
+            else:
+                with self.profiler.phase("events"):
+                    self.handle_events()
+
+                accumulator += min(self.clock.tick(self.render_fps), MAX_FRAME_TIME)
+                while accumulator >= self.sim_clock.tick_ms:
+                    self.snapshot_positions()
+                    self.step()
+                    accumulator -= self.sim_clock.tick_ms
+
+                self.render(alpha=accumulator / self.sim_clock.tick_ms)
+                self.present()
+                with self.profiler.phase("audio"):
+                    self.audio.flush()
             await asyncio.sleep(0)
 
 
 def main():
-    asyncio.run(Game().main())
\ No newline at end of file
+    asyncio.run(Game().main())
@@ -1,6 +1,8 @@
 import pygame
 import logging
 
+from bitmap_font import BitmapFont
+
 logging.basicConfig(format='%(name)s %(levelname)s %(asctime)s %(module)s (line: %(lineno)d) -- %(message)s',
                     level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -28,6 +30,10 @@ class HUD:
         # HUD setup
         self.font = pygame.font.SysFont('Consolas', HUD_FONT_SIZE)  # Load the Consolas font
         self.game_over_font = pygame.font.SysFont('Consolas', GAME_OVER_FONT_SIZE)  # Load the Consolas font
+        self.text = BitmapFont(self.font, TEXT_COLOR_WHITE)
+        self.red_text = BitmapFont(self.font, TEXT_COLOR_RED)
+        self.game_over_text = BitmapFont(self.game_over_font, TEXT_COLOR_RED)
+        self.counters = {}  # label: (value, surface) of the counter text currently shown
 
         # init variables
         self.game = game
@@ -52,32 +58,42 @@ class HUD:
                                        self.hud_rect.width - 2 * self.border_thickness,
                                        self.hud_rect.height - 2 * self.border_thickness)
 
-    def render(self, display):
-        """Render the HUD on the screen.
-
-        :param display: The main game screen
-        """
-
+        # The border never changes, so it is drawn once onto the background that clears every frame
+        self.background = pygame.Surface(self.display_rect.size)
+        self.background.fill((0, 0, 0))
         # Draw a border around the game window with padding at the top and bottom
-        pygame.draw.rect(surface=display,
+        pygame.draw.rect(surface=self.background,
                          color=self.border_color,
                          rect=self.hud_rect,
                          width=self.border_thickness)
-        
+
+    def counter_text(self, label, value):
+        """
+        Get the surface of a '<label>: <value>' counter. The text is only composed again when the value changes.
+
+        :param str label: Name of the counter
+        :param int value: Current value of the counter
+        :return: pygame.Surface
+        """
+        shown = self.counters.get(label)
+        if shown is None or shown[0] != value:
+            shown = self.counters[label] = (value, self.text.render(f"{label}: {value}"))
+        return shown[1]
+
+    def render(self, display):
+        """Render the HUD on the screen. The border is part of the background, see self.background.
+
+        :param display: The main game screen
+        """
         # Draw the score
-        score_text = self.font.render(f'SCORE: {self.game.score_count}', True, TEXT_COLOR_WHITE)
-        display.blit(score_text, (5, 0)) 
+        display.blit(self.counter_text("SCORE", self.game.score_count), (5, 0))
 
         # Draw the wave number
-        wave_text = self.font.render(f'WAVE: {self.game.wave_count}', True, TEXT_COLOR_WHITE)
-        display.blit(wave_text, (5, self.display_rect.height - 15))
+        display.blit(self.counter_text("WAVE", self.game.wave_count), (5, self.display_rect.height - 15))
 
         # Draw the life count
-        life_text = self.font.render(f'LIVES: {self.game.life_count}', True, TEXT_COLOR_WHITE)
-        display.blit(life_text, (self.display_rect.width - 70, self.display_rect.top))
-
-        # Update the display
-        display.blit(pygame.transform.scale(display, display.get_size()), (0, 0))
+        display.blit(self.counter_text("LIVES", self.game.life_count),
+                     (self.display_rect.width - 70, self.display_rect.top))
 
         # draw any family-saved score point indicators
         self.game.scoring.draw_family_saved_score()
@@ -91,8 +107,8 @@ class HUD:
 
         :return: None
         """
-        game_over_text = self.game_over_font.render("GAME OVER", True, TEXT_COLOR_RED)
-        restart_text = self.font.render("Press 'R' to restart.", True, TEXT_COLOR_RED)
+        game_over_text = self.game_over_text.render("GAME OVER")
+        restart_text = self.red_text.render("Press 'R' to restart.")
         self.game.display.blit(game_over_text, (self.game.display.get_width()/2-game_over_text.get_width()/2,
                                                 self.game.display.get_height()/2-game_over_text.get_height()/2))
         self.game.display.blit(restart_text,
@@ -106,6 +122,9 @@ class HUD:
         :param pos: Position of the killed family member as (x, y)
         :return: None
         """
+        if self.game.headless:
+            # nothing is drawn, so the animation would never count down
+            return
         self.skull_anim[int(pos[0])] = [self.skull_and_bones, list(pos), ANIMATION_TIME]  # 3 seconds
 
     def draw_family_death(self):
@@ -1,10 +1,44 @@
+import argparse
 import asyncio
+import logging
 
-from game import Game
+from game import TICK_RATE, Game
+from recorder import InputReplay
+
+logger = logging.getLogger(__name__)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Robotron: 2084")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the gameplay randomness")
+    parser.add_argument("--record", metavar="PATH", default=None, help="record the hero inputs to this file")
+    parser.add_argument("--profile", metavar="PATH", default=None, help="save the per-phase frame timings to this csv")
+    parser.add_argument("--replay", metavar="PATH", default=None,
+                        help="replay a recording headless, as fast as possible")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="only redraw the parts of the screen that changed, for slow machines")
+    parser.add_argument("--stress", type=float, default=1.0,
+                        help="multiply the number of entities in every wave, to test big waves")
+    parser.add_argument("--tick-rate", type=int, default=TICK_RATE,
+                        help="game logic ticks per second, lower it on slow machines. The game speed stays the same")
+    args, _ = parser.parse_known_args()
+    return args
 
 async def main():
-    game = Game()
+    args = parse_args()
+    if args.replay:
+        replay = InputReplay(args.replay)
+        game = Game(headless=True, tick_rate=replay.tick_rate, seed=replay.seed, stress=replay.stress)
+        replay.play(game)
+        if args.profile:
+            game.profiler.dump_csv(args.profile)
+        logger.info(f"Replayed {len(replay)} ticks: wave {game.wave_count}, score {game.score_count}, "
+                    f"lives {game.life_count}")
+        return
+
+    game = Game(tick_rate=args.tick_rate, seed=args.seed, record_path=args.record, profile_path=args.profile,
+                dirty_rects=args.dirty_rects, stress=args.stress)
     await game.main()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
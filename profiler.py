@@ -0,0 +1,114 @@
+import csv
+import logging
+import time
+from collections import deque
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+# CONSTANTS
+ROLLING_WINDOW = 300  # samples kept per phase, 5 seconds at 60 FPS
+OVERLAY_FONT_SIZE = 10
+OVERLAY_POS = (10, 20)  # top-left of the overlay table, just inside the HUD border
+OVERLAY_LINE_HEIGHT = 10
+OVERLAY_COLOR = (0, 255, 0)
+OVERLAY_BACKGROUND = (0, 0, 0, 180)
+
+
+class PhaseTimer:
+    """
+    Context manager that times a single phase of the frame and stores the result in the profiler.
+    One instance is reused for every frame, so timing a phase doesn't allocate.
+    """
+
+    def __init__(self, samples):
+        self.samples = samples
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.samples.append((time.perf_counter() - self.start) * 1000)
+        return False
+
+
+class FrameProfiler:
+    """
+    Times each phase of the game loop and keeps a rolling window of the results.
+
+    Usage:
+        with game.profiler.phase("collisions"):
+            game.check_collisions()
+    """
+
+    def __init__(self, window=ROLLING_WINDOW):
+        self.window = window
+        self.samples = {}  # phase name: deque of milliseconds, in the order the phases were first timed
+        self.timers = {}  # phase name: PhaseTimer
+        self.font = None  # loaded the first time the overlay is drawn
+
+    def phase(self, name):
+        """
+        Get the timer for a phase of the frame.
+
+        :param str name: Name of the phase
+        :return: PhaseTimer context manager
+        """
+        timer = self.timers.get(name)
+        if timer is None:
+            self.samples[name] = deque(maxlen=self.window)
+            timer = self.timers[name] = PhaseTimer(self.samples[name])
+        return timer
+
+    def stats(self):
+        """
+        Rolling min/avg/p99 of every phase.
+
+        :return: list of (phase, min ms, avg ms, p99 ms)
+        """
+        table = []
+        for name, samples in self.samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+            table.append((name, ordered[0], sum(ordered) / len(ordered), p99))
+        return table
+
+    def draw(self, surface):
+        """
+        Draw the stats table on top of the given surface.
+
+        :param surface: pygame.Surface to draw on
+        :return: None
+        """
+        if self.font is None:
+            self.font = pygame.font.SysFont('Consolas', OVERLAY_FONT_SIZE)
+
+        lines = [f"{'phase':<12}{'min':>7}{'avg':>7}{'p99':>7}"]
+        for name, low, avg, p99 in self.stats():
+            lines.append(f"{name:<12}{low:7.2f}{avg:7.2f}{p99:7.2f}")
+
+        background = pygame.Surface((200, OVERLAY_LINE_HEIGHT * len(lines) + 4), pygame.SRCALPHA)
+        background.fill(OVERLAY_BACKGROUND)
+        surface.blit(background, OVERLAY_POS)
+        for i, line in enumerate(lines):
+            text = self.font.render(line, False, OVERLAY_COLOR)
+            surface.blit(text, (OVERLAY_POS[0] + 2, OVERLAY_POS[1] + 2 + i * OVERLAY_LINE_HEIGHT))
+
+    def dump_csv(self, path):
+        """
+        Write the stats table to a csv file.
+
+        :param path: File path of the csv
+        :return: None
+        """
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["phase", "samples", "min_ms", "avg_ms", "p99_ms"])
+            for name, low, avg, p99 in self.stats():
+                writer.writerow([name, len(self.samples[name]), f"{low:.4f}", f"{avg:.4f}", f"{p99:.4f}"])
+        logger.info(f"Saved frame timings to {path}")
@@ -1,23 +1,33 @@
 import pygame
-import random
 
 # CONSTANTS
-SPEED = 1                # Scales how fast the projectile moves
-DIRECTION_MAX_FRAMES = 20  # max number of frames before a direction change
+SPEED = 1                # Scales how fast the projectile moves, pixels per reference tick
+DIRECTION_MAX_FRAMES = 333  # max ms before a direction change
 IMAGE_TRAIL_LENGTH = 30    # number of trail images to store
+TRAIL_TINT = (255, 0, 0, 100)  # added to the image of the projectile for the trail images
 
 class BrainProjectile(pygame.sprite.Sprite):
     def __init__(self, game, p_type, pos):
         pygame.sprite.Sprite.__init__(self)
         self.game = game
+        self.reset(p_type, pos)
+
+    def reset(self, p_type, pos):
+        """
+        Launch a new cruise missile, the pool of the brain projectiles recycles dead ones with this.
+
+        :param str p_type: Name of the projectile asset
+        :param pos: [x, y] position to fire from
+        :return: None
+        """
         self.pos = pygame.math.Vector2(pos)
 
         self.image = self.game.assets[p_type]
         self.original_image = self.image  # store the original image for rotation
         self.rect = pygame.Rect(self.pos[0], self.pos[1], 13, 13)
 
-        self.frame_counter = DIRECTION_MAX_FRAMES
-        self.frame_max = DIRECTION_MAX_FRAMES
+        self.frame_counter = self.game.sim_clock.ms_to_ticks(DIRECTION_MAX_FRAMES)  # ticks
+        self.frame_max = self.frame_counter
 
         self.target_pos = [self.game.hero.rect[0], self.game.hero.rect[1]]
 
@@ -30,22 +40,22 @@ class BrainProjectile(pygame.sprite.Sprite):
             self.frame_counter += 1
         else:
             # Decide randomly whether to home in on the player or go to a random position
-            if random.choice([True, False]):
+            if self.game.rng.choice([True, False]):
                 self.target_pos = [self.game.hero.rect[0], self.game.hero.rect[1]]
             else:
-                x = random.randint(self.game.active_area.left, self.game.active_area.right)
-                y = random.randint(self.game.active_area.top, self.game.active_area.bottom)
+                x = self.game.rng.randint(self.game.active_area.left, self.game.active_area.right)
+                y = self.game.rng.randint(self.game.active_area.top, self.game.active_area.bottom)
                 self.target_pos = [x, y]
 
             # Calcualate the number of frames the projectile will move
-            self.frame_max = random.randint(0, DIRECTION_MAX_FRAMES) 
+            self.frame_max = self.game.rng.randint(0, self.game.sim_clock.ms_to_ticks(DIRECTION_MAX_FRAMES))
             self.frame_counter = 0
 
         # Move towards the target position
         direction_vector = pygame.math.Vector2(self.target_pos[0] - self.pos[0],
                                                self.target_pos[1] - self.pos[1])
         if direction_vector.length() != 0:
-            direction_vector = direction_vector.normalize() * SPEED
+            direction_vector = direction_vector.normalize() * (SPEED * self.game.sim_clock.speed_scale)
             self.pos += direction_vector
             self.rect.topleft = (round(self.pos.x), round(self.pos.y))
 
@@ -56,10 +66,14 @@ class BrainProjectile(pygame.sprite.Sprite):
             if len(self.image_trail_positions) > IMAGE_TRAIL_LENGTH:
                 self.image_trail_positions.pop(0)
 
-            # Draw trail images at their respective positions
-            for i, trail_pos in enumerate(self.image_trail_positions):
-                if i % 3 == 0:  # Only draw every 3rd image for performance
-                    colored_image = self.original_image.copy()
-                    colored_image.fill((255, 0, 0, 100), special_flags=pygame.BLEND_RGBA_ADD)
-                    self.game.display.blit(colored_image, (trail_pos[0], trail_pos[1]), special_flags=pygame.BLEND_ADD)
-            
\ No newline at end of file
+    def draw_trail(self, surface):
+        """
+        Draw the trail images at their respective positions.
+
+        :param surface: pygame.Surface to draw the trail on
+        :return: None
+        """
+        for i, trail_pos in enumerate(self.image_trail_positions):
+            if i % 3 == 0:  # Only draw every 3rd image for performance
+                colored_image = self.game.asset_variants.get(self.original_image, tint=TRAIL_TINT)
+                surface.blit(colored_image, (trail_pos[0], trail_pos[1]), special_flags=pygame.BLEND_ADD)
@@ -4,13 +4,24 @@ import pygame
 # CONSTANTS
 DEFAULT_SCALER = 2  # Scales how fast the projectile moves
 SLOWED_TIMER = 3  # number of seconds the slow rate occur over
-FRAME_COUNTER = 20  # number of frames before each SLOW_RATE is applied
+FRAME_COUNTER = 333  # ms before each SLOW_RATE is applied
 SLOW_RATE = 0.8  # the rate that the projectile speed should be reduced by
+WALL_BUFFER = 2  # pixels past the edge of the active area that count as hitting the wall
 
 class EnforcerProjectiles(pygame.sprite.Sprite):
     def __init__(self, game, p_type, pos):
         pygame.sprite.Sprite.__init__(self)
         self.game = game
+        self.reset(p_type, pos)
+
+    def reset(self, p_type, pos):
+        """
+        Fire a new spark at the hero. Recycled sparks are reset with this instead of being constructed again.
+
+        :param str p_type: Name of the projectile asset
+        :param pos: [x, y] position to fire from
+        :return: None
+        """
         self.p_type = p_type
         self.pos = pygame.math.Vector2(pos)
 
@@ -23,14 +34,14 @@ class EnforcerProjectiles(pygame.sprite.Sprite):
 
         self.slowed_timer = SLOWED_TIMER
         self.slow_rate = SLOW_RATE
-        self.frame_counter = FRAME_COUNTER
+        self.frame_counter = self.game.sim_clock.ms_to_ticks(FRAME_COUNTER)  # ticks
 
     def fire_to_target(self, target_pos, scaler=DEFAULT_SCALER):
         """
         Fire the projectile at the hero entity.
 
         :param target_pos: [x, y] position for the projectile to fire at
-        :param float scaler: Scales how fast the projectile moves
+        :param float scaler: Scales how fast the projectile moves, pixels per reference tick
         :return: None
         """
         target_pos = list(target_pos)
@@ -46,6 +57,7 @@ class EnforcerProjectiles(pygame.sprite.Sprite):
         frame_movement[1] = (target_pos[1] - e_pos[1]) / max_diff
 
         # scale the movement, can be used later to increase difficulty if desired.
+        scaler = scaler * self.game.sim_clock.speed_scale
         return pygame.math.Vector2(frame_movement[0] * scaler,
                                    frame_movement[1] * scaler)
 
@@ -58,7 +70,7 @@ class EnforcerProjectiles(pygame.sprite.Sprite):
                 self.frame_counter -= 1
             else:
                 self.frame_movement *= self.slow_rate
-                self.frame_counter = FRAME_COUNTER
+                self.frame_counter = self.game.sim_clock.ms_to_ticks(FRAME_COUNTER)
                 self.slowed_timer -= 1
 
         # Calculate the new position using float math to account for small changes, then round for Rect logic
@@ -66,7 +78,7 @@ class EnforcerProjectiles(pygame.sprite.Sprite):
         self.rect.topleft = (round(self.pos.x), round(self.pos.y))
 
         # projectiles move along walls until hitting the corner
-        buffer = 2
+        buffer = WALL_BUFFER
         if self.rect.left + buffer < self.game.active_area.left:
             self.v_wall = True
         if self.rect.right + buffer > self.game.active_area.right:
@@ -86,9 +98,10 @@ class EnforcerProjectiles(pygame.sprite.Sprite):
         elif self.h_wall and not self.v_wall:
             self.frame_movement[1] = 0
 
-        # prevent projectiles from appearing to sticking to the wall if the movement value is < 1
-        if self.v_wall and self.frame_movement[1] < 1:
-            self.frame_movement[1] = math.copysign(1, self.frame_movement[1])
-        if self.h_wall and self.frame_movement[0] < 1:
-            self.frame_movement[0] = math.copysign(1, self.frame_movement[0])
+        # prevent projectiles from appearing to sticking to the wall if the movement is < 1 pixel per reference tick
+        along = self.game.sim_clock.speed_scale
+        if self.v_wall and self.frame_movement[1] < along:
+            self.frame_movement[1] = math.copysign(along, self.frame_movement[1])
+        if self.h_wall and self.frame_movement[0] < along:
+            self.frame_movement[0] = math.copysign(along, self.frame_movement[0])
 
@@ -4,12 +4,23 @@ import logging
 logger = logging.getLogger(__name__)
 
 # CONSTANTS
-PROJECTILE_SPEED = 16
+PROJECTILE_SPEED = 16  # pixels per reference tick, see SimClock
 
 class HeroProjectiles(pygame.sprite.Sprite):
     def __init__(self, game, p_type, pos, direction):
         pygame.sprite.Sprite.__init__(self)
         self.game = game
+        self.reset(p_type, pos, direction)
+
+    def reset(self, p_type, pos, direction):
+        """
+        Fire a new shot, like a newly constructed projectile. See SpritePool.
+
+        :param str p_type: Name of the projectile asset
+        :param pos: [x, y] position to fire from
+        :param direction: [left, right, up, down] shooting directions
+        :return: None
+        """
         self.p_type = p_type
         self.pos = pos
         self.direction = direction
@@ -18,21 +29,27 @@ class HeroProjectiles(pygame.sprite.Sprite):
         # Rotate the image based on direction
         if (self.direction[0] or self.direction[1]) and (self.direction[2] or self.direction[3]) and not\
                 (self.direction[0] + self.direction[1] + self.direction[2] + self.direction[3] == 1):
-            self.image = pygame.transform.rotate(self.game.assets[self.p_type], 45)  # NorthEast, SouthWest
+            self.image = self.game.asset_variants.get(self.game.assets[self.p_type], rotate=45)  # NorthEast, SouthWest
             self.explode_logic = ["diagonal", False]
             if (self.direction[0] and self.direction[2]) or (self.direction[1] and self.direction[3]):  # NorthWest, SouthEast
-                self.image = pygame.transform.flip(self.image, True, False)
+                self.image = self.game.asset_variants.get(self.game.assets[self.p_type], flip_x=True, rotate=45)
                 self.explode_logic = ["diagonal", True]
         elif self.direction[2] or self.direction[3]:  # North, South
-            self.image = pygame.transform.rotate(self.game.assets[self.p_type], 90)
+            self.image = self.game.asset_variants.get(self.game.assets[self.p_type], rotate=90)
             self.explode_logic = ["horizontal", False]
         else:  # East, West
             self.image = self.game.assets[self.p_type]
             self.explode_logic = ["vertical", False]
         self.rect = pygame.Rect(self.pos[0], self.pos[1], 6, 1)
 
-    def update(self):
-        projectile_speed = PROJECTILE_SPEED
+    def update(self, fraction=1):
+        """
+        Move the projectile, and kill it once it leaves the map.
+
+        :param float fraction: Part of the tick's movement to make, see Game.update_hero_projectiles()
+        :return: None
+        """
+        projectile_speed = PROJECTILE_SPEED * self.game.sim_clock.speed_scale * fraction
 
         # Directions truth tables
         #     [True, False, True, False]: "Northwest"
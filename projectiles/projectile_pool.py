@@ -0,0 +1,358 @@
+import pygame
+
+from projectiles.brain_projectile import (
+    DIRECTION_MAX_FRAMES,
+    IMAGE_TRAIL_LENGTH,
+    BrainProjectile,
+)
+from projectiles.brain_projectile import SPEED as BRAIN_SPEED
+from projectiles.enforcer_projectiles import (
+    FRAME_COUNTER,
+    SLOW_RATE,
+    EnforcerProjectiles,
+)
+from projectiles.enforcer_projectiles import WALL_BUFFER as ENFORCER_WALL_BUFFER
+from projectiles.tank_projectiles import BOUNCE_DELAY, TankProjectiles
+from projectiles.tank_projectiles import WALL_BUFFER as TANK_WALL_BUFFER
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, the pool updates its members one at a time without it
+    np = None
+
+# CONSTANTS
+COMPACT_FRACTION = 0.25  # drop the rows of killed members once they are this fraction of the arrays
+ENFORCER, TANK, BRAIN = 0, 1, 2  # kind of each member
+
+
+class ProjectilePool(pygame.sprite.Group):
+    """
+    Group of the enemy projectiles: enforcer sparks, tank shells and brain cruise missiles.
+
+    The state of the members lives in numpy arrays owned by the pool: positions, velocities, timers, wall flags and
+    the kind of each projectile. update() advances every member in a single vectorized pass with the same math as the
+    update() of its class: the enforcer sparks slow down and slide along the walls, the tank shells bounce and expire,
+    the cruise missiles home in on their target. Only the rects of the members and the trails of the missiles are
+    written back every frame, the rest of the state when a member leaves the pool. Members join and leave like any
+    other group, with add() and kill().
+
+    collide_rect() and groupcollide() test against every member at once.
+
+    Without numpy, update() calls the update() of every member.
+    """
+
+    def __init__(self, game):
+        """
+        :param game: Game object
+        """
+        super().__init__()
+        self.game = game
+
+        self.members = []  # slot: sprite, None if the sprite was killed since the arrays were last compacted
+        self.slots = {}  # sprite: slot
+        self.joining = {}  # sprites added since the last sync(), given a slot by the next one
+        self.killed = 0  # number of None slots in self.members
+        if np is not None:
+            self.kind = np.empty(0, dtype=np.int8)
+            self.pos = np.empty((0, 2))  # float position of the sparks and missiles, a tank shell only has its rect
+            self.rect_pos = np.empty((0, 2))  # rect.topleft
+            self.size = np.empty((0, 2))  # rect.size
+            self.velocity = np.empty((0, 2))  # frame_movement
+            self.target = np.empty((0, 2))  # target_pos of the cruise missiles
+            self.walls = np.empty((0, 2), dtype=bool)  # [v_wall, h_wall]
+            self.flip_delay = np.empty((0, 2), dtype=np.int64)  # [flip_delay_v, flip_delay_h] of the tank shells
+            self.timer = np.empty(0, dtype=np.int64)  # alive_timer of the tank shells, slowed_timer of the sparks
+            self.counter = np.empty(0, dtype=np.int64)  # frame_counter of the sparks and cruise missiles
+            self.frame_max = np.empty(0, dtype=np.int64)  # frame_max of the cruise missiles
+            self.alive = np.empty(0, dtype=bool)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        if np is not None:
+            self.joining[sprite] = None
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        if np is None:
+            return
+        slot = self.slots.pop(sprite, None)
+        if slot is None:
+            del self.joining[sprite]
+            return
+        self.store(slot, sprite)
+        self.members[slot] = None
+        self.alive[slot] = False
+        self.killed += 1
+
+    def store(self, slot, sprite):
+        """
+        Write the state of a member back into its sprite, when it leaves the pool.
+
+        :param int slot: Slot of the sprite
+        :param sprite: The projectile
+        :return: None
+        """
+        kind = self.kind[slot]
+        v_wall, h_wall = self.walls[slot].tolist()
+        if kind == TANK:
+            sprite.frame_movement = self.velocity[slot].tolist()
+            sprite.v_wall, sprite.h_wall = v_wall, h_wall
+            sprite.flip_delay_v, sprite.flip_delay_h = self.flip_delay[slot].tolist()
+            sprite.alive_timer = int(self.timer[slot])
+            return
+        sprite.pos.update(self.pos[slot].tolist())
+        sprite.frame_counter = int(self.counter[slot])
+        if kind == ENFORCER:
+            sprite.frame_movement.update(self.velocity[slot].tolist())
+            sprite.v_wall, sprite.h_wall = v_wall, h_wall
+            sprite.slowed_timer = int(self.timer[slot])
+        else:
+            sprite.frame_max = int(self.frame_max[slot])
+
+    def sync(self):
+        """
+        Give the sprites that joined since the last sync() a slot in the arrays,
+        and drop the slots of killed sprites once there are enough of them.
+
+        :return: None
+        """
+        if self.killed > len(self.members) * COMPACT_FRACTION:
+            keep = self.alive
+            self.members = [sprite for sprite in self.members if sprite is not None]
+            self.slots = {sprite: slot for slot, sprite in enumerate(self.members)}
+            for name in ("kind", "pos", "rect_pos", "size", "velocity", "target", "walls", "flip_delay", "timer",
+                         "counter", "frame_max", "alive"):
+                setattr(self, name, getattr(self, name)[keep])
+            self.killed = 0
+
+        if not self.joining:
+            return
+        joining = list(self.joining)
+        self.joining = {}
+        rows = []
+        for sprite in joining:
+            self.slots[sprite] = len(self.members)
+            self.members.append(sprite)
+            if isinstance(sprite, TankProjectiles):
+                rows.append((TANK, sprite.rect.topleft, sprite.frame_movement, (0, 0), (sprite.v_wall, sprite.h_wall),
+                             (sprite.flip_delay_v, sprite.flip_delay_h), sprite.alive_timer, 0, 0))
+            elif isinstance(sprite, EnforcerProjectiles):
+                rows.append((ENFORCER, sprite.pos, sprite.frame_movement, (0, 0), (sprite.v_wall, sprite.h_wall),
+                             (0, 0), sprite.slowed_timer, sprite.frame_counter, 0))
+            elif isinstance(sprite, BrainProjectile):
+                rows.append((BRAIN, sprite.pos, (0, 0), sprite.target_pos, (False, False), (0, 0), 0,
+                             sprite.frame_counter, sprite.frame_max))
+            else:
+                raise TypeError(f"ProjectilePool can't move {type(sprite).__name__}")
+        kind, pos, velocity, target, walls, flip_delay, timer, counter, frame_max = zip(*rows)
+        self.kind = np.concatenate((self.kind, np.array(kind, dtype=np.int8)))
+        self.pos = np.concatenate((self.pos, [tuple(p) for p in pos]))
+        self.rect_pos = np.concatenate((self.rect_pos, [sprite.rect.topleft for sprite in joining]))
+        self.size = np.concatenate((self.size, [sprite.rect.size for sprite in joining]))
+        self.velocity = np.concatenate((self.velocity, [tuple(v) for v in velocity]))
+        self.target = np.concatenate((self.target, target))
+        self.walls = np.concatenate((self.walls, walls))
+        self.flip_delay = np.concatenate((self.flip_delay, flip_delay))
+        self.timer = np.concatenate((self.timer, timer))
+        self.counter = np.concatenate((self.counter, counter))
+        self.frame_max = np.concatenate((self.frame_max, frame_max))
+        self.alive = np.concatenate((self.alive, np.ones(len(joining), dtype=bool)))
+
+    def update(self, *args, **kwargs):
+        """
+        Advance every member by one frame.
+
+        :return: None
+        """
+        if np is None:
+            super().update(*args, **kwargs)
+            return
+        if not self.spritedict:
+            return
+        self.sync()
+
+        alive = self.alive
+        tanks = alive & (self.kind == TANK)
+        sparks = alive & (self.kind == ENFORCER)
+        missiles = alive & (self.kind == BRAIN)
+        expired = np.zeros(len(alive), dtype=bool)
+        rect_pos = self.rect_pos.copy()
+
+        if tanks.any():
+            expired |= self.update_tanks(tanks)
+        if sparks.any():
+            expired |= self.update_sparks(sparks)
+        moved = self.update_missiles(missiles) if missiles.any() else missiles
+
+        # write back what is drawn and collided with: the rects that moved to a new pixel and the missile trails
+        members = self.members
+        slots = np.flatnonzero(alive & (self.rect_pos != rect_pos).any(axis=1))
+        for slot, (x, y) in zip(slots.tolist(), self.rect_pos[slots].tolist()):
+            members[slot].rect.topleft = (x, y)
+        slots = np.flatnonzero(moved)
+        for slot, (x, y) in zip(slots.tolist(), self.pos[slots].tolist()):
+            sprite = members[slot]
+            # Store the current position for trail effect, limited to the last IMAGE_TRAIL_LENGTH positions
+            sprite.image_trail_positions.append((x, y))
+            if len(sprite.image_trail_positions) > IMAGE_TRAIL_LENGTH:
+                sprite.image_trail_positions.pop(0)
+
+        for slot in np.flatnonzero(expired).tolist():
+            members[slot].kill()
+
+    def hit_walls(self, rows, buffer):
+        """
+        Latch the wall flags of the members whose rect went past the edge of the active area.
+
+        :param rows: bool array of the members to test
+        :param int buffer: pixels past the edge that count as hitting the wall
+        :return: None
+        """
+        area = self.game.active_area
+        near = self.rect_pos + buffer
+        far = near + self.size
+        self.walls[:, 0] |= rows & ((near[:, 0] < area.left) | (far[:, 0] > area.right))
+        self.walls[:, 1] |= rows & ((near[:, 1] < area.top) | (far[:, 1] > area.bottom))
+
+    def update_tanks(self, tanks):
+        """
+        Same as TankProjectiles.update(): expire, move, bounce off of the walls.
+
+        :param tanks: bool array of the tank shells
+        :return: bool array of the shells that expired this frame
+        """
+        np.subtract(self.timer, 1, out=self.timer, where=tanks)
+        expired = tanks & (self.timer <= 0)
+        np.maximum(self.flip_delay - 1, 0, out=self.flip_delay, where=tanks[:, None])
+
+        # the rect moves by the float movement, pygame rounds half away from zero
+        moved = self.rect_pos + self.velocity
+        np.copyto(self.rect_pos, np.copysign(np.floor(np.abs(moved) + 0.5), moved), where=tanks[:, None])
+        self.hit_walls(tanks, TANK_WALL_BUFFER)
+
+        # flip the movement in the direction of the wall, unless it just bounced in that direction
+        flip = tanks[:, None] & self.walls & (self.flip_delay == 0)
+        if flip.any():
+            np.negative(self.velocity, out=self.velocity, where=flip)
+            self.flip_delay[flip] = self.game.sim_clock.ms_to_ticks(BOUNCE_DELAY)
+            self.walls[flip] = False
+            self.game.audio.play("tank_projectile_bounce")
+        return expired
+
+    def update_sparks(self, sparks):
+        """
+        Same as EnforcerProjectiles.update(): slow down, move, slide along the walls until hitting a corner.
+
+        :param sparks: bool array of the enforcer sparks
+        :return: bool array of the sparks that hit a corner this frame
+        """
+        slowing = sparks & (self.timer >= 0)
+        counting = slowing & (self.counter >= 0)
+        slowed = slowing & ~counting
+        np.subtract(self.counter, 1, out=self.counter, where=counting)
+        if slowed.any():
+            self.velocity[slowed] *= SLOW_RATE
+            self.counter[slowed] = self.game.sim_clock.ms_to_ticks(FRAME_COUNTER)
+            self.timer[slowed] -= 1
+
+        np.add(self.pos, self.velocity, out=self.pos, where=sparks[:, None])
+        np.copyto(self.rect_pos, np.round(self.pos), where=sparks[:, None])  # half to even, like round()
+        self.hit_walls(sparks, ENFORCER_WALL_BUFFER)
+
+        v_wall = self.walls[:, 0]
+        h_wall = self.walls[:, 1]
+        corner = sparks & v_wall & h_wall
+        if not (sparks & (v_wall | h_wall)).any():
+            return corner
+        # stop the movement into the wall, and keep at least 1 pixel per reference tick along it so it doesn't look
+        # stuck
+        speed = self.game.sim_clock.speed_scale
+        self.velocity[sparks & v_wall & ~h_wall, 0] = 0
+        self.velocity[sparks & h_wall & ~v_wall, 1] = 0
+        along = sparks & v_wall & (self.velocity[:, 1] < speed)
+        self.velocity[along, 1] = np.copysign(speed, self.velocity[along, 1])
+        along = sparks & h_wall & (self.velocity[:, 0] < speed)
+        self.velocity[along, 0] = np.copysign(speed, self.velocity[along, 0])
+        return corner
+
+    def update_missiles(self, missiles):
+        """
+        Same as BrainProjectile.update(): pick a new target now and then, move torwards it.
+
+        :param missiles: bool array of the cruise missiles
+        :return: bool array of the missiles that moved this frame
+        """
+        continuing = missiles & (self.counter < self.frame_max)
+        np.add(self.counter, 1, out=self.counter, where=continuing)
+
+        # new targets in group order, so the rng draws are reproducible
+        rng = self.game.rng
+        area = self.game.active_area
+        hero = self.game.hero.rect
+        for slot in np.flatnonzero(missiles & ~continuing).tolist():
+            # Decide randomly whether to home in on the player or go to a random position
+            if rng.choice([True, False]):
+                target = [hero[0], hero[1]]
+            else:
+                target = [rng.randint(area.left, area.right), rng.randint(area.top, area.bottom)]
+            self.members[slot].target_pos = target
+            self.target[slot] = target
+            # Calcualate the number of frames the projectile will move
+            self.frame_max[slot] = rng.randint(0, self.game.sim_clock.ms_to_ticks(DIRECTION_MAX_FRAMES))
+            self.counter[slot] = 0
+
+        # Move towards the target position, the length is computed like pygame.math.Vector2.length()
+        direction = self.target - self.pos
+        length = np.sqrt(direction[:, 0] * direction[:, 0] + direction[:, 1] * direction[:, 1])
+        moved = missiles & (length != 0)
+        self.pos[moved] += direction[moved] / length[moved, None] * (BRAIN_SPEED * self.game.sim_clock.speed_scale)
+        self.rect_pos[moved] = np.round(self.pos[moved])
+        return moved
+
+    def collide_rect(self, rect):
+        """
+        Find the members colliding with a rect, like pygame.sprite.spritecollide().
+
+        :param rect: pygame.Rect to test
+        :return: list of sprites, in group order
+        """
+        if np is None:
+            return [sprite for sprite in self.sprites() if rect.colliderect(sprite.rect)]
+        self.sync()
+        rect_pos = self.rect_pos
+        far = rect_pos + self.size
+        hits = self.alive & (rect_pos[:, 0] < rect.right) & (far[:, 0] > rect.left) & \
+            (rect_pos[:, 1] < rect.bottom) & (far[:, 1] > rect.top)
+        if not hits.any():
+            return []
+        members = self.members
+        return [members[slot] for slot in np.flatnonzero(hits).tolist()]
+
+    def spritecollide(self, sprite, dokill=False):
+        """
+        Same as pygame.sprite.spritecollide(sprite, pool, dokill).
+
+        :return: list of sprites
+        """
+        hits = self.collide_rect(sprite.rect)
+        if dokill:
+            for hit in hits:
+                hit.kill()
+        return hits
+
+    def groupcollide(self, groupa, dokilla=False, dokillb=False):
+        """
+        Same as pygame.sprite.groupcollide(groupa, pool, dokilla, dokillb).
+
+        :return: dict of {groupa sprite: [pool sprites]}
+        """
+        crashed = {}
+        if not self.spritedict:
+            return crashed
+        for sprite in groupa.sprites():
+            hits = self.spritecollide(sprite, dokillb)
+            if hits:
+                crashed[sprite] = hits
+                if dokilla:
+                    sprite.kill()
+        return crashed
@@ -2,12 +2,24 @@ import pygame
 
 #CONSTANTS
 DEFAULT_PROJECTILE_SCALER = 2  # How fast the projectile moves
-ALIVE_TIMER = 600  # frames, how long the projectile will stay alive. After this, kill() projectile
+ALIVE_TIMER = 10000  # ms, how long the projectile will stay alive. After this, kill() projectile
+BOUNCE_DELAY = 1000  # ms before the projectile can bounce off a wall again in the same direction
+WALL_BUFFER = 2  # pixels past the edge of the active area that count as hitting the wall
 
 class TankProjectiles(pygame.sprite.Sprite):
     def __init__(self, game, p_type, pos):
         pygame.sprite.Sprite.__init__(self)
         self.game = game
+        self.reset(p_type, pos)
+
+    def reset(self, p_type, pos):
+        """
+        Fire a new shell at the hero. Recycled shells are reset with this instead of being constructed again.
+
+        :param str p_type: Name of the projectile asset
+        :param pos: [x, y] position to fire from
+        :return: None
+        """
         self.p_type = p_type
         self.pos = pos
 
@@ -18,7 +30,7 @@ class TankProjectiles(pygame.sprite.Sprite):
         self.h_wall = False  # horizontal collision detection
         self.v_wall = False  # vertical collision detection
 
-        self.alive_timer = ALIVE_TIMER
+        self.alive_timer = self.game.sim_clock.ms_to_ticks(ALIVE_TIMER)  # ticks
 
         # These delays are to prevent the projectile from getting stuck against the wall on a bounce
         self.flip_delay_h = 0
@@ -29,7 +41,7 @@ class TankProjectiles(pygame.sprite.Sprite):
         Fire the projectile at the hero entity.
 
         :param target_pos: [x, y] position for the projectile to fire at
-        :param float scaler: Scales how fast the projectile moves
+        :param float scaler: Scales how fast the projectile moves, pixels per reference tick
         :return: None
         """
         target_pos = list(target_pos)
@@ -45,6 +57,7 @@ class TankProjectiles(pygame.sprite.Sprite):
         frame_movement[1] = (target_pos[1] - e_pos[1]) / max_diff
 
         # scale the movement, can be used later to increase difficulty if desired.
+        scaler = scaler * self.game.sim_clock.speed_scale
         return [frame_movement[0] * scaler,
                 frame_movement[1] * scaler]
 
@@ -70,7 +83,7 @@ class TankProjectiles(pygame.sprite.Sprite):
         self.rect.y += self.frame_movement[1]
 
         # projectiles bounce off of walls
-        buffer = 2
+        buffer = WALL_BUFFER
         if self.rect.left + buffer < self.game.active_area.left:
             self.v_wall = True
         if self.rect.right + buffer > self.game.active_area.right:
@@ -83,11 +96,11 @@ class TankProjectiles(pygame.sprite.Sprite):
         # if the projectile hits one of the walls, flip the movement in that direction
         if self.v_wall and not self.flip_delay_v:
             self.frame_movement[0] *= -1
-            self.flip_delay_v = 60
+            self.flip_delay_v = self.game.sim_clock.ms_to_ticks(BOUNCE_DELAY)
             self.v_wall = False
             self.game.audio.play("tank_projectile_bounce")
         if self.h_wall and not self.flip_delay_h:
             self.frame_movement[1] *= -1
-            self.flip_delay_h = 60
+            self.flip_delay_h = self.game.sim_clock.ms_to_ticks(BOUNCE_DELAY)
             self.h_wall = False
             self.game.audio.play("tank_projectile_bounce")
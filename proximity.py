@@ -0,0 +1,88 @@
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, the queries scan the positions one at a time without it
+    np = None
+
+
+class ProximityIndex:
+    """
+    Nearest sprite queries against one group, for the entities that seek out a target, like the brains going after
+    the family.
+
+    The positions of the group are copied once per tick, by the first query of the tick, and every other query of the
+    tick reuses the copy. invalidate() throws the copy away early, for when a sprite leaves or joins the group during
+    the tick, like a human rescued by the hero or turned into a prog.
+
+    Distances are Manhattan distances. Like the brain always did, the last of the closest sprites in group order wins.
+    """
+
+    def __init__(self, game, group):
+        """
+        :param game: Game object
+        :param group: pygame.sprite.Group to query
+        """
+        self.game = game
+        self.group = group
+        self.built_tick = None  # sim_clock tick the copy was made on, None if there is no valid copy
+        self.sprites = []
+        self.positions = []  # pos of every sprite. In group order in a list, in reverse group order in a numpy array.
+
+    def invalidate(self):
+        """
+        Rebuild the copy of the positions at the next query.
+
+        :return: None
+        """
+        self.built_tick = None
+
+    def build(self):
+        """
+        Copy the positions of the group.
+
+        :return: None
+        """
+        self.sprites = self.group.sprites()
+        self.positions = [(sprite.pos[0], sprite.pos[1]) for sprite in self.sprites]
+        if np is not None and self.positions:
+            # reversed, so argmin() finds the last of the closest sprites
+            self.positions = np.array(self.positions[::-1], dtype=float)
+        self.built_tick = self.game.sim_clock.ticks
+
+    def nearest(self, pos):
+        """
+        Find the sprite closest to a position.
+
+        :param pos: [x, y] position to measure from
+        :return: the closest sprite, or None if the group is empty
+        """
+        if self.built_tick != self.game.sim_clock.ticks:
+            self.build()
+        if not self.sprites:
+            return None
+        if np is None:
+            distances = [abs(pos[0] - x) + abs(pos[1] - y) for x, y in self.positions]
+            return self.sprites[self.last_closest(distances)]
+
+        distances = np.abs(self.positions - (pos[0], pos[1])).sum(axis=1)
+        closest = int(distances.argmin())
+        if distances[closest] == 0:
+            # a distance of 0 never counted as the closest, see last_closest()
+            return self.sprites[self.last_closest(distances[::-1].tolist())]
+        return self.sprites[len(self.sprites) - 1 - closest]
+
+    @staticmethod
+    def last_closest(distances):
+        """
+        The scan the brains did before there was an index. A distance of 0 meant none was found yet, so the sprite after
+        one at a distance of 0 always replaced it.
+
+        :param distances: list of distances, in group order
+        :return: index of the closest sprite
+        """
+        smallest_distance = 0
+        index = 0
+        for i, distance in enumerate(distances):
+            if smallest_distance == 0 or distance <= smallest_distance:
+                smallest_distance = distance
+                index = i
+        return index
@@ -0,0 +1,124 @@
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# CONSTANTS
+RECORDING_VERSION = 1  # bump if the file format changes
+RESET_BIT = 1 << 8  # set on the tick where the game was restarted with 'R'
+
+
+def pack_inputs(movement, shooting, reset=False):
+    """
+    Pack the hero inputs of a single tick into an int.
+    Bits 0-3 are the movement [left, right, up, down], bits 4-7 the shooting and bit 8 the game reset.
+
+    :param movement: [left, right, up, down] booleans
+    :param shooting: [left, right, up, down] booleans
+    :param bool reset: True if the game was reset on this tick
+    :return: int
+    """
+    value = 0
+    for i, pressed in enumerate(list(movement) + list(shooting)):
+        if pressed:
+            value |= 1 << i
+    if reset:
+        value |= RESET_BIT
+    return value
+
+
+def unpack_inputs(value):
+    """
+    Reverse of pack_inputs().
+
+    :param int value: Packed inputs
+    :return: (movement, shooting, reset)
+    """
+    movement = [bool(value & (1 << i)) for i in range(4)]
+    shooting = [bool(value & (1 << i)) for i in range(4, 8)]
+    return movement, shooting, bool(value & RESET_BIT)
+
+
+class InputRecorder:
+    """
+    Records the hero inputs of every tick, together with the seed, tick rate and stress multiplier of the game.
+    Because all of the gameplay randomness comes from the seeded game.rng, replaying the
+    inputs into a new game with the same seed reproduces the session exactly.
+    """
+
+    def __init__(self, seed, tick_rate, stress=1.0):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.stress = stress
+        self.runs = []  # run-length encoded inputs, [packed inputs, number of ticks]
+
+    def record(self, movement, shooting, reset=False):
+        """
+        Record the inputs used by a single tick.
+
+        :param movement: [left, right, up, down] booleans
+        :param shooting: [left, right, up, down] booleans
+        :param bool reset: True if the game was reset on this tick
+        :return: None
+        """
+        value = pack_inputs(movement, shooting, reset)
+        if self.runs and self.runs[-1][0] == value:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([value, 1])
+
+    def save(self, path):
+        """
+        Write the recording to a json file.
+
+        :param path: File path of the recording
+        :return: None
+        """
+        with open(path, "w") as f:
+            json.dump({"version": RECORDING_VERSION,
+                       "seed": self.seed,
+                       "tick_rate": self.tick_rate,
+                       "stress": self.stress,
+                       "inputs": self.runs}, f)
+        logger.info(f"Saved {len(self)} recorded ticks to {path}")
+
+    def __len__(self):
+        return sum(count for _, count in self.runs)
+
+
+class InputReplay:
+    """
+    Plays back a recording made by InputRecorder. Iterating yields (movement, shooting, reset) for every tick.
+    """
+
+    def __init__(self, path):
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("version") != RECORDING_VERSION:
+            raise ValueError(f"Unsupported recording version {data.get('version')} in {path}")
+        self.seed = data["seed"]
+        self.tick_rate = data["tick_rate"]
+        self.stress = data.get("stress", 1.0)  # recordings made before the stress multiplier have none
+        self.runs = data["inputs"]
+
+    def __iter__(self):
+        for value, count in self.runs:
+            inputs = unpack_inputs(value)
+            for _ in range(count):
+                yield inputs
+
+    def __len__(self):
+        return sum(count for _, count in self.runs)
+
+    def play(self, game):
+        """
+        Step the given game through every recorded tick. The game must have been created with
+        the seed, tick_rate and stress of the recording.
+
+        :param game: Game object
+        :return: None
+        """
+        for movement, shooting, reset in self:
+            if reset:
+                game.game_reset = True
+            game.step((movement, shooting))
@@ -1,6 +1,8 @@
 import logging
 from pygame import font
 
+from bitmap_font import BitmapFont
+
 logger = logging.getLogger(__name__)
 
 GRUNT_SCORE = 100
@@ -37,7 +39,9 @@ class Scoring:
         self.life_add_mult = 1  # used to multiply vs. the 25000 additional life counter
 
         self.font = font.SysFont('Consolas', 10)  # Load the Consolas font
+        self.text = BitmapFont(self.font, (255, 255, 255))
         self.score_disp = {}
+        self.popup_count = 0  # key of the next score_disp entry, the surfaces are cached so they can't be the key
 
         self.enemy_score_dict = {
             "grunt": GRUNT_SCORE,
@@ -76,9 +80,11 @@ class Scoring:
             self.score_to_add = 1000 * self.score_mult
             self.game.score_count += self.score_to_add
 
-            # Add score to the score_disp dictionary. [surf, position, time to display]
-            surf = self.font.render(str(self.score_to_add), True, (255, 255, 255))
-            self.score_disp[surf] = [surf, list(pos), 120]
+            if not self.game.headless:
+                # Add score to the score_disp dictionary. [surf, position, time to display]
+                surf = self.text.render(str(self.score_to_add))
+                self.score_disp[self.popup_count] = [surf, list(pos), 120]
+                self.popup_count += 1
 
             if not self.score_mult == 5:  # limit the score multiplier to 5
                 self.score_mult += 1
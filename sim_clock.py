@@ -0,0 +1,48 @@
+# CONSTANTS
+REFERENCE_TICK_RATE = 60  # ticks per second the speeds are tuned for, in pixels per tick at this rate
+
+
+class SimClock:
+    """
+    The simulation clock, owned by the Game and advanced once per logic tick.
+
+    Every animation and timer reads its time from here instead of the wall clock, so a headless game stepped
+    as fast as possible, or a slow machine rendering at a lower frame rate, sees exactly the same game time.
+
+    The timers are given in milliseconds and turned into ticks with ms_to_ticks(), the speeds are given in pixels per
+    tick at REFERENCE_TICK_RATE and multiplied by speed_scale, so the game plays at the same speed at any tick rate.
+    """
+
+    def __init__(self, tick_rate):
+        """
+        :param int tick_rate: Logic ticks per second
+        """
+        self.tick_rate = tick_rate
+        self.tick_ms = 1000 / self.tick_rate  # milliseconds of game time per tick
+        self.speed_scale = REFERENCE_TICK_RATE / self.tick_rate  # pixels per tick for every pixel per reference tick
+        self.ticks = 0  # number of ticks simulated so far
+
+    def advance(self):
+        """
+        Move the clock forward by one tick.
+
+        :return: None
+        """
+        self.ticks += 1
+
+    def get_ticks(self):
+        """
+        Milliseconds of game time since the clock started. A drop-in replacement for pygame.time.get_ticks().
+
+        :return: int
+        """
+        return int(self.ticks * self.tick_ms)
+
+    def ms_to_ticks(self, ms):
+        """
+        Convert a duration in milliseconds to the number of ticks it spans.
+
+        :param ms: Duration in milliseconds
+        :return: int
+        """
+        return round(ms / self.tick_ms)
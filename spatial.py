@@ -0,0 +1,131 @@
+import pygame
+
+# CONSTANTS
+CELL_SIZE = 32  # pixels, a little larger than the biggest sprite
+QUERY_MARGIN = 2  # pixels, covers sprites nudged after the index was built (hulk push-back)
+
+# Rough per-operation costs in microseconds, measured with CPython 3.11. They only decide whether
+# building the grid is cheaper than testing every pair, so they need to be in the right ballpark, not exact.
+PAIR_TEST_COST = 0.07  # one rect test inside pygame.sprite.spritecollide
+INSERT_COST = 0.4  # adding one sprite to the grid
+QUERY_COST = 2.0  # looking up the cells around one rect
+
+
+class SpatialHash:
+    """
+    Uniform grid broadphase over a single sprite group.
+
+    The grid is rebuilt by update() once per frame, and only when the number of queries expected that frame makes
+    it cheaper than testing every pair. Otherwise the collide methods fall back to pygame's brute force functions.
+    Either way the results are the same as pygame.sprite.spritecollide()/groupcollide(): hits are returned in group
+    order and sprites killed earlier in the frame are not returned.
+    """
+
+    def __init__(self, area, cell_size=CELL_SIZE):
+        """
+        :param area: pygame.Rect the indexed sprites live in, usually game.active_area
+        :param int cell_size: Width and height of a grid cell in pixels
+        """
+        self.area = area
+        self.cell_size = cell_size
+        self.group = None
+        self.cells = {}  # (cell x, cell y): [(group order, sprite)]
+        self.max_size = (0, 0)  # largest sprite in the grid, sprites are filed under their top-left cell only
+        self.active = False  # True if the grid was built this frame
+
+    def update(self, group, queries):
+        """
+        Rebuild the grid for this frame if it is worth it.
+
+        :param group: pygame.sprite.Group to index
+        :param int queries: number of sprites that will be tested against the group this frame
+        :return: bool, True if the grid was built
+        """
+        self.group = group
+        # len(group) copies the sprite list, the spritedict has the same length without the copy
+        size = len(group.spritedict)
+        brute_force_cost = queries * size * PAIR_TEST_COST
+        grid_cost = size * INSERT_COST + queries * QUERY_COST
+        self.active = grid_cost < brute_force_cost
+        if self.active:
+            self.build()
+        return self.active
+
+    def build(self):
+        """
+        File every sprite of the group under the cell of its top-left corner.
+
+        :return: None
+        """
+        self.cells = {}
+        cell_size = self.cell_size
+        max_w = max_h = 0
+        for order, sprite in enumerate(self.group):
+            rect = sprite.rect
+            key = (rect.x // cell_size, rect.y // cell_size)
+            cell = self.cells.get(key)
+            if cell is None:
+                self.cells[key] = [(order, sprite)]
+            else:
+                cell.append((order, sprite))
+            max_w = max(max_w, rect.w)
+            max_h = max(max_h, rect.h)
+        self.max_size = (max_w, max_h)
+
+    def query(self, rect):
+        """
+        Find the indexed sprites colliding with the rect.
+
+        :param rect: pygame.Rect to test
+        :return: list of sprites, in group order
+        """
+        cell_size = self.cell_size
+        # a sprite filed under a cell up and to the left of the rect can still reach into it
+        left = (rect.left - self.max_size[0] - QUERY_MARGIN) // cell_size
+        right = (rect.right + QUERY_MARGIN) // cell_size
+        top = (rect.top - self.max_size[1] - QUERY_MARGIN) // cell_size
+        bottom = (rect.bottom + QUERY_MARGIN) // cell_size
+
+        members = self.group.spritedict
+        hits = []
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is None:
+                    continue
+                for order, sprite in cell:
+                    if rect.colliderect(sprite.rect) and sprite in members:
+                        hits.append((order, sprite))
+        hits.sort(key=lambda hit: hit[0])
+        return [sprite for _, sprite in hits]
+
+    def spritecollide(self, sprite, dokill=False):
+        """
+        Same as pygame.sprite.spritecollide(sprite, group, dokill) against the indexed group.
+
+        :return: list of sprites
+        """
+        if not self.active:
+            return pygame.sprite.spritecollide(sprite, self.group, dokill)
+        hits = self.query(sprite.rect)
+        if dokill:
+            for hit in hits:
+                hit.kill()
+        return hits
+
+    def groupcollide(self, groupa, dokilla=False, dokillb=False):
+        """
+        Same as pygame.sprite.groupcollide(groupa, group, dokilla, dokillb) against the indexed group.
+
+        :return: dict of {groupa sprite: [indexed sprites]}
+        """
+        if not self.active:
+            return pygame.sprite.groupcollide(groupa, self.group, dokilla, dokillb)
+        crashed = {}
+        for sprite in groupa.sprites():
+            hits = self.spritecollide(sprite, dokillb)
+            if hits:
+                crashed[sprite] = hits
+                if dokilla:
+                    sprite.kill()
+        return crashed
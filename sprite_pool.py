@@ -0,0 +1,75 @@
+import pygame
+
+
+def get_pool(game, sprite_class):
+    """
+    The pool of a sprite class, created the first time it is asked for.
+
+    :param game: Game object
+    :param sprite_class: Class of the sprites
+    :return: SpritePool
+    """
+    pool = game.sprite_pools.get(sprite_class)
+    if pool is None:
+        pool = game.sprite_pools[sprite_class] = SpritePool(game, sprite_class)
+    return pool
+
+
+class SpritePool(pygame.sprite.Group):
+    """
+    Recycles the sprites of one class, so the waves and the sustained fire don't construct a new object for every
+    entity and projectile.
+
+    Every sprite handed out by acquire() is a member of the pool while it is alive. Once it is killed it waits on the
+    free list, and the next acquire() calls its reset() instead of constructing a new sprite. reset() takes the same
+    arguments as the constructor, minus the game, and runs the same code, so a recycled sprite behaves exactly like a
+    new one, down to its draws from game.rng.
+
+    The animations that outlive a sprite, like the explosions, copy its image and position when they start, so it can
+    be recycled as soon as it is killed.
+    """
+
+    def __init__(self, game, sprite_class):
+        """
+        :param game: Game object
+        :param sprite_class: Class of the sprites, constructed with (game, *args) and reset with reset(*args)
+        """
+        super().__init__()
+        self.game = game
+        self.sprite_class = sprite_class
+        self.free = []  # killed sprites, waiting for a new life
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.free.append(sprite)
+
+    def acquire(self, *args):
+        """
+        A sprite of the class, recycled if one is free.
+
+        :param args: Arguments of the constructor, after the game
+        :return: The sprite, in no group but the pool
+        """
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args)
+            # a new life, the first frame isn't interpolated from where the last one ended
+            self.game.prev_positions.pop(sprite, None)
+        else:
+            sprite = self.sprite_class(self.game, *args)
+        self.add_internal(sprite)
+        sprite.add_internal(self)
+        return sprite
+
+    def spawn(self, args, *groups):
+        """
+        Acquire a batch of sprites and add all of them to each group at once.
+
+        :param args: List of the arguments of every sprite, see acquire()
+        :param groups: Groups to add the sprites to
+        :return: list of the sprites
+        """
+        sprites = [self.acquire(*sprite_args) for sprite_args in args]
+        for group in groups:
+            group.add(sprites)
+        return sprites
@@ -1,8 +1,9 @@
 import os
-import pygame
 import logging
 from pathlib import Path
 
+from asset_cache import ASSETS
+
 logger = logging.getLogger(__name__)
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -17,7 +18,7 @@ def load_image(relative_path):
     :return: Pygame image
     """
     img_path = ASSET_DIR / relative_path
-    img = pygame.image.load(img_path).convert()
+    img = ASSETS.image(img_path).convert()
     img.set_colorkey((0, 0, 0))
     return img
 